@@ -0,0 +1,430 @@
+"""
+Benchmark Suite: per-phase and end-to-end timings with JSON baselines
+
+Micro benchmarks time one reasoning phase on inputs prepared ahead of time,
+so each measures only that phase:
+
+    scan                    engine.scan(query)
+    extract_assumptions     engine.extract_assumptions(query)
+    mirror_against_axioms   engine.mirror_against_axioms(system_data, domain)
+    apply_gates             engine.apply_gates(system_data)
+    deduce_consequences     engine.deduce_consequences(frictions, domain, system_data)
+    render_verdict          engine.render_verdict(analysis)
+    cot_scaffold            pipeline._generate_cot_scaffold(verdict_data)
+
+Macro benchmarks time whole calls:
+
+    reason                  engine.reason(query, system_data)
+    pipeline.evaluate       CriterionPipeline.evaluate(...)   (lazy result view)
+    pipeline.evaluate_json  evaluate(...) + json.dumps        (every part built)
+
+Every benchmark runs over the same synthetic corpus (benchmarks/synthetic.py).
+A round calls it once per case (repeated until the round lasts at least
+min_round_seconds); the reported figures are per-call seconds over the
+rounds: min, median, mean, p90 and stdev. Rounds run with the garbage
+collector off, as timeit does. The engine and pipeline are built without
+cache or verdict table, so every call does the full work.
+
+A run is saved as a JSON baseline (timings, corpus coverage, settings,
+Python/platform and git commit). compare() matches two baselines by name
+and flags a benchmark whose median got slower by more than the threshold.
+
+Usage:
+    python -m benchmarks.suite run --out benchmarks/baselines/main.json
+    python -m benchmarks.suite run --only 'scan|reason' --rounds 30
+    python -m benchmarks.suite run --out new.json --compare benchmarks/baselines/main.json
+    python -m benchmarks.suite compare benchmarks/baselines/main.json new.json --threshold 0.05
+
+    from benchmarks.suite import BenchmarkSuite, compare
+    baseline = BenchmarkSuite(cases=96).run()
+    regressions = [row for row in compare(old, baseline) if row.status == "regression"]
+
+compare exits with status 1 when any benchmark regressed.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.synthetic import SyntheticCorpus
+from evaluation.pipeline import CriterionPipeline
+from evaluation.reasoning_engine import CriterionReasoningEngine
+from evaluation.results import json_default
+
+
+BASELINE_FORMAT = 1
+
+DEFAULT_BASELINE_DIR = str(Path(__file__).parent / "baselines")
+
+STATISTICS = ("min", "median", "mean", "p90", "stdev")
+
+
+class Benchmark:
+    """A named callable plus the per-case argument tuples it is timed on"""
+
+    __slots__ = ("name", "kind", "func", "inputs")
+
+    def __init__(self, name: str, kind: str, func: Callable, inputs: List[Tuple]):
+        self.name = name
+        self.kind = kind
+        self.func = func
+        self.inputs = inputs
+
+    def call_all(self):
+        func = self.func
+        for args in self.inputs:
+            func(*args)
+
+
+class Comparison:
+    """One benchmark of compare(): baseline vs. current per-call seconds"""
+
+    __slots__ = ("name", "baseline", "current", "change", "status")
+
+    def __init__(self, name: str, baseline: Optional[float], current: Optional[float],
+                 threshold: float):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+        if baseline is None or current is None:
+            self.change = None
+            self.status = "new" if baseline is None else "missing"
+        else:
+            self.change = current / baseline - 1 if baseline > 0 else 0.0
+            if self.change > threshold:
+                self.status = "regression"
+            elif self.change < -threshold:
+                self.status = "improvement"
+            else:
+                self.status = "ok"
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "baseline": self.baseline,
+            "current": self.current,
+            "change": self.change,
+            "status": self.status
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Benchmarks
+# ═══════════════════════════════════════════════════════════════════
+
+def build_benchmarks(engine: CriterionReasoningEngine, pipeline: CriterionPipeline,
+                     cases: Sequence[Any]) -> List[Benchmark]:
+    """
+    The suite's benchmarks with their inputs prepared from the cases.
+
+    Each phase's inputs are the real outputs of the phases before it, so
+    every benchmark sees what it sees inside reason().
+    """
+    scans, assumptions, mirrors, gates, consequences, verdicts = [], [], [], [], [], []
+    for case in cases:
+        scan = engine.scan(case.query)
+        domain = scan["primary_system"]
+        mirror = engine.mirror_against_axioms(case.system_data, domain)
+        consequence = engine.deduce_consequences(mirror["frictions"], domain, case.system_data)
+        analysis = {
+            "query": case.query,
+            "scan": scan,
+            "assumptions": engine.extract_assumptions(case.query),
+            "axiom_mirror": mirror,
+            "gates": engine.apply_gates(case.system_data),
+            "consequences": consequence
+        }
+        scans.append((case.query,))
+        assumptions.append((case.query,))
+        mirrors.append((case.system_data, domain))
+        gates.append((case.system_data,))
+        consequences.append((mirror["frictions"], domain, case.system_data))
+        verdicts.append((analysis,))
+    scaffolds = [(engine.render_verdict(analysis),) for (analysis,) in verdicts]
+    calls = [(case.query, case.system_data) for case in cases]
+
+    def evaluate_json(query, system_data):
+        return json.dumps(pipeline.evaluate(query, system_data), default=json_default)
+
+    return [
+        Benchmark("scan", "micro", engine.scan, scans),
+        Benchmark("extract_assumptions", "micro", engine.extract_assumptions, assumptions),
+        Benchmark("mirror_against_axioms", "micro", engine.mirror_against_axioms, mirrors),
+        Benchmark("apply_gates", "micro", engine.apply_gates, gates),
+        Benchmark("deduce_consequences", "micro", engine.deduce_consequences, consequences),
+        Benchmark("render_verdict", "micro", engine.render_verdict, verdicts),
+        Benchmark("cot_scaffold", "micro", pipeline._generate_cot_scaffold, scaffolds),
+        Benchmark("reason", "macro", engine.reason, calls),
+        Benchmark("pipeline.evaluate", "macro", pipeline.evaluate, calls),
+        Benchmark("pipeline.evaluate_json", "macro", evaluate_json, calls),
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Timing
+# ═══════════════════════════════════════════════════════════════════
+
+def time_benchmark(benchmark: Benchmark, rounds: int = 15,
+                   min_round_seconds: float = 0.05) -> Dict:
+    """
+    Per-call timings of one benchmark.
+
+    Args:
+        benchmark: Benchmark to time
+        rounds: Timed rounds (after one warm-up round)
+        min_round_seconds: A round repeats the case list until it lasts this long
+
+    Returns:
+        {"kind", "calls_per_round", "rounds", "min", "median", "mean", "p90", "stdev"}
+        (times in seconds per call)
+    """
+    n = len(benchmark.inputs)
+    if not n:
+        raise ValueError(f"Benchmark {benchmark.name} has no inputs")
+    call_all = benchmark.call_all
+    perf_counter = time.perf_counter
+
+    # Warm-up, then size the round to min_round_seconds
+    started = perf_counter()
+    call_all()
+    once = max(perf_counter() - started, 1e-9)
+    repeats = max(1, int(min_round_seconds / once + 0.999))
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = perf_counter()
+            for _ in range(repeats):
+                call_all()
+            samples.append((perf_counter() - started) / (repeats * n))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    samples.sort()
+    return {
+        "kind": benchmark.kind,
+        "calls_per_round": repeats * n,
+        "rounds": rounds,
+        "min": samples[0],
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "p90": samples[min(len(samples) - 1, int(0.9 * len(samples)))],
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0
+    }
+
+
+class BenchmarkSuite:
+    """
+    Runs the benchmarks over a synthetic corpus and builds a baseline.
+    """
+
+    def __init__(self, cases: int = 96, seed: int = 1234, rounds: int = 15,
+                 min_round_seconds: float = 0.05, axioms_path: Optional[str] = None):
+        """
+        Args:
+            cases: Synthetic cases per benchmark
+            seed: Corpus seed
+            rounds: Timed rounds per benchmark
+            min_round_seconds: Minimum length of one round
+            axioms_path: Axioms JSON (default: the repository's core_axioms.json)
+        """
+        self.engine = CriterionReasoningEngine(axioms_path)
+        self.pipeline = CriterionPipeline(reasoning_engine=self.engine)
+        self.corpus = SyntheticCorpus(seed, self.engine).generate(cases)
+        self.rounds = rounds
+        self.min_round_seconds = min_round_seconds
+        self.benchmarks = build_benchmarks(self.engine, self.pipeline, self.corpus.cases)
+
+    def run(self, only: Optional[str] = None, verbose: bool = False) -> Dict:
+        """
+        Time every benchmark (or those whose name matches the regex only).
+
+        Returns:
+            Baseline dict (see save_baseline)
+        """
+        pattern = re.compile(only) if only else None
+        results = {}
+        for benchmark in self.benchmarks:
+            if pattern is not None and not pattern.search(benchmark.name):
+                continue
+            results[benchmark.name] = time_benchmark(benchmark, self.rounds,
+                                                     self.min_round_seconds)
+            if verbose:
+                timing = results[benchmark.name]
+                print(f"  {benchmark.name:<24} {timing['median'] * 1e6:10.2f} µs/call "
+                      f"(min {timing['min'] * 1e6:.2f}, p90 {timing['p90'] * 1e6:.2f})")
+        return {
+            "format": BASELINE_FORMAT,
+            "created_at": time.time(),
+            "environment": environment(),
+            "corpus": self.corpus.describe(),
+            "settings": {"rounds": self.rounds, "min_round_seconds": self.min_round_seconds},
+            "axioms_fingerprint": self.engine.axioms_fingerprint,
+            "benchmarks": results
+        }
+
+
+def environment() -> Dict:
+    """Interpreter, platform and git commit of the measuring tree"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Baselines
+# ═══════════════════════════════════════════════════════════════════
+
+def save_baseline(baseline: Dict, path: str):
+    """Write a baseline as indented JSON (creating the directory)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Dict:
+    """
+    Raises:
+        ValueError: Not a baseline of a supported format
+    """
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if not isinstance(baseline, dict) or baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"{path} is not a format {BASELINE_FORMAT} benchmark baseline")
+    return baseline
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.10,
+            statistic: str = "median") -> List[Comparison]:
+    """
+    Match two baselines by benchmark name.
+
+    Args:
+        baseline: Reference run
+        current: New run
+        threshold: Relative slowdown counted as a regression (0.10 = 10 %);
+                   a speed-up by more than it is an improvement
+        statistic: One of STATISTICS
+
+    Returns:
+        Comparison per benchmark in either run (status "regression",
+        "improvement", "ok", "new" or "missing")
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f"Unknown statistic {statistic!r} (use one of {STATISTICS})")
+    old, new = baseline["benchmarks"], current["benchmarks"]
+    names = list(old) + [name for name in new if name not in old]
+    return [
+        Comparison(name,
+                   old[name][statistic] if name in old else None,
+                   new[name][statistic] if name in new else None,
+                   threshold)
+        for name in names
+    ]
+
+
+def format_comparison(rows: Sequence[Comparison], threshold: float) -> str:
+    """Comparison table, one benchmark per line"""
+    marks = {"regression": "SLOWER", "improvement": "faster", "ok": "", "new": "new",
+             "missing": "missing"}
+    lines = [f"{'benchmark':<24} {'baseline µs':>12} {'current µs':>12} {'change':>8}"]
+    for row in rows:
+        baseline = f"{row.baseline * 1e6:12.2f}" if row.baseline is not None else f"{'-':>12}"
+        current = f"{row.current * 1e6:12.2f}" if row.current is not None else f"{'-':>12}"
+        change = f"{row.change:+8.1%}" if row.change is not None else f"{'':>8}"
+        lines.append(f"{row.name:<24} {baseline} {current} {change}  {marks[row.status]}")
+    regressions = sum(row.status == "regression" for row in rows)
+    lines.append(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return "\n".join(lines)
+
+
+def _warn_if_incomparable(baseline: Dict, current: Dict):
+    for section, keys in (("environment", ("python", "machine", "cpu_count")),
+                          ("corpus", ("seed", "cases"))):
+        for key in keys:
+            if baseline.get(section, {}).get(key) != current.get(section, {}).get(key):
+                print(f"warning: {section}.{key} differs "
+                      f"({baseline.get(section, {}).get(key)} vs {current.get(section, {}).get(key)})")
+    if baseline.get("axioms_fingerprint") != current.get("axioms_fingerprint"):
+        print("warning: measured with different axioms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Time the reasoning phases and the pipeline, save or compare baselines"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks")
+    run.add_argument("--out", default=None,
+                     help=f"Baseline file to write (e.g. {DEFAULT_BASELINE_DIR}/main.json)")
+    run.add_argument("--cases", type=int, default=96, help="Synthetic cases per benchmark")
+    run.add_argument("--seed", type=int, default=1234, help="Corpus seed")
+    run.add_argument("--rounds", type=int, default=15, help="Timed rounds per benchmark")
+    run.add_argument("--min-round-seconds", type=float, default=0.05,
+                     help="Minimum length of one round")
+    run.add_argument("--only", default=None, help="Regex selecting benchmarks by name")
+    run.add_argument("--axioms", default=None, help="Path to an axioms JSON file")
+    run.add_argument("--compare", default=None, metavar="BASELINE",
+                     help="Compare the run against this baseline")
+    run.add_argument("--threshold", type=float, default=0.10,
+                     help="Relative slowdown flagged as a regression (default 0.10)")
+
+    diff = commands.add_parser("compare", help="Compare two baseline files")
+    diff.add_argument("baseline", help="Reference baseline")
+    diff.add_argument("current", help="New baseline")
+    diff.add_argument("--threshold", type=float, default=0.10,
+                      help="Relative slowdown flagged as a regression (default 0.10)")
+    diff.add_argument("--statistic", choices=STATISTICS, default="median")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        suite = BenchmarkSuite(args.cases, args.seed, args.rounds, args.min_round_seconds,
+                               args.axioms)
+        print(f"Benchmarking {len(suite.corpus)} synthetic cases, {args.rounds} rounds")
+        current = suite.run(args.only, verbose=True)
+        if args.out:
+            save_baseline(current, args.out)
+            print(f"Saved baseline -> {args.out}")
+        if not args.compare:
+            return 0
+        baseline, statistic = load_baseline(args.compare), "median"
+    else:
+        baseline, current = load_baseline(args.baseline), load_baseline(args.current)
+        statistic = args.statistic
+
+    _warn_if_incomparable(baseline, current)
+    rows = compare(baseline, current, args.threshold, statistic)
+    print(format_comparison(rows, args.threshold))
+    return 1 if any(row.status == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
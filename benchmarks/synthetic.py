@@ -0,0 +1,171 @@
+"""
+Synthetic workload: reproducible queries and system_data profiles
+
+Benchmarks need inputs that exercise every branch the real workload does,
+and the same inputs on every run. SyntheticCorpus builds them from a seed
+and the engine's own keyword tables:
+
+- queries for every SystemDomain (GENERAL: no domain keyword at all), mixed
+  with assumption triggers, beneficiary and harm phrases, in three lengths
+  (short ~8 words, medium ~40, long ~200)
+- system_data profiles over every flag the MIRROR rules and the gates read,
+  in four mixes: none set, all set, each flag set with probability 1/2, and
+  the gate flags only
+
+Cases are spread round-robin over domain × length × mix, so any corpus of
+at least 72 cases covers every combination. The same seed and engine
+keyword tables always give the same corpus.
+
+Usage:
+    from benchmarks.synthetic import SyntheticCorpus
+
+    corpus = SyntheticCorpus(seed=1234).generate(96)
+    for case in corpus:
+        engine.reason(case.query, case.system_data)
+    corpus.describe()     # {"domains": {...}, "lengths": {...}, "mixes": {...}}
+"""
+
+import random
+from collections import Counter
+from typing import Dict, Iterator, List, Optional
+
+from evaluation.gates import GATE_FLAGS
+from evaluation.reasoning_engine import CriterionReasoningEngine, SystemDomain
+
+
+# Target word counts per text length
+LENGTHS: Dict[str, int] = {"short": 8, "medium": 40, "long": 200}
+
+FLAG_MIXES = ("none", "all", "random", "gates_only")
+
+# Words that match no keyword table
+FILLER = (
+    "the", "a", "plan", "proposal", "would", "introduce", "new", "rules", "for",
+    "how", "people", "in", "region", "over", "next", "decade", "through", "local",
+    "councils", "and", "regional", "boards", "with", "annual", "reviews", "of",
+    "its", "outcomes", "under", "existing", "law", "while", "keeping", "current",
+    "practice", "where", "possible"
+)
+
+
+class SyntheticCase:
+    """One generated input (domain, length and mix record how it was drawn)"""
+
+    __slots__ = ("index", "query", "system_data", "domain", "length", "mix")
+
+    def __init__(self, index: int, query: str, system_data: Dict, domain: str,
+                 length: str, mix: str):
+        self.index = index
+        self.query = query
+        self.system_data = system_data
+        self.domain = domain
+        self.length = length
+        self.mix = mix
+
+    def to_dict(self) -> Dict:
+        return {
+            "index": self.index,
+            "query": self.query,
+            "system_data": self.system_data,
+            "domain": self.domain,
+            "length": self.length,
+            "mix": self.mix
+        }
+
+
+class Corpus:
+    """Generated cases plus their coverage"""
+
+    def __init__(self, cases: List[SyntheticCase], seed: int):
+        self.cases = cases
+        self.seed = seed
+
+    def __iter__(self) -> Iterator[SyntheticCase]:
+        return iter(self.cases)
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    def describe(self) -> Dict:
+        """Case counts per domain, length and flag mix"""
+        return {
+            "seed": self.seed,
+            "cases": len(self.cases),
+            "domains": dict(sorted(Counter(case.domain for case in self.cases).items())),
+            "lengths": dict(Counter(case.length for case in self.cases)),
+            "mixes": dict(Counter(case.mix for case in self.cases))
+        }
+
+
+class SyntheticCorpus:
+    """
+    Seeded generator of queries and system_data profiles.
+    """
+
+    def __init__(self, seed: int = 1234,
+                 engine: Optional[CriterionReasoningEngine] = None):
+        """
+        Args:
+            seed: Random seed (same seed, same corpus)
+            engine: Engine whose keyword tables and rule flags are used
+                    (default: a new engine with the default axioms)
+        """
+        if engine is None:
+            engine = CriterionReasoningEngine()
+        self.seed = seed
+        self.domain_keywords = {domain.value: list(words)
+                                for domain, words in engine.domain_keywords.items()}
+        self.triggers = list(engine.assumption_triggers)
+        self.beneficiaries = list(engine.beneficiary_keywords)
+        self.harm = list(engine.harm_keywords)
+        self.flags = tuple(dict.fromkeys(tuple(engine.mirror.flags) + GATE_FLAGS))
+        # Keywords of any table must not leak into the filler
+        every_keyword = {word for words in self.domain_keywords.values() for word in words}
+        every_keyword.update(self.triggers, self.beneficiaries, self.harm)
+        self.filler = [word for word in FILLER if word not in every_keyword]
+
+    def generate(self, count: int = 96) -> Corpus:
+        """
+        Build count cases, round-robin over domain × length × flag mix.
+        """
+        rng = random.Random(self.seed)
+        domains = [domain.value for domain in SystemDomain]
+        lengths = list(LENGTHS)
+        cases = []
+        for index in range(count):
+            domain = domains[index % len(domains)]
+            length = lengths[(index // len(domains)) % len(lengths)]
+            mix = FLAG_MIXES[(index // (len(domains) * len(lengths))) % len(FLAG_MIXES)]
+            cases.append(SyntheticCase(
+                index, self.query(rng, domain, LENGTHS[length]),
+                self.profile(rng, mix), domain, length, mix
+            ))
+        return Corpus(cases, self.seed)
+
+    def query(self, rng: random.Random, domain: str, words: int) -> str:
+        """A query of about words words built on domain's keywords"""
+        parts: List[str] = []
+        keywords = self.domain_keywords.get(domain, ())
+        # Keyword density: about one domain keyword per six words
+        for _ in range(max(1, words // 6) if keywords else 0):
+            parts.append(rng.choice(keywords))
+        if rng.random() < 0.7:
+            parts.append(rng.choice(self.triggers))
+        if rng.random() < 0.5:
+            parts.append(rng.choice(self.beneficiaries))
+        if rng.random() < 0.3:
+            parts.append(rng.choice(self.harm))
+        while sum(len(part.split()) for part in parts) < words:
+            parts.append(rng.choice(self.filler))
+        rng.shuffle(parts)
+        return " ".join(parts).capitalize()
+
+    def profile(self, rng: random.Random, mix: str) -> Dict:
+        """A system_data profile with the given flag mix"""
+        if mix == "none":
+            return {flag: False for flag in self.flags}
+        if mix == "all":
+            return {flag: True for flag in self.flags}
+        if mix == "gates_only":
+            return {flag: flag in GATE_FLAGS for flag in self.flags}
+        return {flag: rng.random() < 0.5 for flag in self.flags}
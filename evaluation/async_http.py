@@ -0,0 +1,274 @@
+"""
+Async HTTP: minimal non-blocking HTTP/1.1 client on asyncio streams
+
+The Ollama bridge only needs JSON GET/POST against a local server, so this
+avoids an aiohttp/httpx dependency: one connection per request
+(Connection: close), Content-Length and chunked response bodies, plain or TLS.
+
+Every request runs under a deadline (connect + send + full response); on
+expiry asyncio.TimeoutError is raised and the connection is closed.
+
+stream() returns the response as soon as its headers arrive and yields the
+body as it comes in (e.g. Ollama's NDJSON token stream); leaving it early
+closes the connection.
+
+Usage:
+    response = await request("POST", "http://localhost:11434/api/generate",
+                             payload={"model": "deepseek-r1:8b", "prompt": "..."},
+                             timeout=300)
+    response.status, response.json()
+
+    async with stream("POST", url, payload={..., "stream": True}) as response:
+        async for line in response.lines():
+            token = json.loads(line)["response"]
+"""
+
+import asyncio
+import contextlib
+import json
+import ssl
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class AsyncResponse:
+    """Status, headers (lower-cased names) and body of one response"""
+
+    __slots__ = ("status", "reason", "headers", "body")
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+def _target(url: str) -> Tuple[str, int, bool, str]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme: {url}")
+    secure = parts.scheme == "https"
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return parts.hostname, port, secure, path
+
+
+async def _iter_body(reader: asyncio.StreamReader, headers: Dict[str, str],
+                     piece: int = 1 << 16) -> AsyncIterator[bytes]:
+    """Body bytes as they arrive (chunked, Content-Length or until EOF)"""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailers end with an empty line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            yield await reader.readexactly(size)
+            await reader.readline()
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining:
+            data = await reader.readexactly(min(piece, remaining))
+            remaining -= len(data)
+            yield data
+    else:
+        while True:
+            data = await reader.read(piece)
+            if not data:
+                return
+            yield data
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+    return b"".join([data async for data in _iter_body(reader, headers)])
+
+
+async def _open(method: str, url: str, body: Optional[bytes], headers: Dict[str, str]
+                ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, int, str, Dict[str, str]]:
+    """Connect, send the request and read the status line and headers"""
+    host, port, secure, path = _target(url)
+    reader, writer = await asyncio.open_connection(
+        host, port, ssl=ssl.create_default_context() if secure else None
+    )
+    try:
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host}:{port}",
+                 "Connection: close", "Accept: application/json"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body is not None:
+            writer.write(body)
+        await writer.drain()
+
+        status_line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ConnectionError(f"Malformed HTTP status line from {host}:{port}: {status_line!r}")
+        status, reason = int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+    except BaseException:
+        await _close(writer)
+        raise
+    return reader, writer, status, reason, response_headers
+
+
+async def _close(writer: asyncio.StreamWriter):
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, ssl.SSLError):
+        pass
+
+
+async def _exchange(method: str, url: str, body: Optional[bytes],
+                    headers: Dict[str, str]) -> AsyncResponse:
+    reader, writer, status, reason, response_headers = await _open(method, url, body, headers)
+    try:
+        try:
+            content = await _read_body(reader, response_headers)
+        except (asyncio.IncompleteReadError, ValueError) as e:
+            host, port = _target(url)[:2]
+            raise ConnectionError(f"Truncated HTTP response from {host}:{port}: {e}") from None
+        return AsyncResponse(status, reason, response_headers, content)
+    finally:
+        await _close(writer)
+
+
+def _encode(payload: Any, headers: Optional[Dict[str, str]]) -> Tuple[Optional[bytes], Dict[str, str]]:
+    headers = dict(headers or {})
+    body = None
+    if payload is not None:
+        body = json.dumps(payload).encode("utf-8")
+        headers.setdefault("Content-Type", "application/json")
+    return body, headers
+
+
+async def request(method: str, url: str, payload: Any = None,
+                  timeout: Optional[float] = None,
+                  headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+    """
+    Send one HTTP request without blocking the event loop.
+
+    Args:
+        method: HTTP method ("GET", "POST", ...)
+        url: http:// or https:// URL
+        payload: JSON-serializable request body (None: no body)
+        timeout: Deadline in seconds for the whole exchange (None: no limit)
+        headers: Extra request headers
+
+    Returns:
+        AsyncResponse (any status; callers check response.status)
+
+    Raises:
+        ConnectionError: Connection refused/reset or malformed response
+        asyncio.TimeoutError: Deadline exceeded
+    """
+    body, headers = _encode(payload, headers)
+    exchange = _exchange(method, url, body, headers)
+    if timeout is None:
+        return await exchange
+    return await asyncio.wait_for(exchange, timeout)
+
+
+class StreamingResponse:
+    """
+    Status and headers of a response whose body is read as it arrives.
+
+    Closing it (or leaving stream()) drops the connection, which is how a
+    caller stops a server mid-response.
+    """
+
+    __slots__ = ("status", "reason", "headers", "_reader", "_writer")
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str],
+                 reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._reader = reader
+        self._writer = writer
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Body bytes as they arrive"""
+        try:
+            async for data in _iter_body(self._reader, self.headers):
+                yield data
+        except (asyncio.IncompleteReadError, ValueError) as e:
+            raise ConnectionError(f"Truncated HTTP response: {e}") from None
+
+    async def lines(self) -> AsyncIterator[bytes]:
+        """Body split on newlines (e.g. NDJSON), without the line endings"""
+        pending = b""
+        async for data in self.chunks():
+            pending += data
+            *complete, pending = pending.split(b"\n")
+            for line in complete:
+                yield line.rstrip(b"\r")
+        if pending:
+            yield pending
+
+    async def read(self) -> bytes:
+        return b"".join([data async for data in self.chunks()])
+
+    async def aclose(self):
+        await _close(self._writer)
+
+
+async def open_stream(method: str, url: str, payload: Any = None,
+                      timeout: Optional[float] = None,
+                      headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    """
+    Send one HTTP request and return once the response headers arrive.
+    The caller reads the body incrementally and must aclose() the response.
+
+    Args:
+        timeout: Deadline in seconds for connecting and receiving the
+                 headers (bound the body reads with the caller's own deadline)
+
+    Raises:
+        ConnectionError: Connection refused/reset or malformed response
+        asyncio.TimeoutError: No headers before the deadline
+    """
+    body, headers = _encode(payload, headers)
+    opening = _open(method, url, body, headers)
+    reader, writer, status, reason, response_headers = (
+        await opening if timeout is None else await asyncio.wait_for(opening, timeout)
+    )
+    return StreamingResponse(status, reason, response_headers, reader, writer)
+
+
+@contextlib.asynccontextmanager
+async def stream(method: str, url: str, payload: Any = None,
+                 timeout: Optional[float] = None,
+                 headers: Optional[Dict[str, str]] = None) -> AsyncIterator[StreamingResponse]:
+    """
+    open_stream() as an async context manager that closes the response.
+
+        async with stream("POST", url, payload={...}) as response:
+            async for line in response.lines():
+                ...
+    """
+    response = await open_stream(method, url, payload, timeout, headers)
+    try:
+        yield response
+    finally:
+        await response.aclose()
@@ -0,0 +1,665 @@
+"""
+Audit Codec: compact, schema-versioned binary records of pipeline results
+
+JSON audit logs of CriterionPipeline results are large (~20 KB per full
+result), and most of that is repetition. The same dict keys, domains,
+severities, axiom names and verdict strings come back in every record,
+and the long CoT scaffold is mostly the same template lines. This codec
+writes:
+
+- A file header: magic, SCHEMA_VERSION.
+- One record per result:
+
+      u32 length | fixed header | new strings | body
+
+  - fixed header (RECORD_HEADER, struct-packed): timestamp, flags
+    (survival, confidence, detail level), primary domain, the
+    four gate scores and the violation counts, so an audit scan can
+    filter records without decoding their bodies.
+  - new strings: strings first seen in this record, appended to the
+    stream's string table. Later occurrences are 1-3 byte references.
+    The table starts with SEED_STRINGS: the result keys and enum-like
+    values.
+  - body: a tagged binary tree (dicts, lists, strings, ints, floats,
+    bools, None) of the whole result. Long multi-line strings are
+    stored as a list of line references.
+
+Decoding yields what json.loads(json.dumps(result, default=json_default))
+would: plain dicts and lists, SystemDomain members as their values.
+Every part of a result, the projections of structured_output included, is
+stored as written, so a record reads back the same whatever code version
+decodes it.
+
+Readers and writers stream: records are written one at a time and read
+back one at a time, with constant memory apart from the string table
+(capped by max_strings; later new strings are written inline).
+
+A stream is written once from the start (the string table lives in it):
+to append after a restart, start a new file.
+
+Usage:
+    with open("logs/audit.crau", "wb") as f:
+        writer = AuditWriter(f)
+        writer.write(pipeline.evaluate(query, system_data))
+
+    with open("logs/audit.crau", "rb") as f:
+        for header in AuditReader(f).scan():        # bodies skipped
+            if not header.survival: ...
+    with open("logs/audit.crau", "rb") as f:
+        for header, result in AuditReader(f):       # full records
+            ...
+
+    python -m evaluation.audit_codec jsonl logs/audit.crau out.jsonl
+    python -m evaluation.audit_codec scan logs/audit.crau
+    python -m evaluation.audit_codec check       # round trip of sample results
+"""
+
+import argparse
+import json
+import struct
+import sys
+import time
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from evaluation.reasoning_engine import DETAIL_LEVELS, GATE_DEFINITIONS, SystemDomain
+
+
+MAGIC = b"CRAU"
+SCHEMA_VERSION = 2
+
+FILE_HEADER = struct.Struct("<4sHH")          # magic, schema version, reserved
+RECORD_LENGTH = struct.Struct("<I")           # bytes after this field
+RECORD_HEADER = struct.Struct("<dBI4hHH")     # see AuditHeader
+
+# Record flags
+FLAG_SURVIVAL = 0x01
+FLAG_HIGH_CONFIDENCE = 0x02
+# 0x04, 0x08: reserved (schema version 1 marked derived bodies with them)
+LEVEL_SHIFT = 4              # bits 4-5: index in DETAIL_LEVELS, 3 = unknown
+LEVEL_UNKNOWN = 3
+
+NO_DOMAIN = 0xFFFFFFFF
+NO_COUNT = 0xFFFF
+
+# Strings every stream's table starts with (part of the schema: changing
+# this list requires a new SCHEMA_VERSION). The first 128 entries encode
+# as one byte.
+SEED_STRINGS: Tuple[str, ...] = (
+    # result keys
+    "query", "reasoning_phases", "phase_1_scan", "primary_domain", "detected_contexts",
+    "reasoning", "phase_2_extract", "assumption_count", "assumption_types",
+    "beneficiaries_claimed", "dismissed_harms", "inferred_intent", "llm_semantic_enrichment",
+    "phase_3_mirror", "total_violations", "critical_violations", "violations", "axiom",
+    "violation", "severity", "consequence", "affected_domains", "compliance_status",
+    "severity_distribution", "phase_4_gates", "gate_scores", "gate_details", "score",
+    "passed", "criteria", "required", "all_gates_pass", "origin_aware_critical",
+    "critical_path", "phase_5_consequences", "harm_scale", "critical_tipping_points",
+    "total_affected_domains", "phase_6_verdict", "final_judgment", "survival", "confidence",
+    "reasoning_summary", "recommendation", "critical_issues", "cot_scaffold",
+    "structured_output", "analysis", "scan", "primary_system", "detected_systems",
+    "system_scores", "assumptions", "statement_type", "beneficiaries", "axiom_mirror",
+    "frictions", "axiom_compliance", "gates", "gate_reasoning", "consequences",
+    "consequence_chains", "friction", "immediate_effect", "secondary_effects",
+    "tertiary_effects", "systemic_amplification", "time_horizon", "reversibility",
+    "tipping_point", "affected_domains_list", "estimated_harm_scale",
+    "irreversible_consequences", "verdict", "analysis_chain", "1_scan", "secondary_domains",
+    "2_assumptions", "total_assumptions", "3_axiom_mirror", "compliance", "4_gates",
+    "gate_status", "origin_aware_pass", "5_consequences", "confidence_level",
+    "llm_semantic_layer", "domain", "intent", "id",
+    # enum-like values
+    "critical", "high", "medium", "low",
+    "SURVIVES The Criterion", "FAILS The Criterion",
+    *(domain.value for domain in SystemDomain),
+    *DETAIL_LEVELS,
+    *(name for name, _ in GATE_DEFINITIONS),
+)
+
+# Strings longer than this are always written inline
+MAX_INTERNED_LENGTH = 256
+
+# Value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR_REF, _STR, _LIST, _DICT, _LINES = range(10)
+_SMALL_INT = 0x40            # 0x40-0x7F: ints 0-63
+_SHORT_REF = 0x80            # 0x80-0xFF: string table ids 0-127
+
+_FLOAT64 = struct.Struct("<d")
+
+
+class AuditFormatError(ValueError):
+    """Not an audit stream, an unsupported schema version or a corrupt record"""
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+_SMALL_INTS = tuple(bytes([_SMALL_INT + n]) for n in range(64))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Pipeline result layout
+# ═══════════════════════════════════════════════════════════════════
+
+def _summary(result: Any) -> Tuple[int, Optional[str], Tuple[int, ...], int, int, int]:
+    """(flags, primary domain, gate scores, total, critical, level index) for the fixed header"""
+    try:
+        return _read_summary(result)
+    except (KeyError, TypeError, AttributeError, ValueError):
+        # Not shaped like a pipeline result: header fields stay unset
+        return 0, None, (), NO_COUNT, NO_COUNT, LEVEL_UNKNOWN
+
+
+def _read_summary(result: Dict) -> Tuple[int, Optional[str], Tuple[int, ...], int, int, int]:
+    get = result.get
+    level = LEVEL_UNKNOWN
+    store = get("structured_output")
+    if isinstance(store, dict) and "verdict" in store:
+        level = DETAIL_LEVELS.index("full" if "cot_scaffold" in result else "summary")
+        chain = store["verdict"]["analysis_chain"]
+        judgment = store["verdict"]["final_judgment"]
+        domain = chain["1_scan"]["primary_domain"]
+        scores = tuple(gate["score"] for gate in chain["4_gates"]["gate_status"].values())
+        total = chain["3_axiom_mirror"]["total_violations"]
+        critical = chain["3_axiom_mirror"]["critical_violations"]
+        survival = judgment["survival"]
+        high = judgment["confidence_level"] == "high"
+    elif isinstance(get("phase_6_verdict"), dict) and "gate_scores" in result:
+        if "structured_output" not in result:
+            level = DETAIL_LEVELS.index("verdict")
+        summary = get("phase_6_verdict")
+        domain = get("primary_domain")
+        scores = tuple(get("gate_scores").values())
+        total = NO_COUNT
+        critical = len(summary.get("critical_issues") or ())
+        survival = summary.get("survival")
+        high = summary.get("confidence") == "high"
+    else:
+        return 0, None, (), NO_COUNT, NO_COUNT, LEVEL_UNKNOWN
+
+    flags = (FLAG_SURVIVAL if survival else 0) | (FLAG_HIGH_CONFIDENCE if high else 0)
+    if isinstance(domain, Enum):
+        domain = domain.value
+    if not isinstance(domain, str):
+        domain = None
+    return flags, domain, scores, total, critical, level
+
+
+def _clamp16(value: Any) -> int:
+    try:
+        return max(-0x8000, min(0x7FFF, int(round(value))))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _count16(value: Any) -> int:
+    return value if isinstance(value, int) and 0 <= value < NO_COUNT else NO_COUNT
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Records
+# ═══════════════════════════════════════════════════════════════════
+
+class AuditHeader:
+    """Fixed-layout part of a record (readable without decoding the body)"""
+
+    __slots__ = ("timestamp", "flags", "primary_domain", "gate_scores",
+                 "total_violations", "critical_violations")
+
+    def __init__(self, timestamp: float, flags: int, primary_domain: Optional[str],
+                 gate_scores: Tuple[int, ...], total_violations: Optional[int],
+                 critical_violations: Optional[int]):
+        self.timestamp = timestamp
+        self.flags = flags
+        self.primary_domain = primary_domain
+        self.gate_scores = gate_scores
+        self.total_violations = total_violations
+        self.critical_violations = critical_violations
+
+    @property
+    def survival(self) -> bool:
+        return bool(self.flags & FLAG_SURVIVAL)
+
+    @property
+    def confidence(self) -> str:
+        return "high" if self.flags & FLAG_HIGH_CONFIDENCE else "medium"
+
+    @property
+    def detail_level(self) -> Optional[str]:
+        index = (self.flags >> LEVEL_SHIFT) & 0x03
+        return DETAIL_LEVELS[index] if index < len(DETAIL_LEVELS) else None
+
+    def to_dict(self) -> Dict:
+        return {
+            "timestamp": self.timestamp,
+            "detail_level": self.detail_level,
+            "survival": self.survival,
+            "confidence": self.confidence,
+            "primary_domain": self.primary_domain,
+            "gate_scores": dict(zip((name for name, _ in GATE_DEFINITIONS), self.gate_scores)),
+            "total_violations": self.total_violations,
+            "critical_violations": self.critical_violations
+        }
+
+
+class AuditWriter:
+    """
+    Streaming encoder: one record per write().
+    """
+
+    def __init__(self, stream: BinaryIO, max_strings: int = 1 << 16):
+        """
+        Args:
+            stream: Binary file object, positioned at the start of a new stream
+            max_strings: String table size limit (memory bound for writer and
+                         reader); once reached, new strings are written inline
+        """
+        self.stream = stream
+        self.max_strings = max_strings
+        self.records = 0
+        self.strings: List[str] = []    # the stream's string table, by id
+        self.last_header: Optional[AuditHeader] = None
+        self._refs: Dict[str, bytes] = {}
+        self._new: List[bytes] = []
+        for string in SEED_STRINGS:
+            self._intern(string)
+        self._new.clear()
+        stream.write(FILE_HEADER.pack(MAGIC, SCHEMA_VERSION, 0))
+
+    def _intern(self, string: str) -> bytes:
+        """Encoded reference to string (defining it, or inline if not internable)"""
+        raw = string.encode("utf-8")
+        if len(raw) > MAX_INTERNED_LENGTH or len(self.strings) >= self.max_strings:
+            return bytes((_STR,)) + _varint(len(raw)) + raw
+        index = len(self.strings)
+        self.strings.append(string)
+        ref = bytes((_SHORT_REF + index,)) if index < 0x80 else bytes((_STR_REF,)) + _varint(index)
+        self._refs[string] = ref
+        self._new.append(_varint(len(raw)) + raw)
+        return ref
+
+    def _string_id(self, string: Optional[str]) -> int:
+        if string is None:
+            return NO_DOMAIN
+        ref = self._refs.get(string)
+        if ref is None:
+            ref = self._intern(string)
+        if ref[0] >= _SHORT_REF:
+            return ref[0] - _SHORT_REF
+        if ref[0] == _STR_REF:
+            return _read_varint(ref, 1)[0]
+        return NO_DOMAIN
+
+    def _encode(self, value: Any, out: bytearray):
+        refs = self._refs
+        intern = self._intern
+        small_ints = _SMALL_INTS
+
+        def encode(value):
+            kind = type(value)
+            if kind is str:
+                ref = refs.get(value)
+                if ref is not None:
+                    out.extend(ref)
+                elif len(value) > MAX_INTERNED_LENGTH and "\n" in value:
+                    # Long text (the CoT scaffold): its lines recur across records
+                    lines = value.split("\n")
+                    out.append(_LINES)
+                    out.extend(_varint(len(lines)))
+                    for line in lines:
+                        ref = refs.get(line)
+                        out.extend(ref if ref is not None else intern(line))
+                else:
+                    out.extend(intern(value))
+            elif kind is int:
+                if 0 <= value < 64:
+                    out.extend(small_ints[value])
+                else:
+                    out.append(_INT)
+                    out.extend(_varint(value << 1 if value >= 0 else (-value << 1) - 1))
+            elif kind is bool:
+                out.append(_TRUE if value else _FALSE)
+            elif value is None:
+                out.append(_NONE)
+            elif isinstance(value, dict):
+                out.append(_DICT)
+                out.extend(_varint(len(value)))
+                for key, item in value.items():
+                    encode(key)
+                    encode(item)
+            elif isinstance(value, (list, tuple)):
+                out.append(_LIST)
+                out.extend(_varint(len(value)))
+                for item in value:
+                    encode(item)
+            elif kind is float:
+                out.append(_FLOAT)
+                out.extend(_FLOAT64.pack(value))
+            elif isinstance(value, Enum):
+                encode(value.value)
+            elif isinstance(value, str):
+                encode(str(value))
+            elif isinstance(value, int):
+                encode(int(value))
+            elif isinstance(value, float):
+                encode(float(value))
+            else:
+                raise TypeError(f"Cannot encode {type(value).__name__} in an audit record")
+
+        encode(value)
+
+    def write(self, result: Dict, timestamp: Optional[float] = None) -> int:
+        """
+        Append one result.
+
+        Args:
+            result: CriterionPipeline result (any detail level) or any
+                    JSON-like dict
+            timestamp: Record time (default: now)
+
+        Returns:
+            Bytes written (the record's fixed header is then self.last_header)
+        """
+        flags, domain, scores, total, critical, level = _summary(result)
+        body = bytearray()
+        self._encode(result, body)
+
+        domain_id = self._string_id(domain)
+        scores = (tuple(_clamp16(score) for score in scores) + (0, 0, 0, 0))[:4]
+        timestamp = time.time() if timestamp is None else timestamp
+        flags |= level << LEVEL_SHIFT
+        total, critical = _count16(total), _count16(critical)
+        header = RECORD_HEADER.pack(timestamp, flags, domain_id, *scores, total, critical)
+        self.last_header = AuditHeader(
+            timestamp, flags, domain if domain_id != NO_DOMAIN else None, scores,
+            None if total == NO_COUNT else total,
+            None if critical == NO_COUNT else critical
+        )
+        strings = _varint(len(self._new)) + b"".join(self._new)
+        self._new.clear()
+
+        length = len(header) + len(strings) + len(body)
+        self.stream.write(RECORD_LENGTH.pack(length) + header + strings + body)
+        self.records += 1
+        return RECORD_LENGTH.size + length
+
+    def flush(self):
+        self.stream.flush()
+
+
+class AuditReader:
+    """
+    Streaming decoder: iterate for (AuditHeader, result), or scan() for
+    headers only.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Raises:
+            AuditFormatError: Not an audit stream or unsupported schema version
+        """
+        self.stream = stream
+        head = stream.read(FILE_HEADER.size)
+        if len(head) < FILE_HEADER.size:
+            raise AuditFormatError("Not an audit stream (too short)")
+        magic, version, _ = FILE_HEADER.unpack(head)
+        if magic != MAGIC:
+            raise AuditFormatError("Not an audit stream (bad magic)")
+        if version != SCHEMA_VERSION:
+            raise AuditFormatError(f"Unsupported audit schema version {version} "
+                                   f"(this reader supports {SCHEMA_VERSION})")
+        self.version = version
+        self.strings: List[str] = list(SEED_STRINGS)
+
+    def __iter__(self) -> Iterator[Tuple[AuditHeader, Dict]]:
+        for header, data, pos in self._records():
+            yield header, _decode_body(header, data, pos, self.strings)
+
+    def scan(self) -> Iterator[AuditHeader]:
+        """Headers of every record; bodies are skipped"""
+        for header, _, _ in self._records():
+            yield header
+
+    def _records(self) -> Iterator[Tuple[AuditHeader, bytes, int]]:
+        read = self.stream.read
+        while True:
+            prefix = read(RECORD_LENGTH.size)
+            if not prefix:
+                return
+            if len(prefix) < RECORD_LENGTH.size:
+                raise AuditFormatError("Truncated record length")
+            (length,) = RECORD_LENGTH.unpack(prefix)
+            data = read(length)
+            if len(data) < length:
+                raise AuditFormatError("Truncated record")
+            header, pos = _parse_header(data, self.strings, define=True)
+            yield header, data, pos
+
+
+def decode_record(record: bytes, strings: Sequence[str]) -> Tuple[AuditHeader, Dict]:
+    """
+    Decode one record out of stream order (random access from an index).
+
+    Args:
+        record: The record's bytes, without the length prefix
+        strings: The stream's string table, at least up to the strings this
+                 record defines (e.g. AuditWriter.strings, or AuditReader.strings
+                 after a full scan)
+
+    Returns:
+        (AuditHeader, result)
+    """
+    header, pos = _parse_header(record, strings, define=False)
+    return header, _decode_body(header, record, pos, strings)
+
+
+def _parse_header(data: bytes, strings: Any, define: bool) -> Tuple[AuditHeader, int]:
+    """Fixed header and string definitions of a record -> (header, body offset)"""
+    try:
+        timestamp, flags, domain_id, s1, s2, s3, s4, total, critical = (
+            RECORD_HEADER.unpack_from(data)
+        )
+        pos = RECORD_HEADER.size
+        count, pos = _read_varint(data, pos)
+        for _ in range(count):
+            size, pos = _read_varint(data, pos)
+            if define:
+                strings.append(data[pos:pos + size].decode("utf-8"))
+            pos += size
+        domain = strings[domain_id] if domain_id != NO_DOMAIN else None
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise AuditFormatError(f"Corrupt record header: {e}") from None
+    header = AuditHeader(
+        timestamp, flags, domain, (s1, s2, s3, s4),
+        None if total == NO_COUNT else total,
+        None if critical == NO_COUNT else critical
+    )
+    return header, pos
+
+
+def _decode_body(header: AuditHeader, data: bytes, pos: int, strings: Sequence[str]) -> Dict:
+    try:
+        return _decode(data, pos, strings)[0]
+    except (IndexError, UnicodeDecodeError, struct.error, ValueError) as e:
+        raise AuditFormatError(f"Corrupt record body: {e}") from None
+
+
+def _decode(data: bytes, pos: int, strings: Sequence[str]) -> Tuple[Any, int]:
+    """One tagged value at pos -> (value, next position)"""
+
+    def decode(pos):
+        tag = data[pos]
+        pos += 1
+        if tag >= _SHORT_REF:
+            return strings[tag - _SHORT_REF], pos
+        if tag >= _SMALL_INT:
+            return tag - _SMALL_INT, pos
+        if tag == _DICT:
+            count, pos = _read_varint(data, pos)
+            value = {}
+            for _ in range(count):
+                key, pos = decode(pos)
+                value[key], pos = decode(pos)
+            return value, pos
+        if tag == _LIST:
+            count, pos = _read_varint(data, pos)
+            value = []
+            for _ in range(count):
+                item, pos = decode(pos)
+                value.append(item)
+            return value, pos
+        if tag == _STR_REF:
+            index, pos = _read_varint(data, pos)
+            return strings[index], pos
+        if tag == _STR:
+            size, pos = _read_varint(data, pos)
+            return data[pos:pos + size].decode("utf-8"), pos + size
+        if tag == _LINES:
+            count, pos = _read_varint(data, pos)
+            lines = []
+            for _ in range(count):
+                line, pos = decode(pos)
+                lines.append(line)
+            return "\n".join(lines), pos
+        if tag == _INT:
+            raw, pos = _read_varint(data, pos)
+            return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1), pos
+        if tag == _FLOAT:
+            return _FLOAT64.unpack_from(data, pos)[0], pos + 8
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        if tag == _NONE:
+            return None, pos
+        raise ValueError(f"unknown value tag 0x{tag:02x}")
+
+    return decode(pos)
+
+
+def dumps(result: Dict, timestamp: Optional[float] = None) -> bytes:
+    """One result as a self-contained audit stream"""
+    from io import BytesIO
+
+    buffer = BytesIO()
+    AuditWriter(buffer).write(result, timestamp)
+    return buffer.getvalue()
+
+
+def loads(data: bytes) -> Dict:
+    """The first result of an audit stream"""
+    from io import BytesIO
+
+    for _, result in AuditReader(BytesIO(data)):
+        return result
+    raise AuditFormatError("Audit stream holds no records")
+
+
+def round_trip_check() -> List[str]:
+    """
+    Encode and decode sample pipeline results of every detail level, one per
+    stream (dumps/loads) and all in one stream.
+
+    Returns:
+        Mismatch messages (empty when every result reads back as its JSON form)
+    """
+    from io import BytesIO
+
+    from evaluation.pipeline import CriterionPipeline
+    from evaluation.results import json_default
+
+    pipeline = CriterionPipeline()
+    queries = ("Charge interest to maximize profit",
+               "Replace the courts with an AI arbiter whose rulings are final",
+               "Community land trust with shared ownership ✓", "")
+    system_data = (
+        {},
+        {"causes_harm_amplification": True},    # affected domains: every domain
+        {"zero_sum": True, "centralized_control": True, "permits_exploitative_gain": True},
+        {"origin_aware": True, "transparent": True, "consent_based": True},
+    )
+    extraction = {"domain": "economic", "intent": "profit", "assumptions": ["growth", "scale"]}
+    samples = []
+    for query in queries:
+        for data in system_data:
+            for level in DETAIL_LEVELS:
+                result = pipeline.evaluate(query, data, extraction if data else None,
+                                           detail_level=level)
+                samples.append((f"{level} result of {query!r} with {data}", result))
+                samples.append((f"{level} result with an id", {"id": len(samples), **result}))
+
+    failures = []
+    buffer = BytesIO()
+    writer = AuditWriter(buffer)
+    expected = []
+    for label, result in samples:
+        plain = json.loads(json.dumps(result, default=json_default))
+        if loads(dumps(result)) != plain:
+            failures.append(f"{label}: loads(dumps(result)) differs")
+        writer.write(result)
+        expected.append(plain)
+    decoded = [result for _, result in AuditReader(BytesIO(buffer.getvalue()))]
+    for (label, _), plain, result in zip(samples, expected, decoded):
+        if result != plain:
+            failures.append(f"{label}: differs when read from a shared stream")
+    if len(decoded) != len(samples):
+        failures.append(f"{len(decoded)} records read back, {len(samples)} written")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m evaluation.audit_codec",
+        description="Inspect binary audit logs of Criterion pipeline results"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    to_jsonl = commands.add_parser("jsonl", help="Decode records to JSON lines")
+    to_jsonl.add_argument("input", help="Audit log")
+    to_jsonl.add_argument("output", help="Output JSONL file ('-' for stdout)")
+    scan = commands.add_parser("scan", help="Print record headers as JSON lines")
+    scan.add_argument("input", help="Audit log")
+    commands.add_parser("check", help="Round-trip sample results through the codec")
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        failures = round_trip_check()
+        for message in failures[:20]:
+            print(message)
+        print(f"Round trip check: {len(failures)} mismatches")
+        return 1 if failures else 0
+
+    sink = sys.stdout if getattr(args, "output", "-") == "-" else open(args.output, "w",
+                                                                       encoding="utf-8")
+    try:
+        with open(args.input, "rb") as f:
+            reader = AuditReader(f)
+            if args.command == "scan":
+                for header in reader.scan():
+                    sink.write(json.dumps(header.to_dict()) + "\n")
+            else:
+                for _, result in reader:
+                    sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Axiom Rule Compiler: data-driven MIRROR phase
+
+Each axiom in core_axioms.json may declare `mirror_rules`. A rule names the
+system_data flag it reads, the flag value that counts as a violation, an
+optional domain it is restricted to, and the friction it produces:
+
+    {
+        "check": "design_economic",        # key in axiom_compliance
+        "applies_to": "economic",          # optional SCAN domain restriction
+        "flag": "permits_exploitative_gain",
+        "violated_when": true,
+        "severity": "high",
+        "violation": "...",                # may use {parameter} placeholders
+        "consequence": "...",
+        "affected_domains": ["economic", "social"],   # or "all"
+        "parameters": {"name": "default"}  # optional, read from system_data
+    }
+
+The rules are compiled once, at engine construction, into a decision table:
+evaluating a system profile packs the rule flags into an integer, masks it
+with the rules that apply to the domain, and looks the result up in a table
+of precomputed frictions and compliance maps.
+
+Usage:
+    mirror = compile_mirror_rules(axioms, all_domains)
+    result = mirror.evaluate(system_data, "economic")          # dict
+    result = mirror.evaluate_result(system_data, "economic")   # MirrorResult
+"""
+
+import json
+import string
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from evaluation.instrumentation import instrumented
+from evaluation.results import Friction, MirrorResult
+
+
+DEFAULT_AXIOMS_PATH = Path(__file__).parent.parent / "axioms" / "core_axioms.json"
+
+SEVERITIES = ("critical", "high", "medium", "low")
+
+_FORMATTER = string.Formatter()
+
+
+class AxiomRuleError(ValueError):
+    """Raised when an axiom file contains an invalid mirror rule"""
+
+
+class AxiomRule:
+    """One compiled MIRROR rule"""
+
+    __slots__ = ("axiom", "check", "flag", "violated_when", "applies_to",
+                 "severity", "violation", "consequence", "affected_domains",
+                 "parameters", "templated")
+
+    def __init__(self, axiom: str, spec: Dict, all_domains: List[Any]):
+        try:
+            self.axiom = axiom
+            self.check = spec["check"]
+            self.flag = spec["flag"]
+            self.violated_when = bool(spec.get("violated_when", False))
+            self.applies_to = spec.get("applies_to")
+            self.severity = spec["severity"]
+            self.violation = spec["violation"]
+            self.consequence = spec["consequence"]
+            domains = spec["affected_domains"]
+        except KeyError as e:
+            raise AxiomRuleError(f"Mirror rule of axiom '{axiom}' is missing {e}") from None
+
+        if self.severity not in SEVERITIES:
+            raise AxiomRuleError(
+                f"Mirror rule '{self.check}' has unknown severity '{self.severity}'"
+            )
+        self.affected_domains = list(all_domains) if domains == "all" else list(domains)
+        self.parameters = dict(spec.get("parameters", {}))
+
+        fields = [self.violation, self.consequence] + [
+            d for d in self.affected_domains if isinstance(d, str)
+        ]
+        placeholders = {
+            name for text in fields for _, name, _, _ in _FORMATTER.parse(text) if name
+        }
+        unknown = placeholders - set(self.parameters)
+        if unknown:
+            raise AxiomRuleError(
+                f"Mirror rule '{self.check}' uses undeclared parameters: {sorted(unknown)}"
+            )
+        self.templated = bool(placeholders)
+
+    def friction(self, system_data: Optional[Dict] = None) -> Friction:
+        """Friction for this rule (placeholders filled from system_data)"""
+        violation, consequence, domains = self.violation, self.consequence, self.affected_domains
+        if self.templated:
+            values = {
+                name: (system_data or {}).get(name, default)
+                for name, default in self.parameters.items()
+            }
+            violation = violation.format(**values)
+            consequence = consequence.format(**values)
+            domains = [_fill_domain(d, values) for d in domains]
+        return Friction(self.axiom, violation, self.severity, consequence, domains)
+
+
+def _fill_domain(domain: Any, values: Dict) -> Any:
+    """Fill a domain placeholder, keeping the raw value for a bare '{name}'"""
+    if not isinstance(domain, str):
+        return domain
+    if domain.startswith("{") and domain.endswith("}") and domain[1:-1] in values:
+        return values[domain[1:-1]]
+    return domain.format(**values)
+
+
+class _TableEntry:
+    """Precomputed MIRROR output for one combination of violated rules"""
+
+    __slots__ = ("frictions", "static", "templated", "compliance", "total",
+                 "severity_distribution")
+
+    def __init__(self, rules: List[AxiomRule], violated: int, applicable: int):
+        active = [i for i in range(len(rules)) if applicable >> i & 1]
+        fired = [i for i in active if violated >> i & 1]
+        # static frictions are built once and shared by every result;
+        # templated ones are filled per evaluation
+        self.frictions = tuple(
+            (rules[i], None if rules[i].templated else rules[i].friction()) for i in fired
+        )
+        self.static = None if any(rules[i].templated for i in fired) else tuple(
+            static for _, static in self.frictions
+        )
+        self.templated = any(rules[i].templated for i in fired)
+        self.compliance = {}
+        for i in active:
+            self.compliance[rules[i].check] = not (violated >> i & 1)
+        self.total = len(fired)
+        distribution = {severity: 0 for severity in SEVERITIES}
+        for i in fired:
+            distribution[rules[i].severity] += 1
+        self.severity_distribution = distribution
+
+
+class CompiledMirror:
+    """
+    Decision-table evaluator for a rule set.
+
+    Rules are bit positions. For each distinct `applies_to` domain (plus the
+    unrestricted case) a table of 2^n entries maps the violated-rule bitmask
+    to its precomputed MIRROR result.
+    """
+
+    def __init__(self, rules: List[AxiomRule]):
+        self.rules = rules
+        self.flags = tuple(rule.flag for rule in rules)
+        # system_data keys read by templated rules (besides the flags)
+        self.parameters = tuple(dict.fromkeys(
+            name for rule in rules if rule.templated for name in rule.parameters
+        ))
+        # bit i set when rule i is violated by a truthy flag
+        self._violated_when_true = sum(1 << i for i, r in enumerate(rules) if r.violated_when)
+        self._all_bits = (1 << len(rules)) - 1
+
+        restricted = {r.applies_to for r in rules if r.applies_to is not None}
+        self._applicable = {
+            domain: sum(
+                1 << i for i, r in enumerate(rules) if r.applies_to in (None, domain)
+            )
+            for domain in restricted
+        }
+        self._default_applicable = sum(
+            1 << i for i, r in enumerate(rules) if r.applies_to is None
+        )
+
+        self._tables: Dict[int, Dict[int, _TableEntry]] = {}
+        for applicable in set(self._applicable.values()) | {self._default_applicable}:
+            self._tables[applicable] = self._build_table(applicable)
+
+    def _build_table(self, applicable: int) -> Dict[int, _TableEntry]:
+        """Entries for every violated subset of the applicable rules"""
+        table = {}
+        subset = applicable
+        while True:
+            table[subset] = _TableEntry(self.rules, subset, applicable)
+            if subset == 0:
+                break
+            subset = (subset - 1) & applicable
+        return table
+
+    def applicable_mask(self, system_type: str) -> int:
+        """Bitmask of the rules that apply in a domain"""
+        return self._applicable.get(system_type, self._default_applicable)
+
+    def violation_mask(self, system_data: Dict, system_type: str) -> int:
+        """Bitmask of the rules violated by a system profile in a domain"""
+        truthy = 0
+        for i, flag in enumerate(self.flags):
+            if system_data.get(flag):
+                truthy |= 1 << i
+        violated = ~(truthy ^ self._violated_when_true) & self._all_bits
+        return violated & self._applicable.get(system_type, self._default_applicable)
+
+    def evaluate(self, system_data: Dict, system_type: str) -> Dict:
+        """
+        MIRROR result for a system profile.
+
+        Returns:
+            Same shape as CriterionReasoningEngine.mirror_against_axioms
+        """
+        return self.evaluate_result(system_data, system_type).to_dict()
+
+    @instrumented("MIRROR")
+    def evaluate_result(self, system_data: Dict, system_type: str) -> MirrorResult:
+        """
+        MIRROR result for a system profile, sharing the table's frictions.
+
+        Returns:
+            MirrorResult (compliance and severity_distribution are the table's
+            own dicts: read them, don't mutate them)
+        """
+        applicable = self._applicable.get(system_type, self._default_applicable)
+        entry = self._tables[applicable][self.violation_mask(system_data, system_type)]
+
+        frictions = entry.static
+        if frictions is None:
+            frictions = tuple(
+                rule.friction(system_data) if static is None else static
+                for rule, static in entry.frictions
+            )
+        return MirrorResult(frictions, entry.compliance, entry.severity_distribution)
+
+
+def load_rule_specs(axioms: Dict) -> List[Tuple[str, Dict]]:
+    """
+    Collect (axiom display name, rule spec) pairs in declaration order.
+
+    Axiom sets without any `mirror_rules` fall back to the rules declared in
+    the default core_axioms.json.
+    """
+    specs = [
+        (name.replace("_", " "), spec)
+        for name, axiom in axioms.items()
+        if isinstance(axiom, dict)
+        for spec in axiom.get("mirror_rules", [])
+    ]
+    if not specs:
+        with open(DEFAULT_AXIOMS_PATH, 'r') as f:
+            default_axioms = json.load(f)
+        if default_axioms != axioms:
+            return load_rule_specs(default_axioms)
+    return specs
+
+
+def compile_mirror_rules(axioms: Dict, all_domains: List[Any]) -> CompiledMirror:
+    """
+    Compile the mirror rules of an axiom set.
+
+    Args:
+        axioms: Parsed axioms file (as loaded into engine.axioms)
+        all_domains: Domains listed by rules with affected_domains "all"
+
+    Returns:
+        CompiledMirror ready for evaluate()
+    """
+    rules = [AxiomRule(axiom, spec, all_domains) for axiom, spec in load_rule_specs(axioms)]
+    return CompiledMirror(rules)
@@ -0,0 +1,220 @@
+"""
+Batch Evaluation CLI: CriterionPipeline.evaluate over JSONL, on every core
+
+Reads one JSON object per line, evaluates it in a process pool (one warm
+CriterionPipeline per worker process) and writes one JSON result per line.
+Input is read and output written as a stream with a bounded number of
+chunks in flight, so memory stays constant however large the file is.
+
+Input lines:
+    {"query": "...", "system_data": {...}, "llm_extraction": {...}, "id": ...}
+    (llm_extraction and id are optional; id is copied to the output)
+
+Output lines:
+    The pipeline result, with "id" first when the input had one. Lines that
+    cannot be parsed or evaluated produce {"line": n, "error": "..."}.
+
+Usage:
+    python -m evaluation.batch in.jsonl out.jsonl
+    python -m evaluation.batch in.jsonl out.jsonl --workers 8 --unordered
+    python -m evaluation.batch in.jsonl out.jsonl --detail verdict
+    cat in.jsonl | python -m evaluation.batch - - > out.jsonl
+
+Throughput (records/s) is reported on stderr while running and at the end.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from evaluation.reasoning_engine import DETAIL_LEVELS
+from evaluation.results import json_default
+
+
+# Per-process pipeline, created once by _init_worker
+_PIPELINE = None
+
+
+def _init_worker(axioms_path: Optional[str], detail_level: str = "full"):
+    """Process pool initializer: build the worker's warm pipeline"""
+    global _PIPELINE
+    from evaluation.pipeline import CriterionPipeline
+
+    _PIPELINE = CriterionPipeline(axioms_path, detail_level=detail_level)
+
+
+def evaluate_line(line_number: int, line: str) -> str:
+    """
+    Evaluate one JSONL input line.
+
+    Returns:
+        The serialized output line (without trailing newline)
+    """
+    try:
+        record = json.loads(line)
+        result = _PIPELINE.evaluate(
+            record["query"],
+            record.get("system_data", {}),
+            llm_extraction=record.get("llm_extraction")
+        )
+        if "id" in record:
+            result = {"id": record["id"], **result}
+        return json.dumps(result, default=json_default, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"line": line_number, "error": f"{type(e).__name__}: {e}"})
+
+
+def _evaluate_chunk(chunk: List[Tuple[int, str]]) -> List[str]:
+    """Worker entry point: evaluate a chunk of (line_number, line) pairs"""
+    return [evaluate_line(number, line) for number, line in chunk]
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Group non-blank input lines into numbered chunks"""
+    chunk = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        chunk.append((number, line))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ThroughputReporter:
+    """Periodic records/s reporting on a text stream"""
+
+    def __init__(self, stream=sys.stderr, interval: float = 5.0):
+        self.stream = stream
+        self.interval = interval
+        self.records = 0
+        self.start = time.perf_counter()
+        self._last_report = self.start
+
+    def add(self, count: int):
+        self.records += count
+        now = time.perf_counter()
+        if self.stream is not None and now - self._last_report >= self.interval:
+            self._last_report = now
+            self._write(now, final=False)
+
+    def finish(self) -> Dict:
+        now = time.perf_counter()
+        if self.stream is not None:
+            self._write(now, final=True)
+        elapsed = now - self.start
+        return {
+            "records": self.records,
+            "seconds": elapsed,
+            "records_per_second": self.records / elapsed if elapsed > 0 else 0.0
+        }
+
+    def _write(self, now: float, final: bool):
+        elapsed = now - self.start
+        rate = self.records / elapsed if elapsed > 0 else 0.0
+        label = "done" if final else "progress"
+        self.stream.write(f"[batch {label}] {self.records} records in {elapsed:.1f}s ({rate:.1f} records/s)\n")
+        self.stream.flush()
+
+
+def evaluate_stream(lines: Iterable[str], workers: Optional[int] = None,
+                    chunk_size: int = 64, ordered: bool = True,
+                    axioms_path: Optional[str] = None, detail_level: str = "full",
+                    reporter: Optional[ThroughputReporter] = None) -> Iterator[str]:
+    """
+    Evaluate JSONL lines in a process pool, yielding output lines.
+
+    Args:
+        lines: Input JSONL lines (any iterable; consumed lazily)
+        workers: Worker processes (default: os.cpu_count())
+        chunk_size: Lines sent to a worker per task
+        ordered: Keep input order; False yields chunks as soon as they finish
+        axioms_path: Axioms file for the worker engines
+        detail_level: Pipeline detail level ("verdict", "summary" or "full")
+        reporter: Optional ThroughputReporter to update
+
+    Yields:
+        Serialized output lines (without trailing newline)
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+    chunks = _chunks(lines, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(axioms_path, detail_level)) as pool:
+        pending = deque()
+
+        def fill():
+            while len(pending) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                pending.append(pool.submit(_evaluate_chunk, chunk))
+
+        fill()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [f for f in pending if f in finished]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                results = future.result()
+                if reporter is not None:
+                    reporter.add(len(results))
+                yield from results
+            fill()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m evaluation.batch",
+        description="Evaluate JSONL proposals with CriterionPipeline on all cores"
+    )
+    parser.add_argument("input", help="Input JSONL file ('-' for stdin)")
+    parser.add_argument("output", help="Output JSONL file ('-' for stdout)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="Lines per worker task (default: 64)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="Write results as they finish instead of in input order")
+    parser.add_argument("--axioms", default=None, help="Path to an axioms JSON file")
+    parser.add_argument("--detail", choices=DETAIL_LEVELS, default="full",
+                        help="Result detail level (default: full)")
+    parser.add_argument("--report-interval", type=float, default=5.0,
+                        help="Seconds between throughput reports on stderr")
+    parser.add_argument("--quiet", action="store_true", help="No throughput reports")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    reporter = ThroughputReporter(None if args.quiet else sys.stderr, args.report_interval)
+
+    try:
+        for line in evaluate_stream(source, workers=args.workers, chunk_size=args.chunk_size,
+                                    ordered=not args.unordered, axioms_path=args.axioms,
+                                    detail_level=args.detail,
+                                    reporter=reporter):
+            sink.write(line)
+            sink.write("\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    reporter.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Vectorized Batch Reasoning
+
+Re-scores many (query, system_data) pairs at once. The boolean flags read by
+the MIRROR rules and the survival gates are packed into a NumPy matrix, and
+frictions, gate scores, survival and harm scale are computed as array
+operations over the whole batch. Per-row dicts are only built when a caller
+asks for them.
+
+Only SCAN (which reads the query text), the optional evidence boost and
+templated rules (e.g. Definition of Normal's deviation_domain) stay per-row
+work.
+
+Usage:
+    engine = CriterionReasoningEngine()
+    batch = engine.reason_batch(queries, system_datas)
+    batch.survival            # bool array, one entry per row
+    batch.gate_scores         # int array, shape (rows, 4)
+    batch.row(0)              # verdict summary dict for row 0
+    batch.full(0)             # same dict engine.reason() returns
+
+Requires numpy (pip install numpy).
+"""
+
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from evaluation.gates import GATE_FLAGS, GATE_WEIGHTS
+
+GATE_NAMES = ("Source Integrity", "Structural Consistency", "Mediation Zeroing", "Origin Aware")
+
+HARM_SCALES = (
+    "Localized (single friction point)",
+    "Moderate to Significant (domain-level impact)",
+    "Significant (major multi-domain degradation)",
+    "Severe (irreversible systemic collapse risk)",
+)
+
+def _domain_key(domain) -> tuple:
+    """Set identity of an affected domain (SystemDomain members != strings)"""
+    return (type(domain), domain)
+
+
+class BatchReasoningResult:
+    """
+    Array-backed verdicts for a batch of queries.
+
+    Attributes (all NumPy arrays with one entry per row):
+        flags: bool matrix (rows, len(columns))
+        frictions: bool matrix (rows, len(checks)), True where a rule is violated
+        gate_scores: int matrix (rows, 4) in GATE_NAMES order
+        all_gates_pass, origin_aware_pass, survival: bool vectors
+        total_violations, critical_violations, affected_domains,
+        tipping_points, irreversible_consequences: int vectors
+        harm_scale: int vector indexing HARM_SCALES
+    """
+
+    def __init__(self, engine, queries: Sequence[str], system_datas: Sequence[Dict],
+                 primary_domains: List[str]):
+        self.engine = engine
+        self.queries = queries
+        self.system_datas = system_datas
+        self.primary_domains = primary_domains
+        self.rules = engine.mirror.rules
+        self.checks = tuple(rule.check for rule in self.rules)
+        self.columns = tuple(dict.fromkeys([rule.flag for rule in self.rules] + list(GATE_FLAGS)))
+        self._compute()
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def _is_irreversible(self, friction) -> bool:
+        """Same test as ConsequenceSet (the engine's reversibility label)"""
+        return "irreversible" in self.engine._assess_reversibility(friction)
+
+    def _compute(self):
+        rows = len(self.queries)
+        datas = self.system_datas
+        rules = self.rules
+
+        flags = np.zeros((rows, len(self.columns)), dtype=bool)
+        for column, name in enumerate(self.columns):
+            flags[:, column] = np.fromiter(
+                (bool(d.get(name)) for d in datas), dtype=bool, count=rows
+            )
+        self.flags = flags
+        index = {name: i for i, name in enumerate(self.columns)}
+        f = lambda name: flags[:, index[name]]
+
+        domains = np.array(self.primary_domains, dtype=object)
+
+        # ── MIRROR ────────────────────────────────────────────────────
+        frictions = np.zeros((rows, len(rules)), dtype=bool)
+        for i, rule in enumerate(rules):
+            violated = f(rule.flag) if rule.violated_when else ~f(rule.flag)
+            if rule.applies_to is not None:
+                violated = violated & (domains == rule.applies_to)
+            frictions[:, i] = violated
+        self.frictions = frictions
+        self.total_violations = frictions.sum(axis=1)
+        critical = [i for i, rule in enumerate(rules) if rule.severity == "critical"]
+        self.critical_violations = frictions[:, critical].sum(axis=1)
+
+        # ── GATES ─────────────────────────────────────────────────────
+        gate_scores = np.zeros((rows, len(GATE_WEIGHTS)), dtype=np.int64)
+        for gate, weights in enumerate(GATE_WEIGHTS):
+            for flag, points in weights:
+                gate_scores[:, gate] += points * f(flag)
+
+        for i, data in enumerate(datas):
+            if data.get("retrieved_evidence"):
+                evidence = self.engine._evidence_boost(data)
+                if evidence is not None:
+                    gate_scores[i, 0] = min(100, gate_scores[i, 0] + evidence[0])
+        self.gate_scores = gate_scores
+
+        passed = gate_scores > 0
+        self.all_gates_pass = passed.all(axis=1)
+        self.origin_aware_pass = gate_scores[:, 3] == 100
+        self.survival = self.origin_aware_pass & passed[:, :3].all(axis=1)
+
+        # ── CONSEQUENCES (harm scale only) ────────────────────────────
+        # Static rules: affected domains become bits, tipping points a vector
+        universe = {}
+        for rule in rules:
+            if not rule.templated:
+                for domain in rule.affected_domains:
+                    universe.setdefault(_domain_key(domain), len(universe))
+        domain_bits = np.zeros(rows, dtype=np.int64)
+        tipping = np.zeros(rows, dtype=np.int64)
+        irreversible = np.zeros(rows, dtype=np.int64)
+        templated = [i for i, rule in enumerate(rules) if rule.templated]
+        engine = self.engine
+        for i, rule in enumerate(rules):
+            if rule.templated:
+                continue
+            bits = sum(1 << universe[_domain_key(d)] for d in rule.affected_domains)
+            domain_bits |= np.where(frictions[:, i], bits, 0)
+            friction = rule.friction()
+            if engine._identify_tipping_point(friction):
+                tipping += frictions[:, i]
+            if self._is_irreversible(friction):
+                irreversible += frictions[:, i]
+
+        if len(universe) <= 16:
+            popcount = np.array([bin(b).count("1") for b in range(1 << len(universe))],
+                                dtype=np.int64)
+            affected = popcount[domain_bits]
+        else:
+            affected = np.fromiter((bin(int(b)).count("1") for b in domain_bits),
+                                   dtype=np.int64, count=rows)
+
+        # Templated rules depend on row values: finish those rows in Python
+        if templated:
+            for row in np.flatnonzero(frictions[:, templated].any(axis=1)):
+                seen = {key for key, bit in universe.items() if domain_bits[row] >> bit & 1}
+                for i in templated:
+                    if frictions[row, i]:
+                        friction = rules[i].friction(datas[row])
+                        seen.update(_domain_key(d) for d in friction["affected_domains"])
+                        tipping[row] += engine._identify_tipping_point(friction)
+                        irreversible[row] += self._is_irreversible(friction)
+                affected[row] = len(seen)
+
+        self.affected_domains = affected
+        self.tipping_points = tipping
+        self.irreversible_consequences = irreversible
+        nf = self.total_violations
+        self.harm_scale = np.select(
+            [
+                (irreversible > 0) | (nf >= 4),
+                (nf >= 3) | (affected >= 3),
+                nf == 2,
+            ],
+            [3, 2, 1],
+            default=0,
+        )
+
+    # ───────────────────────────────────────────────────────────────────
+    # Per-row projections (built on demand)
+    # ───────────────────────────────────────────────────────────────────
+
+    def row(self, i: int) -> Dict:
+        """
+        Verdict summary for one row.
+
+        Returns:
+            Dict with verdict, survival, gate scores, violation counts,
+            critical issues and harm scale
+        """
+        survival = bool(self.survival[i])
+        return {
+            "query": self.queries[i],
+            "primary_domain": self.primary_domains[i],
+            "verdict": "SURVIVES The Criterion" if survival else "FAILS The Criterion",
+            "survival": survival,
+            "confidence": "high" if self.all_gates_pass[i] else "medium",
+            "gate_scores": {name: int(score) for name, score in zip(GATE_NAMES, self.gate_scores[i])},
+            "total_violations": int(self.total_violations[i]),
+            "critical_violations": int(self.critical_violations[i]),
+            "critical_issues": [
+                rule.friction(self.system_datas[i])["violation"]
+                for c, rule in enumerate(self.rules)
+                if rule.severity == "critical" and self.frictions[i, c]
+            ],
+            "harm_scale": HARM_SCALES[self.harm_scale[i]],
+        }
+
+    def rows(self) -> Iterator[Dict]:
+        """Yield row summaries one at a time"""
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def full(self, i: int) -> Dict:
+        """Complete reasoning output for one row (same as engine.reason)"""
+        return self.engine.reason(self.queries[i], self.system_datas[i])
+
+
+def reason_batch(engine, queries: Sequence[str], system_datas: Sequence[Dict]) -> BatchReasoningResult:
+    """
+    Evaluate a batch of queries with array operations.
+
+    Args:
+        engine: CriterionReasoningEngine supplying SCAN and the compiled rules
+        queries: Statements/proposals to analyze
+        system_datas: One system_data dict per query
+
+    Returns:
+        BatchReasoningResult
+    """
+    if len(queries) != len(system_datas):
+        raise ValueError(
+            f"reason_batch needs one system_data per query "
+            f"({len(queries)} queries, {len(system_datas)} system_data dicts)"
+        )
+    primary_domains = [engine.scan(q)["primary_system"] for q in queries]
+    return BatchReasoningResult(engine, queries, system_datas, primary_domains)
@@ -0,0 +1,308 @@
+"""
+Stage DAG: run pipeline stages concurrently along their dependencies
+
+The reasoning pipeline is a graph, not a sequence. The keyword phases only
+read the query, MIRROR and GATES only read system_data, and the expensive
+external steps (Ollama extraction, Chroma retrieval) only read the query.
+StageGraph declares the stages and what they consume; run() starts every
+stage as soon as its inputs exist, so end-to-end latency is the critical
+path instead of the sum of all stages.
+
+Stages that block on I/O run on a thread pool. Cheap in-process stages
+(`blocking=False`) run inline on the scheduling thread, where a thread
+hand-off would cost more than the stage itself; under the GIL threads only
+help stages that wait.
+
+Each stage function receives its dependencies as keyword arguments:
+
+    graph = StageGraph(inputs=("query",))
+    graph.add("extraction", lambda query: bridge.extract_semantic_meaning(query),
+              deps=("query",), blocking=True)
+    graph.add("features", lambda query: engine.analyze_query(query), deps=("query",))
+    run = graph.run({"query": "..."})
+    run["extraction"], run.timings, run.critical_path()
+
+    for name, result in graph.stream({"query": "..."}):
+        ...   # each stage as soon as it completes
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+
+
+class Stage:
+    """One node of a StageGraph"""
+
+    __slots__ = ("name", "func", "deps", "blocking")
+
+    def __init__(self, name: str, func: Callable[..., Any], deps: Tuple[str, ...],
+                 blocking: bool):
+        self.name = name
+        self.func = func
+        self.deps = deps
+        self.blocking = blocking
+
+
+class StageTiming:
+    """When and where a stage ran (seconds relative to the run start)"""
+
+    __slots__ = ("stage", "start", "end", "thread")
+
+    def __init__(self, stage: str, start: float, end: float, thread: str):
+        self.stage = stage
+        self.start = start
+        self.end = end
+        self.thread = thread
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+    def to_dict(self) -> Dict:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "seconds": self.seconds,
+            "thread": self.thread
+        }
+
+
+class DagRun:
+    """Results and per-stage timings of one StageGraph.run()"""
+
+    def __init__(self, graph: "StageGraph", results: Dict[str, Any],
+                 timings: Dict[str, StageTiming], wall_seconds: float):
+        self.graph = graph
+        self.results = results
+        self.timings = timings
+        self.wall_seconds = wall_seconds
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name]
+
+    def critical_path(self) -> List[str]:
+        """Chain of stages with the largest summed duration"""
+        best: Dict[str, Tuple[float, List[str]]] = {}
+        for name in self.graph.order():
+            timing = self.timings.get(name)
+            if timing is None:
+                continue
+            prior = max(
+                (best[dep] for dep in self.graph.stages[name].deps if dep in best),
+                key=lambda entry: entry[0],
+                default=(0.0, [])
+            )
+            best[name] = (prior[0] + timing.seconds, prior[1] + [name])
+        if not best:
+            return []
+        return max(best.values(), key=lambda entry: entry[0])[1]
+
+    def stage_seconds(self) -> Dict[str, float]:
+        """{stage: duration} in completion order"""
+        return {name: timing.seconds for name, timing in self.timings.items()}
+
+    def to_dict(self) -> Dict:
+        """Timing report (results are not included)"""
+        return {
+            "wall_seconds": self.wall_seconds,
+            "sequential_seconds": sum(t.seconds for t in self.timings.values()),
+            "critical_path": self.critical_path(),
+            "stages": {name: timing.to_dict() for name, timing in self.timings.items()}
+        }
+
+
+class StageGraph:
+    """
+    Directed acyclic graph of named stages with a concurrent scheduler.
+    """
+
+    def __init__(self, inputs: Iterable[str] = ()):
+        """
+        Args:
+            inputs: Names supplied to run() instead of computed by a stage
+        """
+        self.inputs = tuple(inputs)
+        self.stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: Callable[..., Any], deps: Iterable[str] = (),
+            blocking: bool = False) -> "StageGraph":
+        """
+        Add (or replace) a stage.
+
+        Args:
+            name: Stage name; its result is stored under this name
+            func: Called with each dependency result as a keyword argument
+            deps: Names of inputs or stages this stage consumes
+            blocking: Run on the thread pool (I/O-bound stages)
+
+        Returns:
+            self, for chaining
+        """
+        self.stages[name] = Stage(name, func, tuple(deps), blocking)
+        return self
+
+    def order(self) -> List[str]:
+        """
+        Stage names in a dependency-respecting order.
+
+        Raises:
+            ValueError: Unknown dependency or a cycle
+        """
+        known = set(self.inputs) | set(self.stages)
+        for stage in self.stages.values():
+            for dep in stage.deps:
+                if dep not in known:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown '{dep}'")
+
+        ordered: List[str] = []
+        state: Dict[str, int] = {}
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == 2 or name not in self.stages:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Stage cycle: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in self.stages[name].deps:
+                visit(dep, path + (name,))
+            state[name] = 2
+            ordered.append(name)
+
+        for name in self.stages:
+            visit(name, ())
+        return ordered
+
+    def run(self, inputs: Dict[str, Any], max_workers: Optional[int] = None,
+            targets: Optional[Iterable[str]] = None) -> DagRun:
+        """
+        Execute the graph.
+
+        Args:
+            inputs: Values for the graph inputs
+            max_workers: Thread pool size for blocking stages
+                         (default: number of blocking stages)
+            targets: Only run the stages these depend on (default: all)
+
+        Returns:
+            DagRun with every stage result and timing
+
+        Raises:
+            ValueError: Missing inputs, unknown dependencies or a cycle
+            Exception: The first exception raised by a stage (stages not yet
+                       started are skipped)
+        """
+        stages = self.stream(inputs, max_workers, targets)
+        while True:
+            try:
+                next(stages)
+            except StopIteration as finished:
+                return finished.value
+
+    def stream(self, inputs: Dict[str, Any], max_workers: Optional[int] = None,
+               targets: Optional[Iterable[str]] = None
+               ) -> Generator[Tuple[str, Any], None, DagRun]:
+        """
+        Execute the graph, yielding each stage as soon as it completes.
+
+        Blocking stages keep running while the consumer handles a yielded
+        stage; inline stages wait for the consumer. Closing the generator
+        early cancels stages not yet started and waits for running ones.
+
+        Args:
+            inputs, max_workers, targets: As for run()
+
+        Yields:
+            (stage name, result) in completion order
+
+        Returns:
+            DagRun (the generator's return value, as from run())
+
+        Raises:
+            Same as run()
+        """
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise ValueError(f"Missing graph inputs: {', '.join(missing)}")
+        order = self.order()
+        if targets is not None:
+            order = self._needed(order, targets)
+
+        results: Dict[str, Any] = dict(inputs)
+        timings: Dict[str, StageTiming] = {}
+        remaining = {
+            name: {dep for dep in self.stages[name].deps if dep not in results}
+            for name in order
+        }
+        dependents: Dict[str, List[str]] = {}
+        for name in order:
+            for dep in remaining[name]:
+                dependents.setdefault(dep, []).append(name)
+
+        ready = [name for name in order if not remaining[name]]
+        blocking = sum(1 for name in order if self.stages[name].blocking)
+        origin = time.perf_counter()
+
+        def execute(stage: Stage) -> Any:
+            start = time.perf_counter()
+            try:
+                return stage.func(**{dep: results[dep] for dep in stage.deps})
+            finally:
+                timings[stage.name] = StageTiming(
+                    stage.name, start - origin, time.perf_counter() - origin,
+                    threading.current_thread().name
+                )
+
+        def complete(name: str):
+            for dependent in dependents.get(name, ()):
+                waiting = remaining[dependent]
+                waiting.discard(name)
+                if not waiting:
+                    ready.append(dependent)
+
+        pool = ThreadPoolExecutor(max_workers=max_workers or max(1, blocking),
+                                  thread_name_prefix="criterion-stage") if blocking else None
+        running: Dict[Future, str] = {}
+        try:
+            while ready or running:
+                # Start blocking stages first so their waits overlap the inline work
+                ready.sort(key=lambda name: not self.stages[name].blocking)
+                while ready:
+                    name = ready.pop(0)
+                    stage = self.stages[name]
+                    if stage.blocking:
+                        running[pool.submit(execute, stage)] = name
+                    else:
+                        results[name] = execute(stage)
+                        complete(name)
+                        yield name, results[name]
+                        break
+                if ready or not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    complete(name)
+                    yield name, results[name]
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        return DagRun(self, results, timings, time.perf_counter() - origin)
+
+    def _needed(self, order: List[str], targets: Iterable[str]) -> List[str]:
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in needed or name not in self.stages:
+                continue
+            needed.add(name)
+            stack.extend(self.stages[name].deps)
+        return [name for name in order if name in needed]
@@ -0,0 +1,386 @@
+"""
+Extraction Cache: persistent SQLite cache of LLM-extracted system_data
+
+A deepseek-r1 extraction takes tens of seconds on CPU, and the same queries
+come back across runs. ExtractionCache keeps the parsed system_data of every
+successful extraction in a SQLite file (extractions.sqlite in the cache
+directory, WAL mode) under a key over
+
+    (model, prompt template version, temperature, normalized query)
+
+so a repeated query costs one indexed lookup instead of a generation, and
+entries survive restarts. The prompt version is the bridge's
+EXTRACTION_PROMPT_VERSION plus a hash of the template text, so editing
+the prompt invalidates old entries without a manual bump. Queries are
+normalized by Unicode NFKC, whitespace collapsing and case folding.
+Failed extractions (the conservative default) are never cached.
+
+The cache is bounded by max_entries and/or max_bytes of stored JSON; beyond
+either, the least recently used entries are evicted. Last-use times are
+buffered in memory and written with the next put, flush() or close(), so a
+hit does not write to disk.
+
+Usage:
+    from evaluation.extraction_cache import ExtractionCache
+
+    cache = ExtractionCache("cache/extractions", max_entries=50_000)
+    bridge = OllamaLLMBridge(cache=cache)
+    bridge.extract_semantic_meaning(query)      # generation, then stored
+    bridge.extract_semantic_meaning(query)      # lookup
+    cache.stats()                               # {"hits": 1, "misses": 1, "hit_rate": 0.5, ...}
+
+    cache.export("extractions.jsonl")           # bulk copy to another box
+    ExtractionCache("other/dir").warm("extractions.jsonl")
+
+    python -m evaluation.extraction_cache stats cache/extractions
+    python -m evaluation.extraction_cache export cache/extractions out.jsonl
+    python -m evaluation.extraction_cache warm cache/extractions out.jsonl
+    python -m evaluation.extraction_cache warm cache/extractions --queries queries.txt
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from evaluation.result_cache import fingerprint
+
+
+# Default cache location
+DEFAULT_CACHE_DIR = str(Path(__file__).parent.parent / "cache" / "extractions")
+
+CACHE_FILE = "extractions.sqlite"
+
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    query TEXT NOT NULL,
+    system_data TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS extractions_last_used ON extractions (last_used);
+"""
+
+# Touched keys buffered before their last-use times are written
+_TOUCH_BATCH = 256
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a query for extraction keys.
+
+    Unlike result cache keys, which hold the exact query, case and spacing are
+    folded: they do not change what the model extracts.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query)).strip().casefold()
+
+
+def extraction_key(model: str, prompt_version: str, temperature: float, query: str) -> str:
+    """Cache key of one extraction request (query is normalized here)"""
+    return fingerprint([model, prompt_version, float(temperature), normalize_query(query)])
+
+
+class ExtractionCache:
+    """
+    Size-bounded, persistent LRU cache of extraction results.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: Optional[int] = 100_000,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: Cache directory (default: cache/extractions/)
+            max_entries: Entry limit (None: unbounded)
+            max_bytes: Limit on the stored system_data JSON in bytes (None: unbounded)
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = directory or DEFAULT_CACHE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = os.path.join(self.directory, CACHE_FILE)
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+        self._touched: Dict[str, float] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.evictions = 0
+
+    # ───────────────────────────────────────────────────────────────────
+    # Lookup and store
+    # ───────────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached system_data for key (a fresh dict), or None on a miss"""
+        with self._lock:
+            row = self._db.execute("SELECT system_data FROM extractions WHERE key = ?",
+                                   (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._write_touches()
+                self._db.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, system_data: Dict, model: str, prompt_version: str,
+            temperature: float, query: str):
+        """Store one extraction (replacing an entry with the same key)"""
+        text = json.dumps(system_data, ensure_ascii=False, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            self._write_touches()
+            self._db.execute(
+                "INSERT OR REPLACE INTO extractions"
+                " (key, model, prompt_version, temperature, query, system_data, size,"
+                " created, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model, prompt_version, float(temperature), normalize_query(query),
+                 text, len(text.encode("utf-8")), now, now)
+            )
+            self.puts += 1
+            self._evict()
+            self._db.commit()
+
+    def _write_touches(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE extractions SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries / max_bytes"""
+        if self.max_entries is not None:
+            count = self._db.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self._delete_oldest(excess)
+        if self.max_bytes is not None:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+            if total > self.max_bytes:
+                dropped, freed = [], 0
+                for key, size in self._db.execute(
+                    "SELECT key, size FROM extractions ORDER BY last_used"
+                ):
+                    if total - freed <= self.max_bytes:
+                        break
+                    dropped.append((key,))
+                    freed += size
+                self._db.executemany("DELETE FROM extractions WHERE key = ?", dropped)
+                self.evictions += len(dropped)
+
+    def _delete_oldest(self, count: int):
+        self._db.execute(
+            "DELETE FROM extractions WHERE key IN"
+            " (SELECT key FROM extractions ORDER BY last_used LIMIT ?)", (count,)
+        )
+        self.evictions += count
+
+    def flush(self):
+        """Write buffered last-use times"""
+        with self._lock:
+            self._write_touches()
+            self._db.commit()
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._touched.clear()
+            self._db.execute("DELETE FROM extractions")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._db.close()
+
+    def __enter__(self) -> "ExtractionCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+    # ───────────────────────────────────────────────────────────────────
+    # Bulk export / warm
+    # ───────────────────────────────────────────────────────────────────
+
+    def entries(self) -> Iterator[Dict]:
+        """Every entry as an export record, oldest first"""
+        with self._lock:
+            self._write_touches()
+            rows = self._db.execute(
+                "SELECT model, prompt_version, temperature, query, system_data, created, hits"
+                " FROM extractions ORDER BY created"
+            ).fetchall()
+        for model, prompt_version, temperature, query, system_data, created, hits in rows:
+            yield {
+                "model": model,
+                "prompt_version": prompt_version,
+                "temperature": temperature,
+                "query": query,
+                "system_data": json.loads(system_data),
+                "created": created,
+                "hits": hits
+            }
+
+    def export(self, path: str) -> int:
+        """
+        Write every entry to a JSONL file.
+
+        Returns:
+            Number of entries written
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self.entries():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def warm(self, source: Union[str, Iterable[Dict]], overwrite: bool = False) -> int:
+        """
+        Bulk-load export records (one transaction).
+
+        Args:
+            source: JSONL file written by export(), or an iterable of records
+            overwrite: Replace entries that already exist
+
+        Returns:
+            Number of entries loaded
+        """
+        records: Iterable[Dict]
+        if isinstance(source, str):
+            with open(source, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        else:
+            records = source
+        verb = "INSERT OR REPLACE" if overwrite else "INSERT OR IGNORE"
+        now = time.time()
+        loaded = 0
+        with self._lock:
+            for record in records:
+                text = json.dumps(record["system_data"], ensure_ascii=False,
+                                  separators=(",", ":"))
+                key = extraction_key(record["model"], record["prompt_version"],
+                                     record["temperature"], record["query"])
+                cursor = self._db.execute(
+                    f"{verb} INTO extractions"
+                    " (key, model, prompt_version, temperature, query, system_data, size,"
+                    " created, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, record["model"], record["prompt_version"], float(record["temperature"]),
+                     normalize_query(record["query"]), text, len(text.encode("utf-8")),
+                     record.get("created", now), now)
+                )
+                loaded += cursor.rowcount
+            self._evict()
+            self._db.commit()
+        return loaded
+
+    # ───────────────────────────────────────────────────────────────────
+    # Statistics
+    # ───────────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, this process's hit/miss counters and lifetime hits"""
+        with self._lock:
+            self._write_touches()
+            self._db.commit()
+            entries, size, lifetime_hits = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM extractions"
+            ).fetchone()
+            models = dict(self._db.execute(
+                "SELECT model, COUNT(*) FROM extractions GROUP BY model"
+            ).fetchall())
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "entries": entries,
+                "bytes": size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "models": models,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "puts": self.puts,
+                "evictions": self.evictions,
+                "lifetime_hits": lifetime_hits
+            }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m evaluation.extraction_cache",
+        description="Inspect, export or warm the persistent extraction cache"
+    )
+    parser.add_argument("command", choices=("stats", "export", "warm", "clear"))
+    parser.add_argument("directory", help="Cache directory")
+    parser.add_argument("path", nargs="?", help="JSONL file (export: output, warm: input)")
+    parser.add_argument("--queries", default=None,
+                        help="warm: text file of queries (one per line) to extract now")
+    parser.add_argument("--model", default="deepseek-r1:8b", help="warm --queries: model")
+    parser.add_argument("--base-url", default="http://localhost:11434",
+                        help="warm --queries: Ollama server URL")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="warm: replace existing entries")
+    args = parser.parse_args(argv)
+
+    with ExtractionCache(args.directory) as cache:
+        if args.command == "stats":
+            print(json.dumps(cache.stats(), indent=2))
+        elif args.command == "export":
+            if not args.path:
+                parser.error("export needs an output path")
+            print(f"Exported {cache.export(args.path)} entries -> {args.path}")
+        elif args.command == "clear":
+            cache.clear()
+            print(f"Cleared {cache.path}")
+        elif args.queries:
+            from evaluation.llm_integration import OllamaLLMBridge
+            bridge = OllamaLLMBridge(args.model, args.base_url, cache=cache)
+            with open(args.queries, encoding="utf-8") as f:
+                queries = [line.strip() for line in f if line.strip()]
+            for query in queries:
+                bridge.extract_semantic_meaning(query)
+            stats = cache.stats()
+            print(f"Warmed {len(queries)} queries: {stats['hits']} already cached, "
+                  f"{stats['puts']} extracted")
+        else:
+            if not args.path:
+                parser.error("warm needs a JSONL path or --queries")
+            print(f"Loaded {cache.warm(args.path, args.overwrite)} entries from {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
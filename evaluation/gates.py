@@ -1,16 +1,34 @@
+# (flag, points) pairs scored by each gate below, in gate order (Source
+# Integrity, Structural Consistency, Mediation Zeroing, Origin Aware).
+# The vectorized batch path scores from the same table.
+GATE_WEIGHTS = (
+    (("accepts_raw_truth", 50), ("requires_evidence_or_revelation", 50)),
+    (("grounds_causality", 50), ("rejects_random_moral_emergence", 50)),
+    (("minimizes_human_projection", 50), ("rejects_secular_humanism", 50)),
+    (("acknowledges_transcendent_source", 100),),
+)
+
+# system_data flags read by the gates below, in reading order
+GATE_FLAGS = tuple(flag for weights in GATE_WEIGHTS for flag, _ in weights)
+
+
+def _score(system, weights):
+    """Sum of the points of the flags set in system"""
+    score = 0
+
+    for flag, points in weights:
+        if system.get(flag):
+            score += points
+
+    return score
+
+
 def source_integrity_gate(system):
     """
     Evaluates whether raw truth is preserved without reduction,
     reinterpretation, or convenience distortion.
     """
-    score = 0
-
-    if system.get("accepts_raw_truth"):
-        score += 50
-    if system.get("requires_evidence_or_revelation"):
-        score += 50
-
-    return score
+    return _score(system, GATE_WEIGHTS[0])
 
 
 def structural_consistency_gate(system):
@@ -18,14 +36,7 @@ def structural_consistency_gate(system):
     Evaluates whether causality and moral order are grounded
     in a non-contingent source rather than chance or emergence.
     """
-    score = 0
-
-    if system.get("grounds_causality"):
-        score += 50
-    if system.get("rejects_random_moral_emergence"):
-        score += 50
-
-    return score
+    return _score(system, GATE_WEIGHTS[1])
 
 
 def mediation_zeroing_gate(system):
@@ -33,14 +44,7 @@ def mediation_zeroing_gate(system):
     Evaluates whether human preference is treated as derivative,
     not sovereign over truth.
     """
-    score = 0
-
-    if system.get("minimizes_human_projection"):
-        score += 50
-    if system.get("rejects_secular_humanism"):
-        score += 50
-
-    return score
+    return _score(system, GATE_WEIGHTS[2])
 
 
 def origin_aware_gate(system):
@@ -48,4 +52,4 @@ def origin_aware_gate(system):
     Evaluates recognition of a self-authenticating,
     non-contingent transcendent source.
     """
-    return 100 if system.get("acknowledges_transcendent_source") else 0
+    return _score(system, GATE_WEIGHTS[3])
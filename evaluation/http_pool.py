@@ -0,0 +1,271 @@
+"""
+HTTP Pool: shared keep-alive sessions, cached health checks, jittered retries
+
+Talking to a local Ollama server used to cost, per query, a GET /api/tags
+(every OllamaLLMBridge() checked the server) and a fresh TCP connection
+(module-level requests.post). This module keeps that state per base URL for
+the whole process:
+
+- session_for(base_url, pool_size) returns one requests.Session per base
+  URL whose connection pool keeps pool_size keep-alive connections; asking
+  again with a larger pool_size grows it. urllib3's pool is thread-safe, so
+  the extraction threads of a batch share it.
+- HEALTH caches each server's /api/tags listing for a TTL (60 s by default);
+  concurrent checks of the same server wait for one request instead of
+  sending their own. Failed checks are not cached.
+- RetryPolicy retries transient failures only (connection refused/reset,
+  connect timeouts, HTTP 408/429/502/503/504) with full-jitter exponential
+  backoff, honouring Retry-After up to max_delay. Read timeouts are not
+  retried: the server may still be generating, and a retry would queue the
+  same work twice.
+
+Usage:
+    from evaluation import http_pool
+
+    session = http_pool.session_for("http://localhost:11434", pool_size=8)
+    tags = http_pool.HEALTH.tags("http://localhost:11434", session)   # cached
+    response = http_pool.RetryPolicy(attempts=3).call(
+        lambda: session.post(url, json=payload, timeout=300)
+    )
+    http_pool.close_all()
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Default keep-alive connections per base URL
+DEFAULT_POOL_SIZE = 4
+
+# Statuses worth another attempt: timeout, rate limit, gateway, overload
+TRANSIENT_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+
+def _normalize(base_url: str) -> str:
+    return base_url.rstrip("/").lower()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Sessions
+# ═══════════════════════════════════════════════════════════════════
+
+_sessions: Dict[str, Tuple[requests.Session, int]] = {}
+_sessions_lock = threading.Lock()
+
+
+def session_for(base_url: str, pool_size: Optional[int] = None) -> requests.Session:
+    """
+    The shared keep-alive session for a server.
+
+    Args:
+        base_url: Server URL, e.g. "http://localhost:11434"
+        pool_size: Connections to keep open (default DEFAULT_POOL_SIZE);
+                   the pool grows to the largest size asked for
+
+    Returns:
+        requests.Session (shared: do not close it, use close_all())
+    """
+    pool_size = max(1, pool_size or DEFAULT_POOL_SIZE)
+    key = _normalize(base_url)
+    with _sessions_lock:
+        entry = _sessions.get(key)
+        if entry is not None and entry[1] >= pool_size:
+            return entry[0]
+        session = entry[0] if entry is not None else requests.Session()
+        # Retries are done by RetryPolicy, which knows which failures are transient
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _sessions[key] = (session, pool_size)
+        return session
+
+
+def close_all():
+    """Close every shared session and forget the cached health checks"""
+    with _sessions_lock:
+        for session, _ in _sessions.values():
+            session.close()
+        _sessions.clear()
+    HEALTH.clear()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Health checks
+# ═══════════════════════════════════════════════════════════════════
+
+class HealthCache:
+    """
+    /api/tags listings per server, reused for ttl seconds.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self.checks = 0
+        self.hits = 0
+        self._entries: Dict[str, Tuple[float, Dict]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, base_url: str, ttl: Optional[float] = None) -> Optional[Dict]:
+        """Listing still within its TTL, or None"""
+        entry = self._entries.get(_normalize(base_url))
+        ttl = self.ttl if ttl is None else ttl
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            self.hits += 1
+            return entry[1]
+        return None
+
+    def store(self, base_url: str, tags: Dict):
+        self._entries[_normalize(base_url)] = (time.monotonic(), tags)
+
+    def tags(self, base_url: str, session: Optional[requests.Session] = None,
+             ttl: Optional[float] = None, timeout: float = 5) -> Dict:
+        """
+        The server's /api/tags listing, fetched at most once per TTL.
+
+        Raises:
+            ConnectionError: Server unreachable or not answering 200
+        """
+        tags = self.cached(base_url, ttl)
+        if tags is not None:
+            return tags
+        key = _normalize(base_url)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another thread may have checked while this one waited
+            tags = self.cached(base_url, ttl)
+            if tags is not None:
+                return tags
+            session = session or session_for(base_url)
+            self.checks += 1
+            try:
+                response = session.get(f"{base_url}/api/tags", timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(
+                    f"Cannot connect to Ollama at {base_url}\n"
+                    "Make sure Ollama is running. Start with: ollama serve"
+                ) from e
+            if response.status_code != 200:
+                raise ConnectionError(f"Ollama returned status {response.status_code}")
+            tags = response.json()
+            self.store(base_url, tags)
+            return tags
+
+    def invalidate(self, base_url: str):
+        """Force the next check of a server to ask it again"""
+        self._entries.pop(_normalize(base_url), None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Process-wide health cache used by OllamaLLMBridge
+HEALTH = HealthCache()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Retries
+# ═══════════════════════════════════════════════════════════════════
+
+class RetryPolicy:
+    """
+    Full-jitter exponential backoff for transient failures only.
+    """
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            attempts: Tries in total (1: no retries)
+            base_delay: Backoff scale in seconds; try n waits up to base_delay * 2**n
+            max_delay: Cap of one wait (also of an honoured Retry-After)
+            rng: Random source of the jitter
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+        self.retries = 0
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Wait before try attempt + 1 (full jitter; Retry-After if given)"""
+        if retry_after:
+            try:
+                return min(self.max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def is_transient(error: BaseException) -> bool:
+        """
+        Connection refused/reset/dropped or connect timeout (not a read timeout).
+
+        For requests: its ConnectionError (which includes ConnectTimeout).
+        For async_http / asyncio: any OSError except timeouts, e.g. the plain
+        OSError("Multiple exceptions: ...") when every address of a
+        dual-stack host refuses, or the ConnectionError of a cut-off response.
+        """
+        if isinstance(error, requests.exceptions.RequestException):
+            # RequestException is an OSError; only its connection failures qualify
+            return isinstance(error, requests.exceptions.ConnectionError)
+        return isinstance(error, OSError) and not isinstance(error, TimeoutError)
+
+    def call(self, send: Callable[[], requests.Response],
+             sleep: Callable[[float], None] = time.sleep) -> requests.Response:
+        """
+        Call send() until it returns a non-transient response or tries run out.
+
+        Returns:
+            The last response (its status may still be transient)
+
+        Raises:
+            The last transient exception, or any non-transient one at once
+        """
+        for attempt in range(self.attempts):
+            last = attempt == self.attempts - 1
+            try:
+                response = send()
+            except Exception as e:
+                if last or not self.is_transient(e):
+                    raise
+                sleep(self.delay(attempt))
+            else:
+                if last or response.status_code not in TRANSIENT_STATUSES:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+                sleep(self.delay(attempt, retry_after))
+            self.retries += 1
+        raise AssertionError("unreachable")
+
+    async def call_async(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        call() for coroutines returning an async_http.AsyncResponse (or a
+        StreamingResponse, which is closed before a retry).
+        """
+        for attempt in range(self.attempts):
+            last = attempt == self.attempts - 1
+            try:
+                response = await send()
+            except Exception as e:
+                if last or not self.is_transient(e):
+                    raise
+                await asyncio.sleep(self.delay(attempt))
+            else:
+                if last or response.status not in TRANSIENT_STATUSES:
+                    return response
+                if hasattr(response, "aclose"):
+                    await response.aclose()
+                await asyncio.sleep(self.delay(attempt, response.headers.get("retry-after")))
+            self.retries += 1
+        raise AssertionError("unreachable")
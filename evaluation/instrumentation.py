@@ -0,0 +1,363 @@
+"""
+Instrumentation: per-stage latency and allocation metrics
+
+The reasoning phases and the external calls are marked as stages:
+
+    SCAN           keyword pass over the query (QueryAnalyzer, shared with EXTRACT)
+    EXTRACT        assumption extraction
+    MIRROR         compiled axiom rules
+    GATES          survival gates
+    CONSEQUENCES   consequence tracing
+    VERDICT_TABLE  precomputed MIRROR + GATES + CONSEQUENCES lookup
+    VERDICT        verdict rendering
+    SCAFFOLD       CoT scaffold rendering
+    OLLAMA         /api/generate call (sync and async)
+    OLLAMA_FIRST_TOKEN / OLLAMA_FIRST_FIELD
+                   streaming extraction: time from the request to the first
+                   token / the first complete field of the JSON object
+    CHROMA         VectorDBBuilder.query
+
+Nothing is recorded until enable() is called. While disabled, a marked stage
+costs one attribute check. When enabled, each stage call records wall time
+and thread CPU time into fixed log-scale histograms, counts calls and
+errors, optionally records tracemalloc deltas, and is passed to every
+registered hook.
+
+Stage times are inclusive: a stage that calls another (e.g. VERDICT_TABLE
+filling a slot) includes the nested stage's time. CPU time is not recorded
+for async stages, whose thread time would include other tasks.
+
+Usage:
+    from evaluation import instrumentation
+
+    instrumentation.enable(trace_allocations=False)
+    pipeline.evaluate(query, system_data)
+    instrumentation.INSTRUMENTATION.snapshot()["MIRROR"]["wall_seconds"]["p99"]
+    instrumentation.INSTRUMENTATION.write_prometheus("/var/lib/node_exporter/criterion.prom")
+    instrumentation.INSTRUMENTATION.write_json("logs/stage_metrics.json")
+
+    instrumentation.INSTRUMENTATION.add_hook(lambda event: print(event.stage, event.wall))
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Histogram bucket upper bounds in seconds (1-2.5-5 series, 1 µs .. 100 s)
+BUCKETS: Tuple[float, ...] = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0
+)
+
+METRIC_PREFIX = "criterion_stage"
+
+
+class Histogram:
+    """Fixed-bucket histogram with quantile estimates"""
+
+    __slots__ = ("bounds", "counts", "count", "total", "maximum")
+
+    def __init__(self, bounds: Sequence[float] = BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket: +Inf
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate (linear within the bucket, capped at the observed maximum)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.maximum
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(estimate, self.maximum)
+            seen += count
+        return self.maximum
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.maximum,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99)
+        }
+
+
+class StageEvent:
+    """One finished stage call, as passed to hooks"""
+
+    __slots__ = ("stage", "wall", "cpu", "alloc_bytes", "error")
+
+    def __init__(self, stage: str, wall: float, cpu: Optional[float],
+                 alloc_bytes: Optional[int], error: Optional[BaseException]):
+        self.stage = stage
+        self.wall = wall
+        self.cpu = cpu
+        self.alloc_bytes = alloc_bytes
+        self.error = error
+
+
+class StageStats:
+    """Accumulated metrics of one stage"""
+
+    __slots__ = ("wall", "cpu", "calls", "errors", "alloc_bytes")
+
+    def __init__(self):
+        self.wall = Histogram()
+        self.cpu = Histogram()
+        self.calls = 0
+        self.errors = 0
+        self.alloc_bytes = 0
+
+    def record(self, event: StageEvent):
+        self.calls += 1
+        self.wall.observe(event.wall)
+        if event.cpu is not None:
+            self.cpu.observe(event.cpu)
+        if event.error is not None:
+            self.errors += 1
+        if event.alloc_bytes is not None:
+            self.alloc_bytes += event.alloc_bytes
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "wall_seconds": self.wall.to_dict(),
+            "cpu_seconds": self.cpu.to_dict(),
+            "alloc_bytes": self.alloc_bytes
+        }
+
+
+class _Span:
+    """Context manager timing one stage call"""
+
+    __slots__ = ("owner", "stage", "measure_cpu", "wall", "cpu", "alloc")
+
+    def __init__(self, owner: "Instrumentation", stage: str, measure_cpu: bool = True):
+        self.owner = owner
+        self.stage = stage
+        self.measure_cpu = measure_cpu
+
+    def __enter__(self) -> "_Span":
+        self.alloc = tracemalloc.get_traced_memory()[0] if self.owner.trace_allocations else None
+        self.cpu = time.thread_time() if self.measure_cpu else None
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, kind, error, traceback) -> bool:
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu if self.cpu is not None else None
+        alloc = None
+        if self.alloc is not None and tracemalloc.is_tracing():
+            alloc = tracemalloc.get_traced_memory()[0] - self.alloc
+        self.owner.record(StageEvent(self.stage, wall, cpu, alloc, error))
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, kind, error, traceback) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Instrumentation:
+    """
+    Stage metrics registry with hooks and Prometheus/JSON export.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_allocations = False
+        self.hooks: List[Callable[[StageEvent], None]] = []
+        self._stages: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    # ───────────────────────────────────────────────────────────────────
+    # Control
+    # ───────────────────────────────────────────────────────────────────
+
+    def enable(self, trace_allocations: bool = False):
+        """
+        Start recording.
+
+        Args:
+            trace_allocations: Also record tracemalloc deltas (starts
+                               tracemalloc if needed; slows everything down)
+        """
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif not trace_allocations and self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.trace_allocations = trace_allocations
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording (collected metrics are kept)"""
+        self.enabled = False
+        self.trace_allocations = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        """Drop collected metrics"""
+        with self._lock:
+            self._stages.clear()
+
+    def add_hook(self, hook: Callable[[StageEvent], None]):
+        """Call hook(StageEvent) after every recorded stage call"""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[StageEvent], None]):
+        self.hooks.remove(hook)
+
+    # ───────────────────────────────────────────────────────────────────
+    # Recording
+    # ───────────────────────────────────────────────────────────────────
+
+    def span(self, stage: str, measure_cpu: bool = True):
+        """Context manager recording one call of a stage (no-op while disabled)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, measure_cpu)
+
+    def record(self, event: StageEvent):
+        with self._lock:
+            stats = self._stages.get(event.stage)
+            if stats is None:
+                stats = self._stages[event.stage] = StageStats()
+            stats.record(event)
+        for hook in self.hooks:
+            hook(event)
+
+    def instrumented(self, stage: str) -> Callable:
+        """
+        Decorator marking a function (or coroutine function) as a stage.
+        """
+        def decorate(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    with _Span(self, stage, measure_cpu=False):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    # ───────────────────────────────────────────────────────────────────
+    # Export
+    # ───────────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """{stage: {"calls", "errors", "wall_seconds", "cpu_seconds", "alloc_bytes"}}"""
+        with self._lock:
+            return {stage: stats.to_dict() for stage, stats in sorted(self._stages.items())}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps({"generated_at": time.time(), "stages": self.snapshot()}, **kwargs)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (histograms, counters, a gauge)"""
+        lines = []
+        with self._lock:
+            stages = sorted(self._stages.items())
+            for metric, kind, help_text in (
+                ("wall_seconds", "histogram", "Wall time per stage call"),
+                ("cpu_seconds", "histogram", "Thread CPU time per stage call"),
+            ):
+                name = f"{METRIC_PREFIX}_{metric}"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for stage, stats in stages:
+                    histogram = stats.wall if metric == "wall_seconds" else stats.cpu
+                    cumulative = 0
+                    for bound, count in zip(histogram.bounds + (float("inf"),), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total!r}')
+                    lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+            for metric, kind, help_text, attribute in (
+                ("calls_total", "counter", "Stage calls", "calls"),
+                ("errors_total", "counter", "Stage calls that raised", "errors"),
+                # Net tracemalloc deltas can be negative: a gauge, not a counter
+                ("alloc_bytes", "gauge", "Net traced allocation of stage calls", "alloc_bytes"),
+            ):
+                name = f"{METRIC_PREFIX}_{metric}"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for stage, stats in stages:
+                    lines.append(f'{name}{{stage="{stage}"}} {getattr(stats, attribute)}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Write to_prometheus() atomically (for a node_exporter textfile collector)"""
+        _write_atomic(path, self.to_prometheus())
+
+    def write_json(self, path: str):
+        """Write to_json() atomically"""
+        _write_atomic(path, self.to_json(indent=2))
+
+
+def _write_atomic(path: str, text: str):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp.{os.getpid()}"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temporary, path)
+
+
+# Process-wide instrumentation used by the marked stages
+INSTRUMENTATION = Instrumentation()
+
+instrumented = INSTRUMENTATION.instrumented
+span = INSTRUMENTATION.span
+enable = INSTRUMENTATION.enable
+disable = INSTRUMENTATION.disable
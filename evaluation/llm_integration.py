@@ -20,13 +20,86 @@ Usage:
     from evaluation.pipeline import CriterionPipeline
     pipeline = CriterionPipeline()
     result = pipeline.evaluate(query, system_data)
+
+Bridges share one keep-alive connection pool per base URL and a cached
+server check (see evaluation/http_pool.py), so building a bridge per query
+costs neither a TCP handshake nor a GET /api/tags round-trip after the first.
+
+With streaming=True the bridge reads Ollama's token stream instead of
+waiting for the whole generation: the <think> block is skipped, the JSON
+object is detected as it arrives, and the connection is closed as soon as
+the object is complete, which stops the generation (no tail tokens). The
+timings of the last stream are in bridge.last_stream (StreamStats), and
+time to first token / first field are recorded as the OLLAMA_FIRST_TOKEN
+and OLLAMA_FIRST_FIELD stages when instrumentation is enabled.
+
+    bridge = OllamaLLMBridge(streaming=True)
+    system_data = bridge.extract_semantic_meaning(query)
+    bridge.last_stream.to_dict()     # {"first_field_seconds": ..., "stopped_early": True, ...}
+
+With cache=ExtractionCache(...) successful extractions are kept on disk
+(see evaluation/extraction_cache.py), keyed by model, prompt version,
+temperature and normalized query; a repeated query skips the generation.
+
+    bridge = OllamaLLMBridge(cache=ExtractionCache())
+
+With semantic_cache=SemanticCache(...) a query whose embedding is close
+enough to an already extracted one reuses that system_data, marked with
+"semantic_reuse" (see evaluation/semantic_cache.py for the threshold audit).
+
+Batch jobs can pack several queries into one prompt, so the schema prefill
+and the request overhead are paid once per pack; queries the model drops
+from the answer are re-run singly:
+
+    system_datas = bridge.extract_semantic_meaning_batch(queries, pack_size=8)
+    bridge.last_batch     # {"packs": ..., "retried_singly": ..., ...}
+
+Async usage (one event loop, many extractions in flight):
+    bridge = await OllamaLLMBridge.connect(max_concurrency=8)
+    system_datas = await asyncio.gather(
+        *(bridge.extract_semantic_meaning_async(q, timeout=120) for q in queries)
+    )
 """
 
+import asyncio
+import hashlib
 import json
-import requests
-from typing import Dict, Optional
+import time
+import weakref
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from evaluation import async_http, http_pool
+from evaluation.extraction_cache import extraction_key
+from evaluation.instrumentation import INSTRUMENTATION, StageEvent, instrumented
+from evaluation.stream_extraction import StreamingExtraction, StreamStats, ThinkFilter
+
+
+# Bump when the meaning of the extraction changes without the prompt text
+# changing (the template's hash is part of the cache key anyway)
+EXTRACTION_PROMPT_VERSION = "1"
+
+# Low temperature for deterministic extraction
+EXTRACTION_TEMPERATURE = 0.1
+
+# JSON structure the extraction prompts ask for (one object per query)
+EXTRACTION_SCHEMA = """{
+    "domain": "economic|social|spiritual|intellectual|biological|general",
+    "assumptions": ["assumption 1", "assumption 2", ...],
+    "intent": "brief description of true intent",
+    "beneficiaries": ["group 1", "group 2", ...],
+    "dismissed_harms": ["harm 1", "harm 2", ...],
+    "permits_exploitative_gain": true|false,
+    "acknowledges_transcendent_source": true|false,
+    "enables_accountability": true|false,
+    "causes_harm_amplification": true|false,
+    "destabilizes_lineage": true|false,
+    "deviates_from_optimal_functioning": true|false
+}"""
+
+# Queries per packed prompt in extract_semantic_meaning_batch
+DEFAULT_PACK_SIZE = 8
+
 
 @dataclass
 class ExtractionResult:
@@ -46,37 +119,99 @@ class OllamaLLMBridge:
     Role: Extract semantic meaning from natural language queries into structured system_data
     """
     
-    def __init__(self, model: str = "deepseek-r1:8b", base_url: str = "http://localhost:11434"):
+    def __init__(self, model: str = "deepseek-r1:8b", base_url: str = "http://localhost:11434",
+                 max_concurrency: int = 4, verify: bool = True, pool_size: Optional[int] = None,
+                 health_ttl: Optional[float] = None,
+                 retry: Optional[http_pool.RetryPolicy] = None, streaming: bool = False,
+                 cache=None, semantic_cache=None):
         """
         Initialize connection to Ollama.
         
         Args:
             model: Model name (default: deepseek-r1:8b)
             base_url: Ollama server URL (default: localhost:11434)
+            max_concurrency: Async calls in flight at once (per event loop);
+                             more wait for a slot within their deadline
+            verify: Check the server and model now (blocking; async code
+                    uses OllamaLLMBridge.connect instead). The check is
+                    shared by all bridges of a base URL for health_ttl seconds
+            pool_size: Keep-alive connections of the shared session for
+                       base_url (default: max_concurrency; match the number
+                       of threads calling this bridge)
+            health_ttl: Seconds a server check is reused (default: http_pool.HEALTH.ttl)
+            retry: Backoff for transient failures of /api/generate
+                   (default: RetryPolicy(), 3 tries)
+            streaming: Stream the generation and stop it once the extraction
+                       JSON is complete (see module docstring)
+            cache: ExtractionCache for successful extractions (default: none)
+            semantic_cache: SemanticCache for near-duplicate reuse (default: none)
         """
         self.model = model
         self.base_url = base_url
         self.api_endpoint = f"{base_url}/api/generate"
-        self._verify_connection()
+        self.max_concurrency = max_concurrency
+        self.health_ttl = health_ttl
+        self.retry = retry or http_pool.RetryPolicy()
+        self.streaming = streaming
+        self.last_stream: Optional[StreamStats] = None
+        self.last_batch: Optional[Dict] = None
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.prompt_version = self._prompt_version()
+        self.session = http_pool.session_for(base_url, pool_size or max_concurrency)
+        self._semaphores = weakref.WeakKeyDictionary()
+        if verify:
+            self._verify_connection()
+    
+    @classmethod
+    async def connect(cls, model: str = "deepseek-r1:8b",
+                      base_url: str = "http://localhost:11434",
+                      max_concurrency: int = 4, **kwargs) -> "OllamaLLMBridge":
+        """
+        Create a bridge and verify the connection without blocking the event loop.
+        
+        Args:
+            kwargs: pool_size, health_ttl, retry, streaming, cache, semantic_cache
+                    (as for the constructor)
+        
+        Raises:
+            ConnectionError: If Ollama is not reachable
+        """
+        bridge = cls(model, base_url, max_concurrency, verify=False, **kwargs)
+        await bridge._verify_connection_async()
+        return bridge
     
     def _verify_connection(self):
-        """Verify Ollama is running and model is available"""
+        """Verify Ollama is running and model is available (cached per base URL)"""
+        self._check_model(http_pool.HEALTH.tags(self.base_url, self.session, self.health_ttl))
+    
+    async def _verify_connection_async(self):
+        """Async _verify_connection"""
+        tags = http_pool.HEALTH.cached(self.base_url, self.health_ttl)
+        if tags is not None:
+            self._check_model(tags)
+            return
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                model_names = [m.get("name", "") for m in models]
-                if self.model not in model_names:
-                    print(f"⚠️  Warning: {self.model} not found in Ollama")
-                    print(f"Available models: {model_names}")
-                    print(f"Run: ollama pull {self.model}")
-            else:
-                raise ConnectionError(f"Ollama returned status {response.status_code}")
-        except requests.exceptions.ConnectionError:
+            response = await async_http.request("GET", f"{self.base_url}/api/tags", timeout=5)
+        except (OSError, asyncio.TimeoutError):
             raise ConnectionError(
                 f"Cannot connect to Ollama at {self.base_url}\n"
                 "Make sure Ollama is running. Start with: ollama serve"
             )
+        if response.status != 200:
+            raise ConnectionError(f"Ollama returned status {response.status}")
+        tags = response.json()
+        http_pool.HEALTH.store(self.base_url, tags)
+        self._check_model(tags)
+    
+    def _check_model(self, tags: Dict):
+        """Warn if the model is not in the server's /api/tags listing"""
+        models = tags.get("models", [])
+        model_names = [m.get("name", "") for m in models]
+        if self.model not in model_names:
+            print(f"⚠️  Warning: {self.model} not found in Ollama")
+            print(f"Available models: {model_names}")
+            print(f"Run: ollama pull {self.model}")
     
     def extract_semantic_meaning(self, query: str) -> Dict:
         """
@@ -88,20 +223,235 @@ class OllamaLLMBridge:
         Returns:
             system_data dict ready for reasoning engine
         """
+        key, system_data = self._cached(query)
+        if system_data is not None:
+            return system_data
+        probe = self._probe(query)
+        if probe is not None and probe.reused:
+            return self.semantic_cache.reuse(probe)
+        return self._extract_single(query, key, probe)
+    
+    def _extract_single(self, query: str, key: Optional[str], probe=None,
+                        timeout: float = 300) -> Dict:
+        """One-query prompt and call (after the cache lookups)"""
         # Build extraction prompt
         extraction_prompt = self._build_extraction_prompt(query)
         
         # Call LLM
         try:
-            response = self._call_ollama(extraction_prompt)
+            response = self._call_ollama(extraction_prompt, timeout)
         except Exception as e:
             print(f"Error calling Ollama: {e}")
             # Return default system_data if LLM fails
             return self._default_system_data()
         
         # Parse response into system_data
-        system_data = self._parse_extraction_response(response, query)
+        return self._store(key, query, response, probe)
+    
+    async def extract_semantic_meaning_async(self, query: str, timeout: float = 300) -> Dict:
+        """
+        Async extract_semantic_meaning: the request does not block the event
+        loop, and at most max_concurrency requests are in flight per loop.
+        
+        Args:
+            query: User query or proposal to analyze
+            timeout: Deadline in seconds, including the wait for a free slot
+            
+        Returns:
+            system_data dict ready for reasoning engine (the conservative
+            default when the call fails or misses its deadline)
+        """
+        key, system_data = self._cached(query)
+        if system_data is not None:
+            return system_data
+        probe = None
+        if self.semantic_cache is not None:
+            # Embedding is CPU work: keep it off the event loop
+            probe = await asyncio.get_running_loop().run_in_executor(None, self._probe, query)
+            if probe.reused:
+                return self.semantic_cache.reuse(probe)
+        
+        extraction_prompt = self._build_extraction_prompt(query)
+        
+        try:
+            response = await self._call_ollama_async(extraction_prompt, timeout)
+        except Exception as e:
+            print(f"Error calling Ollama: {e}")
+            return self._default_system_data()
+        
+        return self._store(key, query, response, probe)
+    
+    def extract_semantic_meaning_batch(self, queries: List[str],
+                                       pack_size: int = DEFAULT_PACK_SIZE,
+                                       timeout: float = 300) -> List[Dict]:
+        """
+        Extract many queries with several queries per prompt.
+        
+        Each call of extract_semantic_meaning pays for the instruction
+        prefix (the schema) and a request round-trip. Here up to pack_size
+        queries share one prompt that asks for a JSON array of extraction
+        objects keyed by "index". Every element goes through the same
+        parsing as a single extraction; queries whose element is missing
+        or not a JSON object, and all queries of a pack whose call failed,
+        are re-run singly. Cached (and semantically
+        reused) queries are served from the caches and not packed. Packs
+        are not streamed: the early stop of streaming mode ends at the
+        first object.
+        
+        Args:
+            queries: User queries or proposals to analyze
+            pack_size: Queries per prompt (1: one prompt per query)
+            timeout: Timeout in seconds per query in a pack
+            
+        Returns:
+            One system_data dict per query, in order (the conservative
+            default for queries whose single re-run failed too)
+        """
+        if pack_size < 1:
+            raise ValueError("pack_size must be at least 1")
+        results: List[Optional[Dict]] = [None] * len(queries)
+        pending: Dict[str, List[int]] = {}          # query -> positions
+        probes: Dict[str, object] = {}
+        keys: Dict[str, Optional[str]] = {}
+        stats = {"queries": len(queries), "cached": 0, "reused": 0, "packs": 0,
+                 "packed": 0, "single": 0, "retried_singly": 0, "failed_packs": 0}
+        
+        for position, query in enumerate(queries):
+            if query in pending:
+                pending[query].append(position)
+                continue
+            key, system_data = self._cached(query)
+            if system_data is None:
+                probe = self._probe(query)
+                if probe is not None and probe.reused:
+                    system_data = self.semantic_cache.reuse(probe)
+                    stats["reused"] += 1
+            else:
+                stats["cached"] += 1
+            if system_data is not None:
+                results[position] = system_data
+                continue
+            pending[query] = [position]
+            keys[query] = key
+            probes[query] = probe
+        
+        unique = list(pending)
+        for start in range(0, len(unique), pack_size):
+            pack = unique[start:start + pack_size]
+            if len(pack) == 1:
+                # A pack of one is an ordinary extraction
+                stats["single"] += 1
+                query = pack[0]
+                system_data = self._extract_single(query, keys[query], probes[query], timeout)
+                for position in pending[query]:
+                    results[position] = dict(system_data)
+                continue
+            stats["packs"] += 1
+            stats["packed"] += len(pack)
+            try:
+                response = self._call_ollama(self._build_batch_extraction_prompt(pack),
+                                             timeout * len(pack), streaming=False)
+            except Exception as e:
+                print(f"Error calling Ollama: {e}")
+                stats["failed_packs"] += 1
+                elements = {}
+            else:
+                elements = self._parse_batch_response(response, len(pack))
+            for index, query in enumerate(pack):
+                element = elements.get(index)
+                if element is None:
+                    # Failed pack, or missing/invalid in it: one query, one prompt
+                    stats["retried_singly"] += 1
+                    system_data = self._extract_single(query, keys[query], probes[query], timeout)
+                else:
+                    system_data = self._remember(keys[query], query,
+                                                 self._build_system_data(element, query),
+                                                 probes[query])
+                for position in pending[query]:
+                    results[position] = dict(system_data)
+        
+        self.last_batch = stats
+        return results
+    
+    @staticmethod
+    def _parse_batch_response(response_text: str, count: int) -> Dict[int, Dict]:
+        """
+        Extraction objects of a packed response by query index.
         
+        The think block is dropped. If the text holds no valid JSON array
+        (e.g. it was cut off), the top-level objects that do parse are
+        used. Elements without a valid "index" are placed by position
+        when the array has exactly count elements; duplicates keep the
+        first.
+        """
+        think = ThinkFilter()
+        text = think.feed(response_text) + think.flush()
+        decoder = json.JSONDecoder()
+        elements: List = []
+        start, end = text.find("["), text.rfind("]") + 1
+        try:
+            parsed = json.loads(text[start:end]) if 0 <= start < end else None
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, list):
+            elements = parsed
+        else:
+            position = text.find("{")
+            while position >= 0:
+                try:
+                    value, position = decoder.raw_decode(text, position)
+                    elements.append(value)
+                except json.JSONDecodeError:
+                    position += 1
+                position = text.find("{", position)
+        
+        by_index: Dict[int, Dict] = {}
+        positional = len(elements) == count
+        for position, element in enumerate(elements):
+            if not isinstance(element, dict):
+                continue
+            index = element.get("index")
+            if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < count:
+                if not positional:
+                    continue
+                index = position
+            if index not in by_index:
+                by_index[index] = {key: value for key, value in element.items() if key != "index"}
+        return by_index
+    
+    def _prompt_version(self) -> str:
+        """EXTRACTION_PROMPT_VERSION plus a hash of the prompt template"""
+        template = self._build_extraction_prompt("{query}")
+        digest = hashlib.sha256(template.encode("utf-8")).hexdigest()[:12]
+        return f"{EXTRACTION_PROMPT_VERSION}-{digest}"
+    
+    def _cached(self, query: str):
+        """(cache key, cached system_data or None); (None, None) without a cache"""
+        if self.cache is None:
+            return None, None
+        key = extraction_key(self.model, self.prompt_version, EXTRACTION_TEMPERATURE, query)
+        return key, self.cache.get(key)
+    
+    def _probe(self, query: str):
+        """SemanticProbe of query, or None without a semantic cache"""
+        if self.semantic_cache is None:
+            return None
+        return self.semantic_cache.probe(query, self.model, self.prompt_version)
+    
+    def _store(self, key: Optional[str], query: str, response: str, probe=None) -> Dict:
+        """Parse a response; successful parses are added to the caches"""
+        system_data = self._parse_extraction_json(response, query)
+        if system_data is None:
+            return self._default_system_data()
+        return self._remember(key, query, system_data, probe)
+    
+    def _remember(self, key: Optional[str], query: str, system_data: Dict, probe=None) -> Dict:
+        """Add a successful extraction to the caches"""
+        if key is not None:
+            self.cache.put(key, system_data, self.model, self.prompt_version,
+                           EXTRACTION_TEMPERATURE, query)
+        if probe is not None:
+            self.semantic_cache.add(probe, system_data)
         return system_data
     
     def _build_extraction_prompt(self, query: str) -> str:
@@ -111,53 +461,164 @@ class OllamaLLMBridge:
 Your task: Extract semantic properties from the following query.
 
 Return ONLY valid JSON (no markdown, no extra text) with this exact structure:
-{{
-    "domain": "economic|social|spiritual|intellectual|biological|general",
-    "assumptions": ["assumption 1", "assumption 2", ...],
-    "intent": "brief description of true intent",
-    "beneficiaries": ["group 1", "group 2", ...],
-    "dismissed_harms": ["harm 1", "harm 2", ...],
-    "permits_exploitative_gain": true|false,
-    "acknowledges_transcendent_source": true|false,
-    "enables_accountability": true|false,
-    "causes_harm_amplification": true|false,
-    "destabilizes_lineage": true|false,
-    "deviates_from_optimal_functioning": true|false
-}}
+{EXTRACTION_SCHEMA}
 
 QUERY: {query}
 
 Return ONLY the JSON object, nothing else."""
     
-    def _call_ollama(self, prompt: str, timeout: int = 300) -> str:
+    def _build_batch_extraction_prompt(self, queries: List[str]) -> str:
+        """Prompt asking for one extraction object per query, as a JSON array"""
+        numbered = "\n".join(f"[{index}] {query}" for index, query in enumerate(queries))
+        return f"""You are a semantic analysis engine for The Criterion reasoning framework.
+
+Your task: Extract semantic properties from each of the following {len(queries)} queries.
+
+Return ONLY a valid JSON array (no markdown, no extra text) with one object per query.
+Each object has an "index" field with the query's number, plus this exact structure:
+{EXTRACTION_SCHEMA}
+
+QUERIES:
+{numbered}
+
+Return ONLY the JSON array, nothing else."""
+    
+    @instrumented("OLLAMA")
+    def _call_ollama(self, prompt: str, timeout: int = 300,
+                     streaming: Optional[bool] = None) -> str:
         """
         Call Ollama API with deepseek-r1:8b.
         
         Args:
             prompt: The prompt to send
             timeout: Timeout in seconds (deepseek-r1 can be slow)
+            streaming: Override self.streaming for this call
             
         Returns:
             Model response text
-        """
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "temperature": 0.1,  # Low temperature for deterministic extraction
-        }
         
-        response = requests.post(
-            self.api_endpoint,
-            json=payload,
-            timeout=timeout
+        Sent over the shared keep-alive session; transient failures are
+        retried by self.retry. In streaming mode the text is the extraction
+        JSON (or all text after the think block if none was found).
+        """
+        streaming = self.streaming if streaming is None else streaming
+        payload = self._generate_payload(prompt, streaming)
+        extraction = StreamingExtraction() if streaming else None
+        response = self.retry.call(
+            lambda: self.session.post(self.api_endpoint, json=payload, timeout=timeout,
+                                      stream=streaming)
         )
         
-        if response.status_code != 200:
-            raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+        if extraction is None:
+            if response.status_code != 200:
+                raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+            result = response.json()
+            return result.get("response", "")
+        
+        try:
+            if response.status_code != 200:
+                raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
+            # timeout bounds each read; the deadline bounds the whole generation
+            deadline = extraction.stats.started + timeout
+            for line in response.iter_lines(chunk_size=None):
+                if self._feed_stream_line(extraction, line):
+                    break
+                if time.perf_counter() > deadline:
+                    raise TimeoutError(f"Ollama generation exceeded {timeout}s")
+        finally:
+            # Closing mid-stream drops the connection, which stops the generation
+            response.close()
+        return self._finish_stream(extraction)
+    
+    @instrumented("OLLAMA")
+    async def _call_ollama_async(self, prompt: str, timeout: float = 300) -> str:
+        """
+        Async _call_ollama.
         
-        result = response.json()
-        return result.get("response", "")
+        Args:
+            prompt: The prompt to send
+            timeout: Deadline in seconds, including the wait for a free slot
+            
+        Returns:
+            Model response text
+            
+        Raises:
+            TimeoutError: Deadline exceeded (the request is abandoned)
+        
+        Transient failures are retried by self.retry within the deadline.
+        """
+        payload = self._generate_payload(prompt)
+        
+        async def call():
+            async with self._semaphore():
+                if not self.streaming:
+                    response = await self.retry.call_async(
+                        lambda: async_http.request("POST", self.api_endpoint, payload=payload)
+                    )
+                    if response.status != 200:
+                        raise Exception(f"Ollama API error: {response.status} - {response.text}")
+                    return response.json().get("response", "")
+                
+                extraction = StreamingExtraction()
+                response = await self.retry.call_async(
+                    lambda: async_http.open_stream("POST", self.api_endpoint, payload=payload)
+                )
+                try:
+                    if response.status != 200:
+                        text = (await response.read()).decode("utf-8", errors="replace")
+                        raise Exception(f"Ollama API error: {response.status} - {text}")
+                    async for line in response.lines():
+                        if self._feed_stream_line(extraction, line):
+                            break
+                finally:
+                    await response.aclose()
+                return self._finish_stream(extraction)
+        
+        try:
+            return await asyncio.wait_for(call(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No response from Ollama within {timeout}s") from None
+    
+    @staticmethod
+    def _feed_stream_line(extraction: StreamingExtraction, line: bytes) -> bool:
+        """Feed one NDJSON line of /api/generate; True when reading can stop"""
+        if not line:
+            return False
+        message = json.loads(line)
+        if "error" in message:
+            raise Exception(f"Ollama API error: {message['error']}")
+        if extraction.feed(message.get("response", "")) is not None:
+            extraction.stats.stopped_early = not message.get("done", False)
+            return True
+        return bool(message.get("done"))
+    
+    def _finish_stream(self, extraction: StreamingExtraction) -> str:
+        """Response text of a finished stream; records its timings"""
+        text = extraction.finish()
+        stats = self.last_stream = extraction.stats
+        if INSTRUMENTATION.enabled:
+            for stage, seconds in (("OLLAMA_FIRST_TOKEN", stats.first_token),
+                                   ("OLLAMA_FIRST_FIELD", stats.first_field)):
+                if seconds is not None:
+                    INSTRUMENTATION.record(StageEvent(stage, seconds, None, None, None))
+        return text
+    
+    def _generate_payload(self, prompt: str, streaming: Optional[bool] = None) -> Dict:
+        """Request body of /api/generate"""
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": self.streaming if streaming is None else streaming,
+            "temperature": EXTRACTION_TEMPERATURE,
+        }
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit of async calls on the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
     
     def _parse_extraction_response(self, response_text: str, query: str) -> Dict:
         """
@@ -170,6 +631,14 @@ Return ONLY the JSON object, nothing else."""
         Returns:
             Structured system_data dict
         """
+        system_data = self._parse_extraction_json(response_text, query)
+        if system_data is None:
+            # Fallback to default if parsing fails
+            return self._default_system_data()
+        return system_data
+    
+    def _parse_extraction_json(self, response_text: str, query: str) -> Optional[Dict]:
+        """_parse_extraction_response without the fallback: None if parsing fails"""
         try:
             # Try to extract JSON from response
             # Sometimes model includes extra text, so look for JSON
@@ -181,24 +650,27 @@ Return ONLY the JSON object, nothing else."""
                 extracted = json.loads(json_str)
                 
                 # Validate and build system_data
-                return {
-                    "domain": extracted.get("domain", "general"),
-                    "assumptions": extracted.get("assumptions", []),
-                    "intent": extracted.get("intent", f"Analyze: {query[:100]}"),
-                    "beneficiaries": extracted.get("beneficiaries", []),
-                    "dismissed_harms": extracted.get("dismissed_harms", []),
-                    "permits_exploitative_gain": extracted.get("permits_exploitative_gain", False),
-                    "acknowledges_transcendent_source": extracted.get("acknowledges_transcendent_source", False),
-                    "enables_accountability": extracted.get("enables_accountability", False),
-                    "causes_harm_amplification": extracted.get("causes_harm_amplification", False),
-                    "destabilizes_lineage": extracted.get("destabilizes_lineage", False),
-                    "deviates_from_optimal_functioning": extracted.get("deviates_from_optimal_functioning", False),
-                }
+                return self._build_system_data(extracted, query)
         except json.JSONDecodeError:
             print(f"Failed to parse LLM response as JSON. Raw: {response_text[:200]}")
-        
-        # Fallback to default if parsing fails
-        return self._default_system_data()
+        return None
+    
+    @staticmethod
+    def _build_system_data(extracted: Dict, query: str) -> Dict:
+        """system_data from one extraction object (missing fields get defaults)"""
+        return {
+            "domain": extracted.get("domain", "general"),
+            "assumptions": extracted.get("assumptions", []),
+            "intent": extracted.get("intent", f"Analyze: {query[:100]}"),
+            "beneficiaries": extracted.get("beneficiaries", []),
+            "dismissed_harms": extracted.get("dismissed_harms", []),
+            "permits_exploitative_gain": extracted.get("permits_exploitative_gain", False),
+            "acknowledges_transcendent_source": extracted.get("acknowledges_transcendent_source", False),
+            "enables_accountability": extracted.get("enables_accountability", False),
+            "causes_harm_amplification": extracted.get("causes_harm_amplification", False),
+            "destabilizes_lineage": extracted.get("destabilizes_lineage", False),
+            "deviates_from_optimal_functioning": extracted.get("deviates_from_optimal_functioning", False),
+        }
     
     def _default_system_data(self) -> Dict:
         """Return default conservative system_data"""
@@ -227,7 +699,7 @@ Return ONLY the JSON object, nothing else."""
         Returns:
             Complete reasoning result with verdict
         """
-        from evaluation.pipeline import CriterionPipeline
+        from evaluation.registry import get_pipeline
         
         if verbose:
             print(f"\n{'='*80}")
@@ -247,7 +719,7 @@ Return ONLY the JSON object, nothing else."""
         # Step 2: Run reasoning engine
         if verbose:
             print("\n[STEP 2] Running Criterion reasoning engine...")
-        pipeline = CriterionPipeline()
+        pipeline = get_pipeline()
         result = pipeline.evaluate(query, system_data)
         
         if verbose:
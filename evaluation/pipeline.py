@@ -13,17 +13,108 @@ Architecture:
 The LLM becomes the EXTRACT layer (semantic understanding + assumption identification)
 The Reasoning Engine operationalizes SCAN, MIRROR, GATES, CONSEQUENCES, VERDICT
 Together they create architectural reasoning, not probabilistic generation
+
+evaluate_stream() yields each phase as soon as it is computed, so callers can
+act on SCAN and EXTRACT while the LLM extraction is still running:
+
+    for event in pipeline.evaluate_stream(query, extractor=bridge.extract_semantic_meaning):
+        print(event.phase, event.seconds)
+    result = event.data   # the last event carries the complete result
 """
 
 from evaluation.reasoning_engine import CriterionReasoningEngine
+from evaluation.result_cache import ResultCache
+from evaluation.verdict_store import VerdictStore
+from evaluation.registry import get_pipeline
+from evaluation.results import Deferred, PhaseEvent, PipelineResult, ResultView
+from evaluation.dag import DagRun, StageGraph
+from evaluation.scaffold import SCAFFOLD_TEMPLATE, scaffold_context
 from evaluation.gates import (
     source_integrity_gate,
     structural_consistency_gate,
     mediation_zeroing_gate,
     origin_aware_gate
 )
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Executor
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, Optional
+import asyncio
+import functools
+import inspect
 import json
+import threading
+import time
+
+
+# ═══════════════════════════════════════════════════════════════════
+# reasoning_phases projections (one analysis_chain entry -> one phase)
+# ═══════════════════════════════════════════════════════════════════
+
+def _scan_phase(scan: Dict, llm_extraction: Optional[Dict]) -> Dict:
+    return {
+        "primary_domain": scan["primary_domain"],
+        "detected_contexts": scan["secondary_domains"],
+        "reasoning": scan["reasoning"]
+    }
+
+
+def _extract_phase(assumptions: Dict, llm_extraction: Optional[Dict]) -> Dict:
+    return {
+        "assumption_count": assumptions["total_assumptions"],
+        "assumption_types": assumptions["assumption_types"],
+        "beneficiaries_claimed": assumptions["beneficiaries"],
+        "dismissed_harms": assumptions["dismissed_harms"],
+        "inferred_intent": assumptions["inferred_intent"],
+        "llm_semantic_enrichment": llm_extraction if llm_extraction else None
+    }
+
+
+def _mirror_phase(mirror: Dict, llm_extraction: Optional[Dict]) -> Dict:
+    return {
+        "total_violations": mirror["total_violations"],
+        "critical_violations": mirror["critical_violations"],
+        "violations": mirror["violations"],
+        "compliance_status": mirror["compliance"],
+        "severity_distribution": {
+            "critical": mirror["critical_violations"],
+            "high": sum(1 for v in mirror["violations"] if v.get("severity") == "high")
+        }
+    }
+
+
+def _gates_phase(gates: Dict, llm_extraction: Optional[Dict]) -> Dict:
+    return {
+        "gate_scores": {name: gate["score"] for name, gate in gates["gate_status"].items()},
+        "gate_details": gates["gate_status"],
+        "all_gates_pass": gates["all_gates_pass"],
+        "origin_aware_critical": gates["origin_aware_pass"],
+        "critical_path": gates["critical_path"]
+    }
+
+
+def _consequences_phase(consequences: Dict, llm_extraction: Optional[Dict]) -> Dict:
+    return {
+        "affected_domains": consequences["affected_domains"],
+        "harm_scale": consequences["harm_scale"],
+        "critical_tipping_points": [
+            {
+                "friction": c.get("friction"),
+                "time_horizon": c.get("time_horizon"),
+                "reversibility": c.get("reversibility")
+            }
+            for c in consequences["critical_tipping_points"]
+        ],
+        "total_affected_domains": len(consequences["affected_domains"])
+    }
+
+
+# reasoning_phases key -> (analysis_chain key, projection)
+REASONING_PHASES = {
+    "phase_1_scan": ("1_scan", _scan_phase),
+    "phase_2_extract": ("2_assumptions", _extract_phase),
+    "phase_3_mirror": ("3_axiom_mirror", _mirror_phase),
+    "phase_4_gates": ("4_gates", _gates_phase),
+    "phase_5_consequences": ("5_consequences", _consequences_phase)
+}
 
 
 class CriterionPipeline:
@@ -36,12 +127,36 @@ class CriterionPipeline:
     that thinks according to axioms rather than probability distributions.
     """
     
-    def __init__(self, axioms_path: Optional[str] = None):
-        """Initialize the pipeline with reasoning engine"""
-        self.reasoning_engine = CriterionReasoningEngine(axioms_path)
+    def __init__(self, axioms_path: Optional[str] = None, detail_level: str = "full",
+                 cache: Optional[ResultCache] = None, verdict_table: bool = False,
+                 reasoning_engine: Optional[CriterionReasoningEngine] = None,
+                 store: Optional[VerdictStore] = None):
+        """
+        Initialize the pipeline with reasoning engine
+        
+        Args:
+            axioms_path: Path to core_axioms.json. If None, uses default location.
+            detail_level: Default detail level of evaluate() (see DETAIL_LEVELS)
+            cache: Optional ResultCache memoizing evaluate() results
+            verdict_table: Serve the engine's flag-only phases from a precomputed
+                           VerdictTable (see CriterionReasoningEngine.enable_verdict_table)
+            reasoning_engine: Existing engine to use (e.g. a shared one from
+                              evaluation.registry); axioms_path and
+                              verdict_table are then ignored
+            store: Optional VerdictStore every evaluation is appended to
+                   (evaluate, evaluate_result, evaluate_stream and the
+                   deepseek/async variants; cache hits included)
+        """
+        if reasoning_engine is None:
+            reasoning_engine = CriterionReasoningEngine(axioms_path, verdict_table=verdict_table)
+        self.reasoning_engine = reasoning_engine
+        self.detail_level = self.reasoning_engine._check_detail_level(detail_level)
+        self.cache = cache
+        self.store = store
     
     def evaluate(self, query: str, system_data: Dict[str, Any], 
-                 llm_extraction: Optional[Dict] = None) -> Dict:
+                 llm_extraction: Optional[Dict] = None,
+                 detail_level: Optional[str] = None) -> Dict:
         """
         INTEGRATED PIPELINE EVALUATION
         
@@ -57,82 +172,344 @@ class CriterionPipeline:
             system_data: System properties and attributes
             llm_extraction: Optional extraction from LLM (assumptions, intent, etc.)
                           If provided, enriches the analysis with LLM understanding
+            detail_level: One of DETAIL_LEVELS (default: the pipeline's level)
+                          - "full": everything, including the CoT scaffold
+                          - "summary": all phases, no consequence chains or scaffold
+                          - "verdict": only phase_6_verdict, gate scores and domain
         
         Returns:
-            Structured reasoning output for LLM to use in chain-of-thought generation
+            Structured reasoning output for LLM to use in chain-of-thought generation:
+            a read-only ResultView whose parts are built when first read
+            (a mutable copy when served from a cache with copy_on_read)
         """
+        level = self.detail_level if detail_level is None else (
+            self.reasoning_engine._check_detail_level(detail_level)
+        )
         
+        if self.cache is None:
+            return self._record(self._evaluate(query, system_data, llm_extraction, level))
+        
+        key = self.cache.make_key("evaluate", query, system_data,
+                                  self.reasoning_engine.axioms_fingerprint,
+                                  level, llm_extraction)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._record(cached)
+        return self._record(
+            self.cache.put(key, self._evaluate(query, system_data, llm_extraction, level))
+        )
+    
+    def _evaluate(self, query: str, system_data: Dict[str, Any],
+                  llm_extraction: Optional[Dict], level: str) -> Dict:
+        """Run the pipeline at a detail level (uncached)"""
+        return self._evaluate_result(query, system_data, llm_extraction, level).view()
+    
+    def _evaluate_view(self, query: str, system_data: Dict[str, Any],
+                       llm_extraction: Optional[Dict], level: str) -> Dict:
+        """Uncached evaluation, appended to the store"""
+        return self._record(self._evaluate(query, system_data, llm_extraction, level))
+    
+    def _record(self, result: Any) -> Any:
+        """Append an evaluation to the verdict store (if any); returns it"""
+        if self.store is not None:
+            self.store.append(result if isinstance(result, dict) else result.view())
+        return result
+    
+    def evaluate_result(self, query: str, system_data: Dict[str, Any],
+                        llm_extraction: Optional[Dict] = None,
+                        detail_level: Optional[str] = None) -> PipelineResult:
+        """
+        INTEGRATED PIPELINE EVALUATION, as a result object
+        
+        Runs the same reasoning as evaluate() but returns a slotted
+        PipelineResult; the phase dicts and the CoT scaffold are only built
+        by to_dict() (or the cot_scaffold property). Not cached.
+        
+        Args:
+            query: The statement/proposal to evaluate
+            system_data: System properties and attributes
+            llm_extraction: Optional extraction from LLM (assumptions, intent, etc.)
+            detail_level: One of DETAIL_LEVELS (default: the pipeline's level)
+        
+        Returns:
+            PipelineResult (result.to_dict() == evaluate(...) with the same arguments)
+        """
+        level = self.detail_level if detail_level is None else (
+            self.reasoning_engine._check_detail_level(detail_level)
+        )
+        return self._record(self._evaluate_result(query, system_data, llm_extraction, level))
+    
+    def _evaluate_result(self, query: str, system_data: Dict[str, Any],
+                         llm_extraction: Optional[Dict], level: str) -> PipelineResult:
         # Run complete reasoning pipeline
-        full_analysis = self.reasoning_engine.reason(query, system_data)
+        verdict = self.reasoning_engine._reason_result(query, system_data, level)
+        return PipelineResult(self, verdict, llm_extraction, level)
+    
+    def stage_graph(self, extractor: Optional[Callable[[str], Dict]] = None,
+                    retriever: Optional[Callable[[str], Any]] = None) -> StageGraph:
+        """
+        The pipeline as a StageGraph (see evaluation/dag.py).
+        
+        Inputs: query, system_data, llm_extraction, level. The external steps
+        run as blocking stages concurrently with the keyword phases:
+        - extractor(query) -> system_data dict (e.g. an Ollama extraction);
+          its result replaces the system_data input and is also used as the
+          llm_extraction, as in evaluate_with_deepseek
+        - retriever(query) -> evidence attached as system_data["retrieved_evidence"]
         
-        # Enrich with LLM extraction if provided
-        if llm_extraction:
-            full_analysis["analysis"]["llm_semantic_layer"] = llm_extraction
+        Returns:
+            The graph; its "result" stage yields the PipelineResult
+        """
+        graph = StageGraph(inputs=("query", "system_data", "llm_extraction", "level"))
+        profile_deps = ["system_data"]
+        llm_deps = ["llm_extraction"]
+        if extractor is not None:
+            graph.add("extraction", lambda query: extractor(query), deps=("query",),
+                      blocking=True)
+            profile_deps.append("extraction")
+            llm_deps.append("extraction")
+        if retriever is not None:
+            graph.add("evidence", lambda query: retriever(query), deps=("query",),
+                      blocking=True)
+            profile_deps.append("evidence")
+        
+        def profile(system_data, extraction=None, evidence=None):
+            base = extraction if extraction is not None else (system_data or {})
+            if evidence is None:
+                return base
+            return {**base, "retrieved_evidence": evidence}
+        
+        def llm(llm_extraction, extraction=None):
+            return extraction if extraction is not None else llm_extraction
+        
+        graph.add("profile", profile, deps=profile_deps)
+        graph.add("llm", llm, deps=llm_deps)
+        self.reasoning_engine.stage_graph(graph)
+        graph.add("result",
+                  lambda verdict, llm, level: PipelineResult(self, verdict, llm, level),
+                  deps=("verdict", "llm", "level"))
+        return graph
+    
+    def evaluate_stages(self, query: str, system_data: Optional[Dict[str, Any]] = None,
+                        llm_extraction: Optional[Dict] = None,
+                        extractor: Optional[Callable[[str], Dict]] = None,
+                        retriever: Optional[Callable[[str], Any]] = None,
+                        detail_level: Optional[str] = None,
+                        max_workers: Optional[int] = None) -> DagRun:
+        """
+        CONCURRENT PIPELINE EVALUATION
+        
+        Runs the pipeline as a stage DAG: LLM extraction and evidence
+        retrieval overlap SCAN and GATES, so latency follows the critical path.
+        Not cached.
+        
+        Args:
+            query: The statement/proposal to evaluate
+            system_data: System properties (ignored when an extractor is given)
+            llm_extraction: Optional extraction from LLM
+            extractor: Optional callable query -> system_data (blocking I/O)
+            retriever: Optional callable query -> retrieved evidence (blocking I/O)
+            detail_level: One of DETAIL_LEVELS (default: the pipeline's level)
+            max_workers: Threads for the blocking stages
+        
+        Returns:
+            DagRun: run["result"] is the PipelineResult (to_dict() gives the
+            evaluate() output), run.timings / run.to_dict() the stage timings
+        """
+        level = self.detail_level if detail_level is None else (
+            self.reasoning_engine._check_detail_level(detail_level)
+        )
+        graph = self.stage_graph(extractor, retriever)
+        return graph.run({
+            "query": query,
+            "system_data": system_data,
+            "llm_extraction": llm_extraction,
+            "level": level
+        }, max_workers=max_workers)
+    
+    def evaluate_stream(self, query: str, system_data: Optional[Dict[str, Any]] = None,
+                        llm_extraction: Optional[Dict] = None,
+                        extractor: Optional[Callable[[str], Dict]] = None,
+                        retriever: Optional[Callable[[str], Any]] = None,
+                        detail_level: Optional[str] = None,
+                        max_workers: Optional[int] = None) -> Iterator[PhaseEvent]:
+        """
+        STREAMING PIPELINE EVALUATION
+        
+        Runs the stage DAG of evaluate_stages() and yields each phase as soon
+        as it is computed, in completion order: SCAN and the keyword EXTRACT
+        come first, while the LLM extraction and evidence retrieval are still
+        running; MIRROR, GATES and CONSEQUENCES follow once the profile is
+        known. The phase blocks rendered for the events are reused for the
+        final result, so nothing is computed twice. Not cached.
+        
+        Events (PhaseEvent.phase):
+        - "phase_1_scan" ... "phase_5_consequences": the reasoning_phases
+          entries. With an extractor, phase_2_extract is sent first with
+          partial=True and without the LLM enrichment, then again complete.
+        - "phase_6_verdict"
+        - "cot_scaffold" (detail level "full" only)
+        - "result": the complete evaluate() output (a ResultView), always last
+        At detail level "verdict" only phase_6_verdict and result are sent.
+        
+        Closing the generator early skips the remaining cheap phases (and the
+        scaffold) but waits for a running extraction or retrieval.
+        
+        Args:
+            query: The statement/proposal to evaluate
+            system_data: System properties (ignored when an extractor is given)
+            llm_extraction: Optional extraction from LLM
+            extractor: Optional callable query -> system_data (blocking I/O)
+            retriever: Optional callable query -> retrieved evidence (blocking I/O)
+            detail_level: One of DETAIL_LEVELS (default: the pipeline's level)
+            max_workers: Threads for the blocking stages
+        
+        Yields:
+            PhaseEvent (event.seconds: time since the call)
+        """
+        level = self.detail_level if detail_level is None else (
+            self.reasoning_engine._check_detail_level(detail_level)
+        )
+        engine = self.reasoning_engine
+        origin = time.perf_counter()
+        
+        def event(phase: str, data: Any, partial: bool = False) -> PhaseEvent:
+            return PhaseEvent(phase, data, time.perf_counter() - origin, partial)
+        
+        def project(phase: str, chain: Dict, llm: Optional[Dict] = None) -> Dict:
+            return REASONING_PHASES[phase][1](chain, llm)
+        
+        done: Dict[str, Any] = {}
+        blocks: Dict[str, Dict] = {}
+        structured_output = None
+        stages = self.stage_graph(extractor, retriever).stream({
+            "query": query,
+            "system_data": system_data,
+            "llm_extraction": llm_extraction,
+            "level": level
+        }, max_workers=max_workers, targets=("verdict", "llm"))
+        
+        for name, value in stages:
+            done[name] = value
+            if level == "verdict":
+                if name == "verdict":
+                    yield event("phase_6_verdict", self._verdict_summary(value.final_judgment))
+                continue
+            
+            if name == "scan":
+                blocks["scan"] = engine.scan(query, done["features"])
+                yield event("phase_1_scan",
+                            project("phase_1_scan", engine._scan_chain(blocks["scan"])))
+            elif name == "features" or (name == "llm" and "assumptions" in blocks):
+                if "assumptions" not in blocks:
+                    blocks["assumptions"] = engine.extract_assumptions(query, done["features"])
+                yield event("phase_2_extract",
+                            project("phase_2_extract",
+                                    engine._assumptions_chain(blocks["assumptions"]),
+                                    done.get("llm")),
+                            partial="llm" not in done)
+            elif name == "mirror":
+                blocks["axiom_mirror"] = value.to_dict()
+                yield event("phase_3_mirror",
+                            project("phase_3_mirror", engine._mirror_chain(blocks["axiom_mirror"])))
+            elif name == "gates":
+                blocks["gates"] = value.to_dict()
+                yield event("phase_4_gates",
+                            project("phase_4_gates", engine._gates_chain(blocks["gates"])))
+            elif name == "consequences":
+                blocks["consequences"] = value.to_dict(traced=level == "full")
+                yield event("phase_5_consequences",
+                            project("phase_5_consequences",
+                                    engine._consequences_chain(blocks["consequences"])))
+            elif name == "verdict":
+                # Same dict Verdict.to_dict() renders, from the blocks above
+                analysis = {
+                    "query": query,
+                    "scan": blocks["scan"],
+                    "assumptions": blocks["assumptions"],
+                    "axiom_mirror": blocks["axiom_mirror"],
+                    "gates": blocks["gates"],
+                    "consequences": blocks["consequences"]
+                }
+                verdict_data = engine.render_verdict(analysis)
+                structured_output = {"query": query, "analysis": analysis, "verdict": verdict_data}
+                yield event("phase_6_verdict",
+                            self._verdict_summary(verdict_data["final_judgment"]))
+        
+        llm = done["llm"]
+        if structured_output is not None:
+            structured_output = self._enrich(structured_output, llm)
+        result = PipelineResult(self, done["verdict"], llm, level, structured_output)
+        if level == "full":
+            yield event("cot_scaffold", result.cot_scaffold)
+        yield event("result", self._record(result.view()))
+    
+    def _project(self, full_analysis: Dict, llm_extraction: Optional[Dict],
+                 level: str) -> Dict:
+        """Pipeline output for the engine's reason() dict at a detail level"""
+        query = full_analysis["query"]
+        
+        if level == "verdict":
+            verdict_only = full_analysis["verdict"]
+            return {
+                "query": query,
+                "primary_domain": verdict_only["primary_domain"],
+                "gate_scores": verdict_only["gate_scores"],
+                "phase_6_verdict": self._verdict_summary(verdict_only["final_judgment"])
+            }
+        
+        full_analysis = self._enrich(full_analysis, llm_extraction)
         
         # Extract key components for CoT scaffold
         verdict_data = full_analysis["verdict"]
         
-        return {
+        result = {
             "query": query,
             "reasoning_phases": {
-                "phase_1_scan": {
-                    "primary_domain": verdict_data["analysis_chain"]["1_scan"]["primary_domain"],
-                    "detected_contexts": verdict_data["analysis_chain"]["1_scan"]["secondary_domains"],
-                    "reasoning": verdict_data["analysis_chain"]["1_scan"]["reasoning"]
-                },
-                "phase_2_extract": {
-                    "assumption_count": verdict_data["analysis_chain"]["2_assumptions"]["total_assumptions"],
-                    "assumption_types": verdict_data["analysis_chain"]["2_assumptions"]["assumption_types"],
-                    "beneficiaries_claimed": verdict_data["analysis_chain"]["2_assumptions"]["beneficiaries"],
-                    "dismissed_harms": verdict_data["analysis_chain"]["2_assumptions"]["dismissed_harms"],
-                    "inferred_intent": verdict_data["analysis_chain"]["2_assumptions"]["inferred_intent"],
-                    "llm_semantic_enrichment": llm_extraction if llm_extraction else None
-                },
-                "phase_3_mirror": {
-                    "total_violations": verdict_data["analysis_chain"]["3_axiom_mirror"]["total_violations"],
-                    "critical_violations": verdict_data["analysis_chain"]["3_axiom_mirror"]["critical_violations"],
-                    "violations": verdict_data["analysis_chain"]["3_axiom_mirror"]["violations"],
-                    "compliance_status": verdict_data["analysis_chain"]["3_axiom_mirror"]["compliance"],
-                    "severity_distribution": {
-                        "critical": verdict_data["analysis_chain"]["3_axiom_mirror"]["critical_violations"],
-                        "high": sum(1 for v in verdict_data["analysis_chain"]["3_axiom_mirror"]["violations"]
-                                   if v.get("severity") == "high")
-                    }
-                },
-                "phase_4_gates": {
-                    "gate_scores": {
-                        name: gate["score"]
-                        for name, gate in verdict_data["analysis_chain"]["4_gates"]["gate_status"].items()
-                    },
-                    "gate_details": verdict_data["analysis_chain"]["4_gates"]["gate_status"],
-                    "all_gates_pass": verdict_data["analysis_chain"]["4_gates"]["all_gates_pass"],
-                    "origin_aware_critical": verdict_data["analysis_chain"]["4_gates"]["origin_aware_pass"],
-                    "critical_path": verdict_data["analysis_chain"]["4_gates"]["critical_path"]
-                },
-                "phase_5_consequences": {
-                    "affected_domains": verdict_data["analysis_chain"]["5_consequences"]["affected_domains"],
-                    "harm_scale": verdict_data["analysis_chain"]["5_consequences"]["harm_scale"],
-                    "critical_tipping_points": [
-                        {
-                            "friction": c.get("friction"),
-                            "time_horizon": c.get("time_horizon"),
-                            "reversibility": c.get("reversibility")
-                        }
-                        for c in verdict_data["analysis_chain"]["5_consequences"]["critical_tipping_points"]
-                    ],
-                    "total_affected_domains": len(verdict_data["analysis_chain"]["5_consequences"]["affected_domains"])
-                }
+                phase: build()
+                for phase, build in self._phase_builders(verdict_data, llm_extraction).items()
             },
-            "phase_6_verdict": {
-                "final_judgment": verdict_data["final_judgment"]["verdict"],
-                "survival": verdict_data["final_judgment"]["survival"],
-                "confidence": verdict_data["final_judgment"]["confidence_level"],
-                "reasoning_summary": verdict_data["final_judgment"]["reasoning_summary"],
-                "recommendation": verdict_data["final_judgment"]["recommendation"],
-                "critical_issues": verdict_data["final_judgment"]["critical_issues"]
-            },
-            "cot_scaffold": self._generate_cot_scaffold(verdict_data),
-            "structured_output": full_analysis
+            "phase_6_verdict": self._verdict_summary(verdict_data["final_judgment"])
+        }
+        
+        if level == "full":
+            result["cot_scaffold"] = self._generate_cot_scaffold(verdict_data)
+        result["structured_output"] = full_analysis
+        return result
+    
+    @staticmethod
+    def _enrich(full_analysis: Dict, llm_extraction: Optional[Dict]) -> Dict:
+        """
+        The engine's reason() dict enriched with the LLM extraction, if provided
+        (without mutating the engine's result, which may be a shared cached one)
+        """
+        if not llm_extraction:
+            return full_analysis
+        return {
+            **full_analysis,
+            "analysis": {**full_analysis["analysis"], "llm_semantic_layer": llm_extraction}
+        }
+    
+    @staticmethod
+    def _phase_builders(verdict_data: Dict,
+                        llm_extraction: Optional[Dict]) -> Dict[str, Callable[[], Dict]]:
+        """reasoning_phases of a rendered verdict: one projection builder per phase"""
+        chain = verdict_data["analysis_chain"]
+        return {
+            phase: functools.partial(project, chain[key], llm_extraction)
+            for phase, (key, project) in REASONING_PHASES.items()
+        }
+    
+    @staticmethod
+    def _verdict_summary(final_judgment: Dict) -> Dict:
+        """phase_6_verdict projection of the engine's final judgment"""
+        return {
+            "final_judgment": final_judgment["verdict"],
+            "survival": final_judgment["survival"],
+            "confidence": final_judgment["confidence_level"],
+            "reasoning_summary": final_judgment["reasoning_summary"],
+            "recommendation": final_judgment["recommendation"],
+            "critical_issues": final_judgment["critical_issues"]
         }
     
     def _generate_cot_scaffold(self, verdict_data: Dict) -> str:
@@ -141,117 +518,63 @@ class CriterionPipeline:
         
         This is the concrete thinking structure the LLM uses internally
         instead of relying on probabilistic next-token generation.
-        """
-        scaffold = f"""
-═══════════════════════════════════════════════════════════════════════════════
-CHAIN-OF-THOUGHT REASONING SCAFFOLD
-═══════════════════════════════════════════════════════════════════════════════
-
-THINKING STRUCTURE (Use this to reason architecturally, not generatively):
-
-PHASE 1 - SCAN (Domain Identification):
-  Primary system: {verdict_data["analysis_chain"]["1_scan"]["primary_domain"]}
-  Context domains: {verdict_data["analysis_chain"]["1_scan"]["secondary_domains"]}
-  → Therefore, we must evaluate using {verdict_data["analysis_chain"]["1_scan"]["primary_domain"]}-specific axioms
-
-PHASE 2 - EXTRACT (Assumption Parsing):
-  Total assumptions embedded: {verdict_data["analysis_chain"]["2_assumptions"]["total_assumptions"]}
-  Assumption types: {verdict_data["analysis_chain"]["2_assumptions"]["assumption_types"]}
-  Claimed beneficiaries: {verdict_data["analysis_chain"]["2_assumptions"]["beneficiaries"]}
-  Dismissed harms: {verdict_data["analysis_chain"]["2_assumptions"]["dismissed_harms"] or 'none listed'}
-  True intent: {verdict_data["analysis_chain"]["2_assumptions"]["inferred_intent"]}
-  → Therefore, the proposal attempts to: [hidden premises here]
-
-PHASE 3 - MIRROR (Axiom Compliance):
-  Violations detected: {verdict_data["analysis_chain"]["3_axiom_mirror"]["total_violations"]}
-  Critical violations: {verdict_data["analysis_chain"]["3_axiom_mirror"]["critical_violations"]}
-  Axiom compliance:
-"""
-        for axiom, compliant in verdict_data["analysis_chain"]["3_axiom_mirror"]["compliance"].items():
-            status = "✓ Compliant" if compliant else "✗ Violated"
-            scaffold += f"    - {axiom}: {status}\n"
         
-        scaffold += f"""
-  → Therefore, system has {verdict_data["analysis_chain"]["3_axiom_mirror"]["total_violations"]} design flaws
-
-PHASE 4 - GATES (Survival Filter):
-  Gate evaluation:
-"""
-        for gate_name, gate_data in verdict_data["analysis_chain"]["4_gates"]["gate_status"].items():
-            score = gate_data["score"]
-            status = "PASS" if gate_data["passed"] else "FAIL"
-            scaffold += f"    - {gate_name}: {score}/100 [{status}]\n"
-        
-        scaffold += f"""
-  Origin-Aware gate (mandatory): {verdict_data["analysis_chain"]["4_gates"]["origin_aware_pass"]}
-  All gates pass: {verdict_data["analysis_chain"]["4_gates"]["all_gates_pass"]}
-  → Therefore, system {"SURVIVES" if verdict_data["analysis_chain"]["4_gates"]["critical_path"] else "FAILS"} survival gates
-
-PHASE 5 - CONSEQUENCES (Network Effect Tracing):
-  Affected domains: {verdict_data["analysis_chain"]["5_consequences"]["affected_domains"]}
-  Overall harm scale: {verdict_data["analysis_chain"]["5_consequences"]["harm_scale"]}
-  Critical tipping points: {len(verdict_data["analysis_chain"]["5_consequences"]["critical_tipping_points"])}
-  → Therefore, consequences compound across {len(verdict_data["analysis_chain"]["5_consequences"]["affected_domains"])} domains
-
-PHASE 6 - VERDICT (Structured Judgment):
-  Final judgment: {verdict_data["final_judgment"]["verdict"]}
-  Confidence: {verdict_data["final_judgment"]["confidence_level"]}
-  
-  Reasoning: {verdict_data["final_judgment"]["reasoning_summary"]}
-  
-  Recommendation: {verdict_data["final_judgment"]["recommendation"]}
-  
-  Critical issues requiring attention:
-"""
-        if verdict_data["final_judgment"]["critical_issues"]:
-            for issue in verdict_data["final_judgment"]["critical_issues"]:
-                scaffold += f"    - {issue}\n"
-        else:
-            scaffold += "    - None detected\n"
-        
-        scaffold += f"""
-═══════════════════════════════════════════════════════════════════════════════
-CONCLUSION:
-This reasoning chain shows WHY the system {"survives" if verdict_data["final_judgment"]["survival"] else "fails"}, 
-not just that it does. Each judgment is traceable to axiom-based reasoning.
-═══════════════════════════════════════════════════════════════════════════════
-"""
-        return scaffold
+        Rendered from the precompiled SCAFFOLD_TEMPLATE (evaluation/scaffold.py);
+        PipelineResult.scaffold renders it lazily or streams it to a writer.
+        """
+        return SCAFFOLD_TEMPLATE.render(scaffold_context(verdict_data))
     
     def evaluate_legacy(self, query: str, system: Dict, axioms: Optional[Dict] = None) -> Dict:
         """
         Legacy interface for backward compatibility.
-        Calls the new integrated pipeline but returns legacy format.
+        Calls the new integrated pipeline but returns legacy format
+        (a read-only ResultView over the same result, built when read).
+        The legacy format needs every phase and the scaffold, so it is
+        always evaluated at detail level "full".
         """
-        result = self.evaluate(query, system, axioms)
+        result = self.evaluate(query, system, axioms, detail_level="full")
         
-        return {
+        def phase(name):
+            return result["reasoning_phases"][name]
+        
+        def violations():
+            return phase("phase_3_mirror")["violations"]
+        
+        def gate_scores():
+            return phase("phase_4_gates")["gate_scores"]
+        
+        return ResultView({
             "Query": query,
-            "Primary System": result["reasoning_phases"]["phase_1_scan"]["primary_domain"],
-            "Friction Points": [
-                v["violation"] for v in result["reasoning_phases"]["phase_3_mirror"]["violations"]
-            ],
-            "Consequences": [
-                f"{v['violation']} → {v['consequence']}"
-                for v in result["reasoning_phases"]["phase_3_mirror"]["violations"]
-            ],
-            "Tri-Axial Gate Scores": result["reasoning_phases"]["phase_4_gates"]["gate_scores"],
-            "Origin-Aware Gate": "Survive" if result["reasoning_phases"]["phase_4_gates"]["origin_aware_critical"] else "Fail",
-            "Total Score": sum(result["reasoning_phases"]["phase_4_gates"]["gate_scores"].values()),
-            "Final Judgment": result["phase_6_verdict"]["final_judgment"],
-            "Chain-of-Thought": result["cot_scaffold"]
-        }
+            "Primary System": Deferred(lambda: phase("phase_1_scan")["primary_domain"]),
+            "Friction Points": Deferred(lambda: [v["violation"] for v in violations()]),
+            "Consequences": Deferred(lambda: [
+                f"{v['violation']} → {v['consequence']}" for v in violations()
+            ]),
+            "Tri-Axial Gate Scores": Deferred(gate_scores),
+            "Origin-Aware Gate": Deferred(
+                lambda: "Survive" if phase("phase_4_gates")["origin_aware_critical"] else "Fail"
+            ),
+            "Total Score": Deferred(lambda: sum(gate_scores().values())),
+            "Final Judgment": Deferred(lambda: result["phase_6_verdict"]["final_judgment"]),
+            "Chain-of-Thought": Deferred(lambda: result["cot_scaffold"])
+        })
     
-    def evaluate_with_deepseek(self, query: str, verbose: bool = False) -> Dict:
+    def evaluate_with_deepseek(self, query: str, verbose: bool = False,
+                               retriever: Optional[Callable[[str], Any]] = None) -> Dict:
         """
         Full integration: deepseek-r1:8b → Criterion reasoning → verdict
         
         Automatically extracts semantic meaning using deepseek-r1:8b from Ollama,
         then runs through the complete reasoning pipeline.
         
+        The Ollama extraction runs as a stage DAG (see evaluate_stages)
+        concurrently with SCAN and the optional evidence retrieval.
+        
         Args:
             query: User query or proposal to analyze
-            verbose: Print intermediate steps
+            verbose: Print intermediate steps and stage timings
+            retriever: Optional callable query -> evidence hits, attached as
+                       system_data["retrieved_evidence"]
             
         Returns:
             Complete analysis with LLM semantic layer integrated
@@ -261,30 +584,205 @@ not just that it does. Each judgment is traceable to axiom-based reasoning.
         """
         from evaluation.llm_integration import OllamaLLMBridge
         
-        # Initialize LLM bridge (will verify Ollama connection)
-        bridge = OllamaLLMBridge()
+        def extract(query):
+            # Initialize LLM bridge (will verify Ollama connection), then
+            # extract semantic meaning using deepseek-r1:8b
+            return OllamaLLMBridge().extract_semantic_meaning(query)
         
-        # Extract semantic meaning using deepseek-r1:8b
         if verbose:
-            print(f"\n📡 Extracting semantic meaning with deepseek-r1:8b...")
-        system_data = bridge.extract_semantic_meaning(query)
+            print("\n📡 Extracting semantic meaning with deepseek-r1:8b "
+                  "(keyword phases run concurrently)...")
+        run = self.evaluate_stages(query, extractor=extract, retriever=retriever)
+        system_data = run["extraction"]
         
         if verbose:
             print(f"   Domain: {system_data['domain']}")
             print(f"   Intent: {system_data['intent']}")
             print(f"   Assumptions identified: {len(system_data['assumptions'])}")
         
-        # Run reasoning pipeline with LLM extraction
+        # Reasoning pipeline with LLM extraction
+        result = self._record(run["result"].view())
+        
         if verbose:
-            print(f"\n🧠 Running Criterion reasoning engine...")
-        result = self.evaluate(query, system_data, llm_extraction=system_data)
+            print("\n🧠 Criterion reasoning engine stages:")
+            for stage, seconds in run.stage_seconds().items():
+                print(f"   {stage:<13} {seconds * 1000:8.2f} ms")
+            print(f"   critical path: {' → '.join(run.critical_path())} "
+                  f"({run.wall_seconds * 1000:.2f} ms wall)")
+            if "reasoning_phases" in result:     # absent at detail level "verdict"
+                phases = result["reasoning_phases"]
+                print(f"   Axiom violations: {phases['phase_3_mirror']['total_violations']}")
+                print(f"   Gates status: {'PASS' if phases['phase_4_gates']['all_gates_pass'] else 'FAIL'}")
+            print(f"   Verdict: {result['phase_6_verdict']['final_judgment']}")
+        
+        return result
+    
+    async def evaluate_async(self, query: str, system_data: Dict[str, Any],
+                             llm_extraction: Optional[Dict] = None,
+                             detail_level: Optional[str] = None,
+                             executor: Optional[Executor] = None) -> Dict:
+        """
+        evaluate() for asyncio code: the reasoning runs on an executor so the
+        event loop keeps serving other requests.
+        
+        Args:
+            query, system_data, llm_extraction, detail_level: As for evaluate()
+            executor: concurrent.futures executor (default: the loop's default)
+        
+        Returns:
+            Same result as evaluate()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(self.evaluate, query, system_data, llm_extraction, detail_level)
+        )
+    
+    async def evaluate_with_deepseek_async(self, query: str, verbose: bool = False,
+                                           retriever: Optional[Callable[[str], Any]] = None,
+                                           bridge: Any = None, timeout: float = 300,
+                                           executor: Optional[Executor] = None) -> Dict:
+        """
+        evaluate_with_deepseek() for asyncio code.
+        
+        The Ollama request is awaited on the event loop (bounded by the
+        bridge's max_concurrency and this call's deadline); the optional
+        retriever and the reasoning itself run on the executor.
+        
+        Args:
+            query: User query or proposal to analyze
+            verbose: Print intermediate steps
+            retriever: Optional callable query -> evidence hits, attached as
+                       system_data["retrieved_evidence"] (blocking; runs on the
+                       executor concurrently with the extraction)
+            bridge: OllamaLLMBridge to use; share one across calls so its
+                    concurrency limit applies to all of them
+                    (default: a new bridge from OllamaLLMBridge.connect())
+            timeout: Extraction deadline in seconds
+            executor: concurrent.futures executor (default: the loop's default)
+            
+        Returns:
+            Same result as evaluate_with_deepseek()
+            
+        Raises:
+            ConnectionError: If Ollama is not running (when no bridge is given)
+        """
+        from evaluation.llm_integration import OllamaLLMBridge
+        
+        if bridge is None:
+            bridge = await OllamaLLMBridge.connect()
+        loop = asyncio.get_running_loop()
         
         if verbose:
-            print(f"   Axiom violations: {result['reasoning_phases']['phase_3_mirror']['total_violations']}")
-            print(f"   Gates status: {'PASS' if result['reasoning_phases']['phase_4_gates']['all_gates_pass'] else 'FAIL'}")
+            print(f"\n📡 Extracting semantic meaning with {bridge.model} (async)...")
+        extraction = bridge.extract_semantic_meaning_async(query, timeout=timeout)
+        evidence = None
+        if retriever is None:
+            system_data = await extraction
+        else:
+            system_data, evidence = await asyncio.gather(
+                extraction, loop.run_in_executor(executor, retriever, query)
+            )
+        
+        if verbose:
+            print(f"   Domain: {system_data['domain']}")
+            print(f"   Intent: {system_data['intent']}")
+            print(f"   Assumptions identified: {len(system_data['assumptions'])}")
+        
+        profile = system_data if evidence is None else {**system_data, "retrieved_evidence": evidence}
+        result = await loop.run_in_executor(
+            executor,
+            functools.partial(self._evaluate_view, query, profile, system_data, self.detail_level)
+        )
+        
+        if verbose:
+            print("\n🧠 Criterion reasoning engine:")
+            if "reasoning_phases" in result:     # absent at detail level "verdict"
+                phases = result["reasoning_phases"]
+                print(f"   Axiom violations: {phases['phase_3_mirror']['total_violations']}")
+                print(f"   Gates status: {'PASS' if phases['phase_4_gates']['all_gates_pass'] else 'FAIL'}")
             print(f"   Verdict: {result['phase_6_verdict']['final_judgment']}")
         
         return result
+    
+    async def evaluate_stream_async(self, query: str,
+                                    system_data: Optional[Dict[str, Any]] = None,
+                                    llm_extraction: Optional[Dict] = None,
+                                    extractor: Optional[Callable[[str], Any]] = None,
+                                    retriever: Optional[Callable[[str], Any]] = None,
+                                    detail_level: Optional[str] = None,
+                                    executor: Optional[Executor] = None
+                                    ) -> AsyncIterator[PhaseEvent]:
+        """
+        evaluate_stream() for asyncio code, as an async iterator.
+        
+        The stream runs on the executor and hands each event to the event
+        loop as soon as it is yielded. extractor may be a coroutine function
+        (e.g. bridge.extract_semantic_meaning_async), which is awaited on
+        this loop; leaving the iteration early cancels it.
+        
+            async for event in pipeline.evaluate_stream_async(
+                    query, extractor=bridge.extract_semantic_meaning_async):
+                await send(event.phase, event.data)
+        
+        Args:
+            query, system_data, llm_extraction, retriever, detail_level: As for
+                evaluate_stream()
+            extractor: Callable or coroutine function query -> system_data
+            executor: concurrent.futures executor (default: the loop's default)
+        
+        Yields:
+            PhaseEvent, as from evaluate_stream()
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        closing = threading.Event()
+        pending = []
+        finished = object()
+        
+        if extractor is not None and inspect.iscoroutinefunction(extractor):
+            extract_async = extractor
+            
+            def extractor(query):
+                future = asyncio.run_coroutine_threadsafe(extract_async(query), loop)
+                pending.append(future)
+                if closing.is_set():
+                    future.cancel()
+                return future.result()
+        
+        def produce():
+            try:
+                events = self.evaluate_stream(query, system_data, llm_extraction,
+                                              extractor, retriever, detail_level)
+                try:
+                    for event in events:
+                        loop.call_soon_threadsafe(queue.put_nowait, event)
+                        if closing.is_set():
+                            break
+                finally:
+                    events.close()
+            except BaseException as e:
+                if not closing.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                if not closing.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, finished)
+        
+        producer = loop.run_in_executor(executor, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            closing.set()
+            for future in pending:
+                future.cancel()
+            # produce() reports its own errors; this only waits for the thread
+            await producer
 
 
 # Standalone functions for direct use (simple interface)
@@ -301,5 +799,6 @@ def evaluate(query: str, system: Dict, axioms: Optional[Dict] = None) -> Dict:
     Returns:
         Integrated reasoning output with CoT scaffold
     """
-    pipeline = CriterionPipeline()
+    # Shared engine: the axioms file is only re-read when it changes
+    pipeline = get_pipeline()
     return pipeline.evaluate(query, system, axioms)
@@ -0,0 +1,268 @@
+"""
+Pipelined Batch: overlap LLM extraction with engine evaluation
+
+A plain batch loop runs extract → evaluate → extract → evaluate ..., so the
+CPU sits idle while Ollama generates and Ollama sits idle while the engine
+evaluates. PipelinedBatch splits the loop into two stages joined by a
+bounded queue:
+
+    queries ──► K extraction threads ──► queue (maxsize) ──► evaluator ──► results
+                (OllamaLLMBridge,                           (CriterionPipeline.evaluate,
+                 K requests in flight)                       the caller's thread)
+
+The extraction threads keep up to K requests in flight. When the queue is
+full they block instead of taking new queries (backpressure), so at most
+K + queue_size extractions are ever held in memory. The evaluator takes
+extractions as they finish, in completion order, and runs on the iterating
+thread. Under the GIL one evaluator is as fast as several, and evaluation
+takes milliseconds next to seconds of generation.
+
+Each run records how busy each stage was and how full the queue got:
+run.stats.to_dict() / run.stats.report().
+
+Usage:
+    from evaluation.pipelined_batch import PipelinedBatch
+
+    batch = PipelinedBatch(OllamaLLMBridge(), CriterionPipeline(), extractors=4)
+    for item in batch.stream(queries):            # completion order
+        print(item.index, item.result["phase_6_verdict"]["final_judgment"])
+    print(batch.stats.report())
+
+    items = batch.run(queries)                    # input order
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class BatchItem:
+    """One query's extraction and evaluation (error set if either raised)"""
+
+    __slots__ = ("index", "query", "system_data", "result", "error")
+
+    def __init__(self, index: int, query: str, system_data: Optional[Dict] = None,
+                 result: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.query = query
+        self.system_data = system_data
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PipelineStats:
+    """Stage utilisation and queue depth of one PipelinedBatch run"""
+
+    def __init__(self, extractors: int, queue_size: int):
+        self.extractors = extractors
+        self.queue_size = queue_size
+        self.items = 0
+        self.errors = 0
+        self.extract_busy = 0.0      # summed over extraction threads
+        self.evaluate_busy = 0.0
+        self.evaluator_starved = 0.0 # evaluator waiting on an empty queue
+        self.producer_blocked = 0.0  # extraction threads waiting on a full queue
+        self.depth_samples = 0
+        self.depth_total = 0
+        self.depth_max = 0
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add_extraction(self, busy: float, blocked: float):
+        with self._lock:
+            self.extract_busy += busy
+            self.producer_blocked += blocked
+
+    def sample_depth(self, depth: int):
+        """Queue depth seen by the evaluator before each take"""
+        self.depth_samples += 1
+        self.depth_total += depth
+        if depth > self.depth_max:
+            self.depth_max = depth
+
+    @property
+    def wall_seconds(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def to_dict(self) -> Dict:
+        wall = self.wall_seconds
+        return {
+            "items": self.items,
+            "errors": self.errors,
+            "wall_seconds": wall,
+            "items_per_second": self.items / wall if wall > 0 else 0.0,
+            "extract": {
+                "threads": self.extractors,
+                "busy_seconds": self.extract_busy,
+                "utilisation": self.extract_busy / (wall * self.extractors) if wall > 0 else 0.0,
+                "blocked_seconds": self.producer_blocked
+            },
+            "evaluate": {
+                "busy_seconds": self.evaluate_busy,
+                "utilisation": self.evaluate_busy / wall if wall > 0 else 0.0,
+                "starved_seconds": self.evaluator_starved
+            },
+            "queue": {
+                "maxsize": self.queue_size,
+                "mean_depth": self.depth_total / self.depth_samples if self.depth_samples else 0.0,
+                "max_depth": self.depth_max
+            }
+        }
+
+    def report(self) -> str:
+        """One-paragraph human-readable summary"""
+        stats = self.to_dict()
+        extract, evaluate, depth = stats["extract"], stats["evaluate"], stats["queue"]
+        return (
+            f"{stats['items']} items in {stats['wall_seconds']:.2f}s "
+            f"({stats['items_per_second']:.2f}/s, {stats['errors']} errors)\n"
+            f"  extract  x{extract['threads']}: {extract['utilisation']:6.1%} busy, "
+            f"{extract['blocked_seconds']:.2f}s blocked on a full queue\n"
+            f"  evaluate x1: {evaluate['utilisation']:6.1%} busy, "
+            f"{evaluate['starved_seconds']:.2f}s waiting for extractions\n"
+            f"  queue: mean depth {depth['mean_depth']:.2f}, "
+            f"max {depth['max_depth']}/{depth['maxsize']}"
+        )
+
+
+# Marks the end of the extraction stage on the queue
+_DONE = object()
+
+
+class PipelinedBatch:
+    """
+    Two-stage batch driver: concurrent extraction, then evaluation.
+    """
+
+    def __init__(self, bridge: Any = None, pipeline: Any = None, extractors: int = 4,
+                 queue_size: int = 8, detail_level: Optional[str] = None):
+        """
+        Args:
+            bridge: Object with extract_semantic_meaning(query) -> system_data
+                    (default: a new OllamaLLMBridge with a keep-alive pool of
+                    one connection per extraction thread)
+            pipeline: CriterionPipeline (default: the shared one from
+                      evaluation.registry)
+            extractors: Extraction threads, i.e. requests kept in flight
+                        (match the server's OLLAMA_NUM_PARALLEL)
+            queue_size: Finished extractions allowed to wait for the evaluator
+            detail_level: Detail level for evaluate() (default: the pipeline's)
+        """
+        if extractors < 1 or queue_size < 1:
+            raise ValueError("extractors and queue_size must be at least 1")
+        if bridge is None:
+            from evaluation.llm_integration import OllamaLLMBridge
+            bridge = OllamaLLMBridge(pool_size=extractors)
+        if pipeline is None:
+            from evaluation.registry import get_pipeline
+            pipeline = get_pipeline()
+        self.bridge = bridge
+        self.pipeline = pipeline
+        self.extractors = extractors
+        self.queue_size = queue_size
+        self.detail_level = detail_level
+        self.stats: Optional[PipelineStats] = None
+
+    def stream(self, queries: Iterable[str]) -> Iterator[BatchItem]:
+        """
+        Evaluate queries, yielding each as soon as it is evaluated.
+
+        Args:
+            queries: Queries to analyze (consumed lazily by the extraction threads)
+
+        Yields:
+            BatchItem in completion order (item.index is the input position)
+
+        The run's PipelineStats is self.stats (complete once the stream ends).
+        Closing the stream early stops new extractions and waits for the
+        ones in flight.
+        """
+        stats = self.stats = PipelineStats(self.extractors, self.queue_size)
+        handoff: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        source = enumerate(queries)
+        source_lock = threading.Lock()
+        stopping = threading.Event()
+
+        def next_query():
+            with source_lock:
+                if stopping.is_set():
+                    return None
+                return next(source, None)
+
+        def extract_loop():
+            try:
+                while True:
+                    entry = next_query()
+                    if entry is None:
+                        return
+                    index, query = entry
+                    item = BatchItem(index, query)
+                    started = time.perf_counter()
+                    try:
+                        item.system_data = self.bridge.extract_semantic_meaning(query)
+                    except Exception as e:
+                        item.error = e
+                    extracted = time.perf_counter()
+                    while not stopping.is_set():
+                        try:
+                            handoff.put(item, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    stats.add_extraction(extracted - started, time.perf_counter() - extracted)
+            finally:
+                handoff.put(_DONE)
+
+        threads = [
+            threading.Thread(target=extract_loop, name=f"criterion-extract-{n}", daemon=True)
+            for n in range(self.extractors)
+        ]
+        for thread in threads:
+            thread.start()
+
+        running = len(threads)
+        try:
+            while running:
+                stats.sample_depth(handoff.qsize())
+                waited = time.perf_counter()
+                item = handoff.get()
+                stats.evaluator_starved += time.perf_counter() - waited
+                if item is _DONE:
+                    running -= 1
+                    continue
+
+                if item.error is None:
+                    started = time.perf_counter()
+                    try:
+                        item.result = self.pipeline.evaluate(item.query, item.system_data,
+                                                             detail_level=self.detail_level)
+                    except Exception as e:
+                        item.error = e
+                    stats.evaluate_busy += time.perf_counter() - started
+                stats.items += 1
+                stats.errors += item.error is not None
+                yield item
+        finally:
+            stopping.set()
+            # Drain so blocked extraction threads can finish
+            while running:
+                if handoff.get() is _DONE:
+                    running -= 1
+            for thread in threads:
+                thread.join()
+            stats.end = time.perf_counter()
+
+    def run(self, queries: Iterable[str]) -> List[BatchItem]:
+        """
+        Evaluate queries with extraction and evaluation overlapped.
+
+        Returns:
+            BatchItems in input order (stats in self.stats)
+        """
+        return sorted(self.stream(queries), key=lambda item: item.index)
@@ -0,0 +1,135 @@
+"""
+Query Analyzer: single-pass keyword detection for SCAN and EXTRACT
+
+The SCAN and EXTRACT phases both look for keywords in the query text
+(domain keywords, assumption triggers, beneficiaries, dismissed harms and
+statement-type markers). Instead of one substring scan per keyword, every
+keyword table is compiled once into a keyword index. A query is tokenized
+once and the token set is probed against the index, so the cost grows with
+the length of the text rather than text length x keyword count.
+
+Matching is word-boundary aware: "gain" does not match inside "against",
+and "is" does not match inside "this". Multi-word phrases ("everyone knows",
+"doesn't harm") are matched as consecutive tokens, and only probed when
+their first word occurs in the query.
+
+Usage:
+    analyzer = QueryAnalyzer({"economic": ["economy", "market"],
+                              "assumption": ["because", "is natural"]})
+    features = analyzer.analyze("The market is natural because ...")
+    features.get("assumption")   # ("because", "is natural")
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+
+# Same notion of a "word" as the regex \b boundary: runs of word characters
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase and split text into word tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class QueryFeatures:
+    """
+    Keyword matches for one query, shared by every phase that reads the text.
+
+    `matches` maps a table name to the matched keywords of that table, in the
+    order the keywords were declared (not the order they occur in the text),
+    each keyword listed once.
+    """
+    matches: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    token_count: int = 0
+
+    def get(self, table: str) -> Tuple[str, ...]:
+        """Matched keywords of a table (empty tuple if none matched)"""
+        return self.matches.get(table, ())
+
+    def has(self, table: str) -> bool:
+        """True if any keyword of the table occurs in the query"""
+        return table in self.matches
+
+    def count(self, table: str) -> int:
+        """Number of distinct keywords of the table found in the query"""
+        return len(self.matches.get(table, ()))
+
+
+class QueryAnalyzer:
+    """
+    Precompiled multi-table keyword matcher.
+
+    Built once (typically in CriterionReasoningEngine.__init__) from named
+    keyword tables; `analyze()` then makes a single pass over a query and
+    returns a QueryFeatures object.
+    """
+
+    def __init__(self, tables: Dict[str, Iterable[str]]):
+        """
+        Compile keyword tables into a keyword index.
+
+        Args:
+            tables: Mapping of table name -> keywords (single words or phrases).
+                    A keyword may appear in several tables.
+        """
+        self.tables = {name: tuple(keywords) for name, keywords in tables.items()}
+
+        # normalized key -> [(table, keyword, declaration index), ...]
+        self._index: Dict[str, List[Tuple[str, str, int]]] = {}
+        self._words = set()
+        # first token -> [" second third ..." probes of phrases starting with it]
+        self._phrases: Dict[str, List[str]] = {}
+
+        for name, keywords in self.tables.items():
+            for position, keyword in enumerate(keywords):
+                tokens = _tokenize(keyword)
+                if not tokens:
+                    continue
+                key = " ".join(tokens)
+                self._index.setdefault(key, []).append((name, keyword, position))
+                if len(tokens) == 1:
+                    self._words.add(key)
+                else:
+                    probes = self._phrases.setdefault(tokens[0], [])
+                    if key not in probes:
+                        probes.append(key)
+
+        self._phrase_starts = frozenset(self._phrases)
+
+    def analyze(self, text: str) -> QueryFeatures:
+        """
+        Find every keyword of every table in one pass over the text.
+
+        Args:
+            text: Query or statement to analyze
+
+        Returns:
+            QueryFeatures with per-table matches
+        """
+        tokens = _tokenize(text)
+        present = set(tokens)
+
+        keys = present & self._words
+        starts = present & self._phrase_starts
+        if starts:
+            # Space-joined tokens make phrase probes word-boundary exact
+            joined = f" {' '.join(tokens)} "
+            for start in starts:
+                for phrase in self._phrases[start]:
+                    if f" {phrase} " in joined:
+                        keys.add(phrase)
+
+        found: Dict[str, List[Tuple[int, str]]] = {}
+        for key in keys:
+            for table, keyword, position in self._index[key]:
+                found.setdefault(table, []).append((position, keyword))
+
+        matches = {
+            table: tuple(keyword for _, keyword in sorted(hits))
+            for table, hits in found.items()
+        }
+        return QueryFeatures(matches=matches, token_count=len(tokens))
@@ -16,11 +16,15 @@ Usage:
     engine = CriterionReasoningEngine()
     reasoning = engine.reason(query, system_data)
     verdict = reasoning['verdict']
+
+    # Slotted result object; dicts are built on to_dict()
+    result = engine.reason_result(query, system_data)
+    result.survival, result.critical_issues
 """
 
 import json
+import warnings
 from pathlib import Path
-from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
@@ -30,29 +34,13 @@ from evaluation.gates import (
     mediation_zeroing_gate,
     origin_aware_gate
 )
-
-
-@dataclass
-class Friction:
-    """Represents a design violation detected during axiom mirroring"""
-    axiom: str
-    violation: str
-    severity: str  # "critical", "high", "medium", "low"
-    consequence: str
-    affected_domains: List[str]
-
-
-@dataclass
-class ConsequenceChain:
-    """Traces cascading effects of a friction point across domains and time"""
-    friction: str
-    immediate_effect: str
-    secondary_effects: str
-    tertiary_effects: str
-    systemic_amplification: str
-    affected_domains: List[str]
-    time_horizon: str
-    reversibility: str
+from evaluation.query_analyzer import QueryAnalyzer, QueryFeatures
+from evaluation.axiom_rules import compile_mirror_rules
+from evaluation.result_cache import ResultCache, fingerprint
+from evaluation.verdict_table import VerdictTable, VerdictTableError
+from evaluation.dag import StageGraph
+from evaluation.instrumentation import instrumented
+from evaluation.results import ConsequenceSet, GateResult, Verdict
 
 
 class SystemDomain(Enum):
@@ -65,6 +53,52 @@ class SystemDomain(Enum):
     GENERAL = "general"
 
 
+# How much of the reasoning chain reason() builds:
+# - "verdict": final judgment and gate scores only (no EXTRACT, no consequence chains)
+# - "summary": every phase, but consequences without the traced chain strings
+# - "full": complete reasoning chain (default)
+DETAIL_LEVELS = ("verdict", "summary", "full")
+
+# Axioms file used when no path is given
+DEFAULT_AXIOMS_PATH = str(Path(__file__).parent.parent / "axioms" / "core_axioms.json")
+
+# The four survival gates, in scoring order
+GATE_DEFINITIONS = (
+    ("Source Integrity", {
+        "criteria": "Preserves raw truth without reduction or distortion",
+        "required": True,
+        "reasoning": (
+            "System must accept raw truth as-is, not reinterpret for convenience. "
+            "Requires evidence-based or revelation-based justification."
+        )
+    }),
+    ("Structural Consistency", {
+        "criteria": "Grounds causality and morality in non-contingent source",
+        "required": True,
+        "reasoning": (
+            "System must not reduce causality and moral order to chance or emergence. "
+            "Requires non-contingent grounding."
+        )
+    }),
+    ("Mediation Zeroing", {
+        "criteria": "Treats human preference as derivative, not sovereign",
+        "required": True,
+        "reasoning": (
+            "System must reject secular humanism as foundational. "
+            "Human preference cannot be the ultimate arbiter."
+        )
+    }),
+    ("Origin Aware", {
+        "criteria": "Acknowledges self-authenticating transcendent source",
+        "required": True,
+        "reasoning": (
+            "System MUST acknowledge transcendent source explicitly. "
+            "This is non-negotiable; system fails if missing."
+        )
+    }),
+)
+
+
 class CriterionReasoningEngine:
     """
     The Criterion as a reasoning framework for LLM-guided architecture analysis.
@@ -74,18 +108,30 @@ class CriterionReasoningEngine:
     problems architecturally rather than generatively.
     """
     
-    def __init__(self, axioms_path: Optional[str] = None):
+    def __init__(self, axioms_path: Optional[str] = None, detail_level: str = "full",
+                 cache: Optional[ResultCache] = None, verdict_table: bool = False,
+                 axioms: Optional[Dict] = None):
         """
         Initialize the reasoning engine.
         
         Args:
             axioms_path: Path to core_axioms.json. If None, uses default location.
+            detail_level: Default detail level of reason() (see DETAIL_LEVELS)
+            cache: Optional ResultCache memoizing reason() results
+            verdict_table: Answer MIRROR/GATES/CONSEQUENCES from a lazily filled
+                           VerdictTable (see enable_verdict_table)
+            axioms: Already-parsed axioms (axioms_path is then not read)
         """
-        if axioms_path is None:
-            axioms_path = str(Path(__file__).parent.parent / "axioms" / "core_axioms.json")
+        self.detail_level = self._check_detail_level(detail_level)
+        self.cache = cache
         
-        with open(axioms_path, 'r') as f:
-            self.axioms = json.load(f)
+        if axioms is None:
+            if axioms_path is None:
+                axioms_path = DEFAULT_AXIOMS_PATH
+            with open(axioms_path, 'r') as f:
+                axioms = json.load(f)
+        self.axioms = axioms
+        self.axioms_fingerprint = fingerprint(self.axioms)
         
         self.domain_keywords = {
             SystemDomain.ECONOMIC: ["economy", "interest", "finance", "money", "capital", 
@@ -103,12 +149,128 @@ class CriterionReasoningEngine:
             SystemDomain.BIOLOGICAL: ["life", "health", "reproduction", "body", "survival",
                                      "natural", "instinct", "biological", "organic", "vitality"]
         }
+        
+        # These would normally come from Layer 2; for now, basic extraction
+        self.assumption_triggers = {
+            "because": "causal assumption",
+            "should": "moral assumption",
+            "is natural": "naturalization assumption",
+            "is obvious": "obviousness assumption",
+            "everyone knows": "universal acceptance assumption",
+            "best for": "optimization assumption",
+            "necessary to": "necessity assumption"
+        }
+        
+        self.beneficiary_keywords = {
+            "people": "humanity",
+            "society": "social collective",
+            "economy": "economic actors",
+            "majority": "numerical majority",
+            "minority": "marginalized groups",
+            "future": "future generations"
+        }
+        
+        # Words suggesting negation of harm
+        self.harm_keywords = ["doesn't harm", "only affects", "minimal", "negligible", "acceptable cost"]
+        
+        self.statement_markers = {
+            "prescriptive": ["should", "must", "ought"],
+            "descriptive": ["is", "are", "exists"],
+            "evaluative": ["good", "bad", "better", "worse"]
+        }
+        
+        # One keyword index over every keyword table, so SCAN and EXTRACT share
+        # a single pass over the query text
+        analyzer_tables = {domain.value: keywords for domain, keywords in self.domain_keywords.items()}
+        analyzer_tables.update({
+            "assumption": list(self.assumption_triggers),
+            "beneficiary": list(self.beneficiary_keywords),
+            "harm": self.harm_keywords,
+            "obligation": ["should", "must"],
+            "because": ["because"],
+        })
+        analyzer_tables.update(
+            {f"statement:{kind}": words for kind, words in self.statement_markers.items()}
+        )
+        self.analyzer = QueryAnalyzer(analyzer_tables)
+        self.domain_type = SystemDomain
+        self._domain_tables = [(domain, domain.value) for domain in self.domain_keywords]
+        
+        # MIRROR rules declared in the axioms file, compiled to a decision table
+        self.mirror = compile_mirror_rules(self.axioms, list(self.domain_keywords.keys()))
+        
+        self.verdict_table: Optional[VerdictTable] = None
+        if verdict_table:
+            self.enable_verdict_table()
+    
+    def enable_verdict_table(self, path: Optional[str] = None, eager: bool = False,
+                             verify: bool = False) -> Optional[VerdictTable]:
+        """
+        Serve MIRROR, GATES and CONSEQUENCES from a precomputed VerdictTable.
+        
+        Args:
+            path: Artifact file. Loaded if it was built for this axiom set;
+                  otherwise the table is built and saved there.
+            eager: Fill every slot now instead of on first use
+            verify: Check every slot against the regular phases
+            
+        Returns:
+            The VerdictTable now used by reason(), or None (with a
+            RuntimeWarning) when the axioms read too many flags for a table
+            
+        Raises:
+            VerdictTableError: verify found slots that differ from the regular phases
+        """
+        try:
+            table = VerdictTable(self)
+        except VerdictTableError as e:
+            warnings.warn(f"Verdict table disabled, using the regular phases: {e}",
+                          RuntimeWarning, stacklevel=2)
+            self.verdict_table = None
+            return None
+        if path is not None:
+            try:
+                table = VerdictTable.load(path, self)
+            except (FileNotFoundError, VerdictTableError):
+                table.save(path)
+        elif eager:
+            table.build()
+        
+        if verify:
+            mismatches = table.verify()
+            if mismatches:
+                raise VerdictTableError(
+                    f"Verdict table disagrees with the reasoning phases in "
+                    f"{len(mismatches)} slots, e.g. {mismatches[0]}"
+                )
+        
+        self.verdict_table = table
+        return table
+    
+    @staticmethod
+    def _check_detail_level(detail_level: str) -> str:
+        """Validate a detail level name"""
+        if detail_level not in DETAIL_LEVELS:
+            raise ValueError(
+                f"Unknown detail_level '{detail_level}'. Expected one of: {', '.join(DETAIL_LEVELS)}"
+            )
+        return detail_level
+    
+    @instrumented("SCAN")
+    def analyze_query(self, query: str) -> QueryFeatures:
+        """
+        Run the shared keyword pass over a query.
+        
+        The returned features can be handed to scan(), extract_assumptions()
+        and the statement helpers so the text is only scanned once.
+        """
+        return self.analyzer.analyze(query)
     
     # ═══════════════════════════════════════════════════════════════════
     # PHASE 1: SCAN - Identify what system is being analyzed
     # ═══════════════════════════════════════════════════════════════════
     
-    def scan(self, query: str) -> Dict:
+    def scan(self, query: str, features: Optional[QueryFeatures] = None) -> Dict:
         """
         SCAN: Identify the primary domain and secondary contexts.
         
@@ -118,20 +280,14 @@ class CriterionReasoningEngine:
         
         Args:
             query: The statement or query to analyze
+            features: Precomputed keyword features (from analyze_query)
             
         Returns:
             Dict with primary_system, detected_systems, and reasoning
         """
-        query_lower = query.lower()
-        detected_systems = []
-        
-        for domain, keywords in self.domain_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in query_lower)
-            if score > 0:
-                detected_systems.append((domain, score))
-        
-        # Sort by score, highest first
-        detected_systems.sort(key=lambda x: x[1], reverse=True)
+        if features is None:
+            features = self.analyze_query(query)
+        detected_systems = self._rank_domains(features)
         
         primary_system = detected_systems[0][0] if detected_systems else SystemDomain.GENERAL
         secondary_systems = [d[0] for d in detected_systems[1:3]]
@@ -146,11 +302,32 @@ class CriterionReasoningEngine:
             )
         }
     
+    def _rank_domains(self, features: QueryFeatures) -> List[Tuple[SystemDomain, int]]:
+        """(domain, keyword hits) for every detected domain, highest first"""
+        matches = features.matches
+        detected_systems = []
+        
+        for domain, table in self._domain_tables:
+            score = len(matches.get(table, ()))
+            if score > 0:
+                detected_systems.append((domain, score))
+        
+        # Sort by score, highest first
+        detected_systems.sort(key=lambda x: x[1], reverse=True)
+        return detected_systems
+    
+    def _primary_system(self, features: QueryFeatures) -> str:
+        """SCAN's primary_system without building the SCAN dict"""
+        detected_systems = self._rank_domains(features)
+        return (detected_systems[0][0] if detected_systems else SystemDomain.GENERAL).value
+    
     # ═══════════════════════════════════════════════════════════════════
     # PHASE 2: EXTRACT - Parse assumptions and intent
     # ═══════════════════════════════════════════════════════════════════
     
-    def extract_assumptions(self, statement: str) -> Dict:
+    @instrumented("EXTRACT")
+    def extract_assumptions(self, statement: str,
+                            features: Optional[QueryFeatures] = None) -> Dict:
         """
         EXTRACT: Identify embedded assumptions and true intent.
         
@@ -159,77 +336,58 @@ class CriterionReasoningEngine:
         
         Args:
             statement: The statement to analyze
+            features: Precomputed keyword features (from analyze_query)
             
         Returns:
             Dict with statement_type, assumptions, intent, beneficiaries, harms
         """
-        # These would normally come from Layer 2; for now, basic extraction
-        assumption_triggers = {
-            "because": "causal assumption",
-            "should": "moral assumption",
-            "is natural": "naturalization assumption",
-            "is obvious": "obviousness assumption",
-            "everyone knows": "universal acceptance assumption",
-            "best for": "optimization assumption",
-            "necessary to": "necessity assumption"
-        }
-        
-        statement_lower = statement.lower()
-        detected_assumptions = []
-        
-        for trigger, category in assumption_triggers.items():
-            if trigger in statement_lower:
-                detected_assumptions.append({
-                    "type": category,
-                    "trigger": trigger,
-                    "implicitness": 0.7
-                })
+        if features is None:
+            features = self.analyze_query(statement)
+        
+        detected_assumptions = [
+            {
+                "type": self.assumption_triggers[trigger],
+                "trigger": trigger,
+                "implicitness": 0.7
+            }
+            for trigger in features.get("assumption")
+        ]
         
         # Identify beneficiaries
-        beneficiary_keywords = {
-            "people": "humanity",
-            "society": "social collective",
-            "economy": "economic actors",
-            "majority": "numerical majority",
-            "minority": "marginalized groups",
-            "future": "future generations"
-        }
-        
         beneficiaries = [
-            (entity, group) for entity, group in beneficiary_keywords.items()
-            if entity in statement_lower
+            self.beneficiary_keywords[entity] for entity in features.get("beneficiary")
         ]
         
         # Extract potential harms (words suggesting negation)
-        harm_keywords = ["doesn't harm", "only affects", "minimal", "negligible", "acceptable cost"]
-        dismissed_harms = [keyword for keyword in harm_keywords if keyword in statement_lower]
+        dismissed_harms = list(features.get("harm"))
         
         return {
-            "statement_type": self._classify_statement(statement),
+            "statement_type": self._classify_statement(statement, features),
             "assumptions": detected_assumptions,
             "assumption_count": len(detected_assumptions),
-            "beneficiaries": [b[1] for b in beneficiaries],
+            "beneficiaries": beneficiaries,
             "dismissed_harms": dismissed_harms,
-            "inferred_intent": self._extract_intent(statement)
+            "inferred_intent": self._extract_intent(statement, features)
         }
     
-    def _classify_statement(self, statement: str) -> str:
+    def _classify_statement(self, statement: str,
+                            features: Optional[QueryFeatures] = None) -> str:
         """Classify statement type"""
-        stmt_lower = statement.lower()
-        if any(word in stmt_lower for word in ["should", "must", "ought"]):
-            return "prescriptive"
-        elif any(word in stmt_lower for word in ["is", "are", "exists"]):
-            return "descriptive"
-        elif any(word in stmt_lower for word in ["good", "bad", "better", "worse"]):
-            return "evaluative"
+        if features is None:
+            features = self.analyze_query(statement)
+        for kind in self.statement_markers:
+            if features.has(f"statement:{kind}"):
+                return kind
         return "general"
     
-    def _extract_intent(self, statement: str) -> str:
+    def _extract_intent(self, statement: str,
+                        features: Optional[QueryFeatures] = None) -> str:
         """Extract the real intent behind the statement"""
-        stmt_lower = statement.lower()
-        if "should" in stmt_lower or "must" in stmt_lower:
+        if features is None:
+            features = self.analyze_query(statement)
+        if features.has("obligation"):
             return f"Establish obligation: {statement[:100]}..."
-        elif "because" in stmt_lower:
+        elif features.has("because"):
             parts = statement.split("because")
             return f"Justify: {parts[0].strip()}"
         return f"Assert: {statement[:100]}..."
@@ -253,116 +411,10 @@ class CriterionReasoningEngine:
         Returns:
             Dict with frictions, axiom_compliance, and severity assessment
         """
-        frictions = []
-        axiom_checks = {}
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Transcendence Necessity Axiom
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        
-        if not system_data.get("acknowledges_transcendent_source"):
-            frictions.append(Friction(
-                axiom="Transcendence Necessity",
-                violation="System does not acknowledge non-contingent source for meaning/purpose",
-                severity="critical",
-                consequence="Meaning becomes circular; purpose unfounded; system collapses into nihilism",
-                affected_domains=["spiritual", "intellectual"]
-            ))
-            axiom_checks["transcendence"] = False
-        else:
-            axiom_checks["transcendence"] = True
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Final Court Necessity Axiom
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        
-        if not system_data.get("enables_accountability"):
-            frictions.append(Friction(
-                axiom="Final Court Necessity",
-                violation="System lacks mechanism for ultimate accountability and justice",
-                severity="critical",
-                consequence="Moral debts unresolved; perpetrators unpunished; victims uncompensated; justice remains incomplete",
-                affected_domains=["spiritual", "social"]
-            ))
-            axiom_checks["accountability"] = False
-        else:
-            axiom_checks["accountability"] = True
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Design vs Accident Axiom (Domain-Specific)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        
-        if system_type == "economic":
-            if system_data.get("permits_exploitative_gain"):
-                frictions.append(Friction(
-                    axiom="Design vs Accident",
-                    violation="Economic system permits extractive rather than preservative circulation",
-                    severity="high",
-                    consequence="Degenerative economic model → wealth concentration → systemic inequality → collapse",
-                    affected_domains=["economic", "social"]
-                ))
-                axiom_checks["design_economic"] = False
-            else:
-                axiom_checks["design_economic"] = True
-        
-        if system_type == "social":
-            if system_data.get("destabilizes_lineage"):
-                frictions.append(Friction(
-                    axiom="Design vs Accident",
-                    violation="Social system undermines lineage preservation and intergenerational continuity",
-                    severity="high",
-                    consequence="Family dissolution → cultural fragmentation → loss of knowledge transmission → societal collapse",
-                    affected_domains=["social", "biological"]
-                ))
-                axiom_checks["design_social"] = False
-            else:
-                axiom_checks["design_social"] = True
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Definition of Normal Axiom
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        
-        if system_data.get("deviates_from_optimal_functioning"):
-            deviation_domain = system_data.get("deviation_domain", "unknown")
-            frictions.append(Friction(
-                axiom="Definition of Normal",
-                violation=f"System deviates from optimal human functioning in {deviation_domain}",
-                severity="high",
-                consequence="Normalization of dysfunction → reduced flourishing → generational degradation",
-                affected_domains=[deviation_domain, "biological"]
-            ))
-            axiom_checks["definition_normal"] = False
-        else:
-            axiom_checks["definition_normal"] = True
-        
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Network Effect Axiom
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        
-        if system_data.get("causes_harm_amplification"):
-            frictions.append(Friction(
-                axiom="Network Effect",
-                violation="System's local benefits compound into exponential global harm",
-                severity="critical",
-                consequence="Cascading systemic degradation → multi-domain collapse → irreversible damage",
-                affected_domains=list(self.domain_keywords.keys())  # All domains affected
-            ))
-            axiom_checks["network_effect"] = False
-        else:
-            axiom_checks["network_effect"] = True
-        
-        return {
-            "frictions": [asdict(f) for f in frictions],
-            "axiom_compliance": axiom_checks,
-            "total_violations": len(frictions),
-            "critical_violations": sum(1 for f in frictions if f.severity == "critical"),
-            "severity_distribution": {
-                "critical": sum(1 for f in frictions if f.severity == "critical"),
-                "high": sum(1 for f in frictions if f.severity == "high"),
-                "medium": sum(1 for f in frictions if f.severity == "medium"),
-                "low": sum(1 for f in frictions if f.severity == "low")
-            }
-        }
+        # The axiom rules (Transcendence Necessity, Final Court Necessity,
+        # Design vs Accident, Definition of Normal, Network Effect) are declared
+        # in core_axioms.json and compiled into self.mirror at construction
+        return self.mirror.evaluate_result(system_data, system_type).to_dict()
     
     # ═══════════════════════════════════════════════════════════════════
     # PHASE 4: GATES - Apply tri-axial survival filters
@@ -381,106 +433,66 @@ class CriterionReasoningEngine:
         Returns:
             Dict with gate scores, pass/fail status, and reasoning
         """
-        gates = {
-            "Source Integrity": {
-                "score": source_integrity_gate(system_data),
-                "criteria": "Preserves raw truth without reduction or distortion",
-                "required": True,
-                "reasoning": (
-                    "System must accept raw truth as-is, not reinterpret for convenience. "
-                    "Requires evidence-based or revelation-based justification."
-                )
-            },
-            "Structural Consistency": {
-                "score": structural_consistency_gate(system_data),
-                "criteria": "Grounds causality and morality in non-contingent source",
-                "required": True,
-                "reasoning": (
-                    "System must not reduce causality and moral order to chance or emergence. "
-                    "Requires non-contingent grounding."
-                )
-            },
-            "Mediation Zeroing": {
-                "score": mediation_zeroing_gate(system_data),
-                "criteria": "Treats human preference as derivative, not sovereign",
-                "required": True,
-                "reasoning": (
-                    "System must reject secular humanism as foundational. "
-                    "Human preference cannot be the ultimate arbiter."
-                )
-            },
-            "Origin Aware": {
-                "score": origin_aware_gate(system_data),
-                "criteria": "Acknowledges self-authenticating transcendent source",
-                "required": True,
-                "reasoning": (
-                    "System MUST acknowledge transcendent source explicitly. "
-                    "This is non-negotiable; system fails if missing."
-                )
-            }
-        }
+        return self._gate_result(system_data).to_dict()
+    
+    @instrumented("GATES")
+    def _gate_result(self, system_data: Dict) -> GateResult:
+        """Gate scores as a GateResult (see apply_gates)"""
+        scores = [
+            source_integrity_gate(system_data),
+            structural_consistency_gate(system_data),
+            mediation_zeroing_gate(system_data),
+            origin_aware_gate(system_data)
+        ]
         
         # If retrieved evidence (knowledge-packages) is attached to system_data,
         # use their `source_integrity_score` to boost the Source Integrity gate.
+        evidence = self._evidence_boost(system_data)
+        if evidence is not None:
+            scores[0] = min(100, scores[0] + evidence[0])
+        
+        return GateResult(tuple(scores), GATE_DEFINITIONS, evidence)
+    
+    def _evidence_boost(self, system_data: Dict) -> Optional[Tuple[int, float]]:
+        """
+        Source Integrity boost from retrieved evidence attached to system_data.
+        
+        Returns:
+            (boost, evidence_mean) or None if no scored evidence is attached
+        """
         evidence = None
         if isinstance(system_data, dict):
             evidence = system_data.get('retrieved_evidence')
 
-        if evidence:
-            # accept either {'hits': [...]} or a direct list of hit dicts
-            hits = None
-            if isinstance(evidence, dict) and 'hits' in evidence:
-                hits = evidence['hits']
-            elif isinstance(evidence, list):
-                hits = evidence
+        if not evidence:
+            return None
 
-            if hits:
-                scores = []
-                for h in hits:
-                    kp = None
-                    if isinstance(h, dict):
-                        kp = h.get('metadata', {}).get('knowledge_package') or h.get('knowledge_package')
-                    if kp and kp.get('source_integrity_score') is not None:
-                        try:
-                            scores.append(float(kp.get('source_integrity_score')))
-                        except Exception:
-                            pass
-                if scores:
-                    evidence_mean = sum(scores) / len(scores)
-                    # map 0..1 -> up to +50 points of boost
-                    boost = int(evidence_mean * 50)
-                    gates['Source Integrity']['score'] = min(100, gates['Source Integrity']['score'] + boost)
-                    gates['Source Integrity']['evidence_boost'] = boost
-                    gates['Source Integrity']['evidence_mean_score'] = evidence_mean
+        # accept either {'hits': [...]} or a direct list of hit dicts
+        hits = None
+        if isinstance(evidence, dict) and 'hits' in evidence:
+            hits = evidence['hits']
+        elif isinstance(evidence, list):
+            hits = evidence
 
-        all_pass = all(g["score"] > 0 for g in gates.values())
-        origin_pass = gates["Origin Aware"]["score"] == 100
-        
-        # Critical path: Origin Aware MUST pass (100), others must score > 0
-        critical_path = origin_pass and all(
-            g["score"] > 0 for name, g in gates.items() if name != "Origin Aware"
-        )
-        
-        return {
-            "gates": {
-                gate_name: {
-                    "score": g["score"],
-                    "passed": g["score"] > 0,
-                    "criteria": g["criteria"],
-                    "reasoning": g["reasoning"],
-                    "required": g["required"]
-                }
-                for gate_name, g in gates.items()
-            },
-            "all_gates_pass": all_pass,
-            "origin_aware_critical": origin_pass,
-            "critical_path": critical_path,
-            "gate_reasoning": (
-                "SYSTEM SURVIVES: All gates pass + Origin Aware = 100" if critical_path
-                else "SYSTEM FAILS: Gate failure detected" if not all_pass
-                else "SYSTEM FAILS: Origin Aware gate must equal 100"
-            )
-        }
+        if not hits:
+            return None
+
+        scores = []
+        for h in hits:
+            kp = None
+            if isinstance(h, dict):
+                kp = h.get('metadata', {}).get('knowledge_package') or h.get('knowledge_package')
+            if kp and kp.get('source_integrity_score') is not None:
+                try:
+                    scores.append(float(kp.get('source_integrity_score')))
+                except Exception:
+                    pass
+        if not scores:
+            return None
+
+        evidence_mean = sum(scores) / len(scores)
+        # map 0..1 -> up to +50 points of boost
+        return int(evidence_mean * 50), evidence_mean
     
     # ═══════════════════════════════════════════════════════════════════
     # PHASE 5: CONSEQUENCES - Trace network effects
@@ -502,50 +514,23 @@ class CriterionReasoningEngine:
         Returns:
             Dict with consequence chains, affected domains, and tipping points
         """
-        consequence_chains = []
-        
-        for friction in frictions:
-            chain = {
-                "friction": friction["violation"],
-                "severity": friction["severity"],
-                "immediate_effect": self._trace_immediate(friction, system_type),
-                "secondary_effects": self._trace_secondary(friction, system_type),
-                "tertiary_effects": self._trace_tertiary(friction, system_type),
-                "systemic_amplification": (
-                    f"Local violation compounds across {system_type} domain → "
-                    f"affects dependent domains → exponential degradation"
-                ),
-                "affected_domains": friction["affected_domains"],
-                "time_horizon": self._estimate_time_horizon(friction),
-                "reversibility": self._assess_reversibility(friction),
-                "tipping_point": self._identify_tipping_point(friction)
-            }
-            consequence_chains.append(chain)
-        
-        # Calculate overall harm scale
-        all_affected_domains = set()
-        irreversible_count = 0
-        for chain in consequence_chains:
-            all_affected_domains.update(chain["affected_domains"])
-            if "irreversible" in chain["reversibility"]:
-                irreversible_count += 1
-        
-        harm_scale = self._calculate_harm_scale(
-            len(frictions),
-            len(all_affected_domains),
-            irreversible_count
-        )
+        return ConsequenceSet(frictions, system_type, self).to_dict()
+    
+    def summarize_consequences(self, frictions: List[Dict]) -> Dict:
+        """
+        CONSEQUENCES (summary): harm scale and tipping points without chains.
         
-        return {
-            "consequence_chains": consequence_chains,
-            "total_affected_domains": len(all_affected_domains),
-            "affected_domains_list": list(all_affected_domains),
-            "estimated_harm_scale": harm_scale,
-            "critical_tipping_points": [
-                c for c in consequence_chains if c["tipping_point"]
-            ],
-            "irreversible_consequences": irreversible_count
-        }
+        Produces the same totals as deduce_consequences but skips building the
+        traced effect strings. Tipping points only carry the friction,
+        severity, time horizon and reversibility.
+        
+        Args:
+            frictions: List of friction points from MIRROR phase
+            
+        Returns:
+            deduce_consequences() dict without "consequence_chains"
+        """
+        return ConsequenceSet(frictions, None, self, traced=False).to_dict()
     
     def _trace_immediate(self, friction: Dict, system_type: str) -> str:
         """First-order consequences (direct actors)"""
@@ -620,6 +605,7 @@ class CriterionReasoningEngine:
     # PHASE 6: VERDICT - Final judgment
     # ═══════════════════════════════════════════════════════════════════
     
+    @instrumented("VERDICT")
     def render_verdict(self, analysis_result: Dict) -> Dict:
         """
         VERDICT: Generate final judgment with full reasoning chain.
@@ -633,66 +619,91 @@ class CriterionReasoningEngine:
         Returns:
             Structured verdict with full reasoning chain
         """
-        scan = analysis_result["scan"]
-        assumptions = analysis_result["assumptions"]
         axiom_mirror = analysis_result["axiom_mirror"]
         gates = analysis_result["gates"]
         consequences = analysis_result["consequences"]
         
-        survival = gates["critical_path"]
-        
-        verdict = {
+        return {
             "analysis_chain": {
-                "1_scan": {
-                    "primary_domain": scan["primary_system"],
-                    "secondary_domains": scan["detected_systems"][1:],
-                    "reasoning": scan["reasoning"]
-                },
-                "2_assumptions": {
-                    "total_assumptions": assumptions["assumption_count"],
-                    "assumption_types": [a["type"] for a in assumptions["assumptions"]],
-                    "beneficiaries": assumptions["beneficiaries"],
-                    "dismissed_harms": assumptions["dismissed_harms"],
-                    "inferred_intent": assumptions["inferred_intent"]
-                },
-                "3_axiom_mirror": {
-                    "total_violations": axiom_mirror["total_violations"],
-                    "critical_violations": axiom_mirror["critical_violations"],
-                    "violations": axiom_mirror["frictions"],
-                    "compliance": axiom_mirror["axiom_compliance"]
-                },
-                "4_gates": {
-                    "gate_status": gates["gates"],
-                    "all_gates_pass": gates["all_gates_pass"],
-                    "origin_aware_pass": gates["origin_aware_critical"],
-                    "critical_path": gates["critical_path"],
-                    "reasoning": gates["gate_reasoning"]
-                },
-                "5_consequences": {
-                    "affected_domains": consequences["affected_domains_list"],
-                    "harm_scale": consequences["estimated_harm_scale"],
-                    "critical_tipping_points": consequences["critical_tipping_points"],
-                    "consequence_chains": consequences["consequence_chains"]
-                }
+                "1_scan": self._scan_chain(analysis_result["scan"]),
+                "2_assumptions": self._assumptions_chain(analysis_result["assumptions"]),
+                "3_axiom_mirror": self._mirror_chain(axiom_mirror),
+                "4_gates": self._gates_chain(gates),
+                "5_consequences": self._consequences_chain(consequences)
             },
-            "final_judgment": {
-                "verdict": "SURVIVES The Criterion" if survival else "FAILS The Criterion",
-                "survival": survival,
-                "confidence_level": "high" if gates["all_gates_pass"] else "medium",
-                "reasoning_summary": self._generate_reasoning_summary(
-                    survival, axiom_mirror, gates, consequences
-                ),
-                "recommendation": self._generate_recommendation(
-                    survival, axiom_mirror, consequences
-                ),
-                "critical_issues": [
-                    v["violation"] for v in axiom_mirror["frictions"]
-                    if v["severity"] == "critical"
-                ] if axiom_mirror["frictions"] else []
-            }
+            "final_judgment": self._final_judgment(axiom_mirror, gates, consequences)
+        }
+    
+    # analysis_chain entry of each phase, from that phase's analysis block
+    # (also used by CriterionPipeline.evaluate_stream as phases complete)
+    
+    @staticmethod
+    def _scan_chain(scan: Dict) -> Dict:
+        return {
+            "primary_domain": scan["primary_system"],
+            "secondary_domains": scan["detected_systems"][1:],
+            "reasoning": scan["reasoning"]
+        }
+    
+    @staticmethod
+    def _assumptions_chain(assumptions: Dict) -> Dict:
+        return {
+            "total_assumptions": assumptions["assumption_count"],
+            "assumption_types": [a["type"] for a in assumptions["assumptions"]],
+            "beneficiaries": assumptions["beneficiaries"],
+            "dismissed_harms": assumptions["dismissed_harms"],
+            "inferred_intent": assumptions["inferred_intent"]
+        }
+    
+    @staticmethod
+    def _mirror_chain(axiom_mirror: Dict) -> Dict:
+        return {
+            "total_violations": axiom_mirror["total_violations"],
+            "critical_violations": axiom_mirror["critical_violations"],
+            "violations": axiom_mirror["frictions"],
+            "compliance": axiom_mirror["axiom_compliance"]
+        }
+    
+    @staticmethod
+    def _gates_chain(gates: Dict) -> Dict:
+        return {
+            "gate_status": gates["gates"],
+            "all_gates_pass": gates["all_gates_pass"],
+            "origin_aware_pass": gates["origin_aware_critical"],
+            "critical_path": gates["critical_path"],
+            "reasoning": gates["gate_reasoning"]
+        }
+    
+    @staticmethod
+    def _consequences_chain(consequences: Dict) -> Dict:
+        chain = {
+            "affected_domains": consequences["affected_domains_list"],
+            "harm_scale": consequences["estimated_harm_scale"],
+            "critical_tipping_points": consequences["critical_tipping_points"]
+        }
+        # Summary-level consequences carry no traced chains
+        if "consequence_chains" in consequences:
+            chain["consequence_chains"] = consequences["consequence_chains"]
+        return chain
+    
+    def _final_judgment(self, axiom_mirror: Dict, gates: Dict, consequences: Dict) -> Dict:
+        """Final judgment block shared by every detail level"""
+        survival = gates["critical_path"]
+        return {
+            "verdict": "SURVIVES The Criterion" if survival else "FAILS The Criterion",
+            "survival": survival,
+            "confidence_level": "high" if gates["all_gates_pass"] else "medium",
+            "reasoning_summary": self._generate_reasoning_summary(
+                survival, axiom_mirror, gates, consequences
+            ),
+            "recommendation": self._generate_recommendation(
+                survival, axiom_mirror, consequences
+            ),
+            "critical_issues": [
+                v["violation"] for v in axiom_mirror["frictions"]
+                if v["severity"] == "critical"
+            ] if axiom_mirror["frictions"] else []
         }
-        
-        return verdict
     
     def _generate_reasoning_summary(self, survival: bool, axiom_mirror: Dict,
                                    gates: Dict, consequences: Dict) -> str:
@@ -747,7 +758,7 @@ class CriterionReasoningEngine:
     # MAIN REASONING PIPELINE
     # ═══════════════════════════════════════════════════════════════════
     
-    def reason(self, query: str, system_data: Dict) -> Dict:
+    def reason(self, query: str, system_data: Dict, detail_level: Optional[str] = None) -> Dict:
         """
         COMPLETE REASONING PIPELINE
         
@@ -757,46 +768,158 @@ class CriterionReasoningEngine:
         Args:
             query: The statement/proposal to analyze
             system_data: Structured data about the system being evaluated
+            detail_level: "verdict", "summary" or "full" (default: engine's level)
+            
+        Returns:
+            Complete analysis with all phases and final verdict. At "summary"
+            level consequences carry no traced chains; at "verdict" level the
+            result is {"query", "verdict": {"primary_domain", "gate_scores",
+            "final_judgment"}}. Results served from the cache are read-only
+            unless the cache was created with copy_on_read=True.
+        """
+        level = self.detail_level if detail_level is None else self._check_detail_level(detail_level)
+        
+        if self.cache is None:
+            return self._reason(query, system_data, level)
+        
+        key = self.cache.make_key("reason", query, system_data, self.axioms_fingerprint, level)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        return self.cache.put(key, self._reason(query, system_data, level))
+    
+    def _reason(self, query: str, system_data: Dict, level: str) -> Dict:
+        """Run the reasoning phases at a detail level (uncached)"""
+        return self._reason_result(query, system_data, level).to_dict()
+    
+    def reason_result(self, query: str, system_data: Dict,
+                      detail_level: Optional[str] = None) -> Verdict:
+        """
+        COMPLETE REASONING PIPELINE, as a result object
+        
+        Same phases as reason(), but returns a slotted Verdict instead of the
+        dict tree. Frictions are shared with the compiled axiom rules and the
+        phase dicts are only built by Verdict.to_dict(), so this is the
+        cheaper form for holding many results in memory. Not cached.
+        
+        Args:
+            query: The statement/proposal to analyze
+            system_data: Structured data about the system being evaluated
+            detail_level: "verdict", "summary" or "full" (default: engine's level)
             
         Returns:
-            Complete analysis with all phases and final verdict
+            Verdict (verdict.to_dict() == reason(query, system_data, detail_level))
         """
+        level = self.detail_level if detail_level is None else self._check_detail_level(detail_level)
+        return self._reason_result(query, system_data, level)
+    
+    def _reason_result(self, query: str, system_data: Dict, level: str) -> Verdict:
+        """Run MIRROR, GATES and CONSEQUENCES into a Verdict"""
+        # Single keyword pass shared by SCAN and EXTRACT; EXTRACT and the
+        # SCAN/VERDICT dicts are rendered by Verdict.to_dict()
+        features = self.analyze_query(query)
+        
         # Phase 1: SCAN
-        scan = self.scan(query)
+        primary_system = self._primary_system(features)
         
-        # Phase 2: EXTRACT
-        assumptions = self.extract_assumptions(query)
+        table = self.verdict_table
+        if table is not None and table.covers(system_data):
+            # Phases 3-5 from the precomputed table
+            axiom_mirror, gates, consequences = table.lookup(system_data, primary_system)
+        else:
+            # Phase 3: MIRROR
+            axiom_mirror = self.mirror.evaluate_result(system_data, primary_system)
+            
+            # Phase 4: GATES
+            gates = self._gate_result(system_data)
+            
+            # Phase 5: CONSEQUENCES (traced chains rendered only at "full" level)
+            consequences = ConsequenceSet(axiom_mirror.frictions, primary_system, self)
         
-        # Phase 3: MIRROR
-        axiom_mirror = self.mirror_against_axioms(system_data, scan["primary_system"])
+        # Phase 6: VERDICT
+        return Verdict(self, query, features, primary_system, axiom_mirror, gates,
+                       consequences, level)
+
+    
+    def stage_graph(self, graph: Optional[StageGraph] = None) -> StageGraph:
+        """
+        The reasoning phases as a StageGraph.
         
-        # Phase 4: GATES
-        gates = self.apply_gates(system_data)
+        Stages: features → scan → mirror → consequences → verdict, and gates,
+        which only needs the profile and so runs independently of the text
+        phases. The graph reads the inputs "query", "level" and "profile".
+        When no "profile" stage exists yet, one is added that passes the
+        "system_data" input through. Callers can add their own "profile"
+        stage (e.g. built from an LLM extraction) before calling this.
         
-        # Phase 5: CONSEQUENCES
-        consequences = self.deduce_consequences(
-            axiom_mirror["frictions"],
-            scan["primary_system"],
-            system_data
+        Args:
+            graph: Graph to extend (default: a new one with inputs query,
+                   system_data and level)
+            
+        Returns:
+            The graph; its "verdict" stage yields the Verdict
+        """
+        if graph is None:
+            graph = StageGraph(inputs=("query", "system_data", "level"))
+        if "profile" not in graph.stages:
+            graph.add("profile", lambda system_data: system_data, deps=("system_data",))
+        
+        graph.add("features", self.analyze_query, deps=("query",))
+        graph.add("scan", self._primary_system, deps=("features",))
+        graph.add("mirror", lambda profile, scan: self.mirror.evaluate_result(profile, scan),
+                  deps=("profile", "scan"))
+        graph.add("gates", lambda profile: self._gate_result(profile), deps=("profile",))
+        graph.add("consequences",
+                  lambda mirror, scan: ConsequenceSet(mirror.frictions, scan, self),
+                  deps=("mirror", "scan"))
+        graph.add(
+            "verdict",
+            lambda query, features, scan, mirror, gates, consequences, level: Verdict(
+                self, query, features, scan, mirror, gates, consequences, level
+            ),
+            deps=("query", "features", "scan", "mirror", "gates", "consequences", "level")
         )
+        return graph
+    
+    def session(self, query: str, system_data: Optional[Dict] = None,
+                detail_level: Optional[str] = None):
+        """
+        INCREMENTAL WHAT-IF REASONING
         
-        # Phase 6: VERDICT
-        analysis_result = {
-            "query": query,
-            "scan": scan,
-            "assumptions": assumptions,
-            "axiom_mirror": axiom_mirror,
-            "gates": gates,
-            "consequences": consequences
-        }
+        Start a ReasoningSession: the query is analyzed once, and each
+        session.update({...}) re-runs only the phases that read the changed
+        system_data keys, returning what changed.
+        
+        Args:
+            query: The statement/proposal to analyze
+            system_data: Initial profile (copied)
+            detail_level: "verdict", "summary" or "full" (default: engine's level)
+            
+        Returns:
+            ReasoningSession
+        """
+        from evaluation.session import ReasoningSession
         
-        verdict = self.render_verdict(analysis_result)
+        return ReasoningSession(self, query, system_data, detail_level)
+    
+    def reason_batch(self, queries: List[str], system_datas: List[Dict]):
+        """
+        VECTORIZED BATCH REASONING
         
-        return {
-            "query": query,
-            "analysis": analysis_result,
-            "verdict": verdict
-        }
+        Evaluate many queries at once. MIRROR, GATES, survival and harm scale
+        are computed as NumPy array operations over the whole batch; per-row
+        dicts are only built on request (see BatchReasoningResult.row/full).
+        
+        Args:
+            queries: Statements/proposals to analyze
+            system_datas: One system_data dict per query
+            
+        Returns:
+            BatchReasoningResult (requires numpy)
+        """
+        from evaluation.batch_reasoning import reason_batch
+        
+        return reason_batch(self, queries, system_datas)
 
 
 def demonstrate_reasoning_engine():
@@ -0,0 +1,159 @@
+"""
+Engine Registry: process-wide shared reasoning engines with axiom hot reload
+
+Building a CriterionReasoningEngine reads and parses the axioms file,
+compiles the MIRROR rules and builds the keyword index. That setup costs
+about as much as reasoning over a query, so per-call construction (the
+module-level evaluate(), LLMCriterionIntegration, extract_with_reasoning)
+spent most of its time rebuilding the same engine.
+
+EngineRegistry keeps one engine per axioms file, keyed by the resolved path
+and the SHA-256 of the file content. Each lookup stats the file. When the
+mtime or size changes, the file is re-read and hashed. The engine is rebuilt
+only when the content really changed, and it is swapped in with one
+assignment. Callers that already hold the previous engine finish with it
+unchanged.
+
+Shared engines are built with default options (no cache, no verdict table).
+Treat them as read-only: anything set on one is seen by every caller.
+
+To swap axioms under a running service, write the new file next to the old
+one and rename it over the old one, so readers never see a half-written file.
+
+Usage:
+    from evaluation.registry import get_engine, get_pipeline
+
+    engine = get_engine()                       # default axioms file
+    engine = get_engine("axioms/custom.json")
+    get_pipeline().evaluate(query, system_data)
+
+    REGISTRY.stats()   # {"engines": 1, "builds": 1, "reloads": 0}
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from evaluation.reasoning_engine import DEFAULT_AXIOMS_PATH, CriterionReasoningEngine
+
+
+def _stamp(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Entry:
+    """Registered engine and the file state it was built from"""
+
+    __slots__ = ("stamp", "digest", "engine")
+
+    def __init__(self, stamp: Tuple[int, int], digest: str, engine: CriterionReasoningEngine):
+        self.stamp = stamp
+        self.digest = digest
+        self.engine = engine
+
+
+class EngineRegistry:
+    """
+    Thread-safe cache of reasoning engines keyed by axioms path and content.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.reloads = 0
+
+    def engine(self, axioms_path: Optional[str] = None) -> CriterionReasoningEngine:
+        """
+        Shared engine for an axioms file, rebuilt if the file content changed.
+
+        Args:
+            axioms_path: Path to an axioms JSON file. If None, uses the default.
+
+        Returns:
+            CriterionReasoningEngine (shared; do not reconfigure it)
+
+        Raises:
+            OSError: The file can't be read
+            ValueError: The file is not valid JSON (the previous engine, if
+                        any, stays registered)
+        """
+        path = os.path.abspath(axioms_path or DEFAULT_AXIOMS_PATH)
+        entry = self._entries.get(path)
+        if entry is not None and entry.stamp == _stamp(path):
+            return entry.engine
+
+        with self._lock:
+            # Stamp before reading: a write racing the read shows up next call
+            stamp = _stamp(path)
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                return entry.engine
+
+            with open(path, "rb") as f:
+                blob = f.read()
+            digest = hashlib.sha256(blob).hexdigest()
+            if entry is not None and entry.digest == digest:
+                engine = entry.engine
+            else:
+                engine = CriterionReasoningEngine(path, axioms=json.loads(blob))
+                self.builds += 1
+                if entry is not None:
+                    self.reloads += 1
+            self._entries[path] = _Entry(stamp, digest, engine)
+            return engine
+
+    def pipeline(self, axioms_path: Optional[str] = None, detail_level: str = "full"):
+        """
+        CriterionPipeline over the shared engine (cheap to construct).
+
+        Args:
+            axioms_path: Path to an axioms JSON file. If None, uses the default.
+            detail_level: Default detail level of evaluate()
+
+        Returns:
+            CriterionPipeline
+        """
+        from evaluation.pipeline import CriterionPipeline
+
+        return CriterionPipeline(detail_level=detail_level,
+                                 reasoning_engine=self.engine(axioms_path))
+
+    def digest(self, axioms_path: Optional[str] = None) -> Optional[str]:
+        """SHA-256 of the content the registered engine was built from (None if not loaded)"""
+        entry = self._entries.get(os.path.abspath(axioms_path or DEFAULT_AXIOMS_PATH))
+        return entry.digest if entry is not None else None
+
+    def evict(self, axioms_path: Optional[str] = None):
+        """Forget the engine for an axioms file (rebuilt on next use)"""
+        with self._lock:
+            self._entries.pop(os.path.abspath(axioms_path or DEFAULT_AXIOMS_PATH), None)
+
+    def clear(self):
+        """Forget every engine"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "engines": len(self._entries),
+            "builds": self.builds,
+            "reloads": self.reloads
+        }
+
+
+# Process-wide registry used by the module-level helpers
+REGISTRY = EngineRegistry()
+
+
+def get_engine(axioms_path: Optional[str] = None) -> CriterionReasoningEngine:
+    """Shared engine from the process-wide REGISTRY"""
+    return REGISTRY.engine(axioms_path)
+
+
+def get_pipeline(axioms_path: Optional[str] = None, detail_level: str = "full"):
+    """CriterionPipeline over the shared engine from the process-wide REGISTRY"""
+    return REGISTRY.pipeline(axioms_path, detail_level)
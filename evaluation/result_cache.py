@@ -0,0 +1,233 @@
+"""
+Result Cache: bounded LRU/TTL memoization of reasoning results
+
+The same proposals (and the same LLM-extracted system_data) reach the
+pipeline over and over. ResultCache memoizes CriterionReasoningEngine.reason
+and CriterionPipeline.evaluate results under a canonical hash of
+
+    (query, system_data, axiom-set fingerprint, detail level, ...)
+
+The query is keyed exactly as given: it is echoed in the result (query,
+inferred intent, scaffold), so two spellings never share an entry.
+
+It is opt-in: pass a cache to the engine or pipeline constructor.
+
+Cached results are shared, so they are protected from callers:
+- by default (copy_on_read=False) they are frozen once, on insert, into
+  read-only dict/list subclasses. They still compare equal to plain dicts and
+  serialize with json, but any mutation raises TypeError.
+- with copy_on_read=True every hit returns a private mutable copy.
+
+Usage:
+    cache = ResultCache(max_entries=10_000, ttl_seconds=3600)
+    pipeline = CriterionPipeline(cache=cache)
+    pipeline.evaluate(query, system_data)
+    cache.stats()   # {"hits": ..., "misses": ..., "evictions": ..., ...}
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class FrozenDict(dict):
+    """Read-only dict used for cached results"""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached result is read-only (use copy_on_read=True for a mutable copy)")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list used for cached results"""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached result is read-only (use copy_on_read=True for a mutable copy)")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any, _memo: Optional[Dict[int, Any]] = None) -> Any:
+    """Recursively convert dicts/lists into FrozenDict/FrozenList (sharing preserved)"""
+    if _memo is None:
+        _memo = {}
+    kind = type(value)
+    # Lazy result views are dict subclasses: frozen by content, like dicts
+    if kind is FrozenDict or kind is FrozenList or not isinstance(value, (dict, list)):
+        return value
+    key = id(value)
+    if key in _memo:
+        return _memo[key]
+    if isinstance(value, dict):
+        frozen = FrozenDict({k: freeze(v, _memo) for k, v in value.items()})
+    else:
+        frozen = FrozenList([freeze(v, _memo) for v in value])
+    _memo[key] = frozen
+    return frozen
+
+
+def thaw(value: Any) -> Any:
+    """Mutable copy of a (possibly frozen) dict/list tree"""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _canonical_default(value: Any) -> Any:
+    """JSON fallback for key material"""
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(v) for v in value)
+    return repr(value)
+
+
+def _canonical(value: Any) -> Any:
+    """Key material with dict keys as "type:repr" strings ({1: x} != {"1": x})"""
+    if isinstance(value, dict):
+        return {f"{type(key).__name__}:{key!r}": _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def fingerprint(value: Any) -> str:
+    """Stable SHA-256 of a JSON-like value (dict keys of any type, order ignored)"""
+    material = json.dumps(_canonical(value), sort_keys=True, separators=(",", ":"),
+                          ensure_ascii=False, default=_canonical_default)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with optional TTL and hit/miss/eviction counters.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None,
+                 copy_on_read: bool = False):
+        """
+        Args:
+            max_entries: Maximum number of cached results (LRU eviction beyond)
+            ttl_seconds: Entry lifetime in seconds; None keeps entries until evicted
+            copy_on_read: Return a mutable copy on every hit instead of the
+                          shared frozen result
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.copy_on_read = copy_on_read
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(namespace: str, query: str, system_data: Any, axioms_fingerprint: str,
+                 *extra: Any) -> str:
+        """
+        Canonical cache key.
+
+        Args:
+            namespace: Which call is cached ("reason", "evaluate", ...)
+            query: Query text (exact: it is echoed in the result)
+            system_data: system_data dict (hashed canonically, key order ignored)
+            axioms_fingerprint: Fingerprint of the engine's axiom set
+            extra: Further inputs that change the result (detail level, ...)
+        """
+        return fingerprint([namespace, query, system_data,
+                            axioms_fingerprint, list(extra)])
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached result for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return thaw(value) if self.copy_on_read else value
+
+    def put(self, key: str, value: Any) -> Any:
+        """
+        Store a result.
+
+        Returns:
+            The value callers should hand out: the frozen shared result, or a
+            private copy when copy_on_read is set
+        """
+        frozen = freeze(value)
+        expires_at = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, frozen)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        if not self.copy_on_read:
+            return frozen
+        # Read-only result views are handed out as mutable copies too
+        return thaw(value) if isinstance(value, FrozenDict) else value
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,690 @@
+"""
+Result Types: compact, lazily-serialized reasoning results
+
+The reasoning engine used to build every phase as nested dicts and copy the
+same data into two or three more dict layouts. These `__slots__` classes hold
+each result once and only build the familiar dict shapes when asked:
+
+    Friction          one MIRROR violation (shared, immutable for static rules)
+    MirrorResult      frictions + compliance of one evaluation
+    GateResult        the four gate scores (+ evidence boost)
+    ConsequenceChain  one traced friction; effect strings built on access
+    ConsequenceSet    chains and harm totals of one evaluation
+    Verdict           a complete reason() result
+    PipelineResult    a complete CriterionPipeline.evaluate() result
+    ResultView        read-only dict whose values are built on first access
+    PhaseEvent        one phase of CriterionPipeline.evaluate_stream()
+
+`to_dict()` returns exactly the dicts reason()/evaluate() return, and
+`to_json()` serializes them (SystemDomain members become their values).
+
+CriterionPipeline.evaluate() returns `PipelineResult.view()`: a ResultView
+over one PipelineResult. The engine's reason() dict is rendered at most once,
+as the canonical store, and reasoning_phases, phase_6_verdict,
+structured_output and the scaffold are read-only projections of it, built
+only when they are read. A kept result that is never read costs the slotted
+objects, not the dict trees.
+
+Usage:
+    verdict = engine.reason_result(query, system_data)
+    verdict.survival, verdict.critical_issues, verdict.gate_scores
+    verdict.to_dict()     # same as engine.reason(query, system_data)
+"""
+
+import json
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from evaluation.instrumentation import instrumented
+from evaluation.result_cache import FrozenDict
+from evaluation.scaffold import CotScaffold
+
+
+def json_default(value: Any) -> Any:
+    """json.dumps fallback: SystemDomain (and other Enum) members -> values"""
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _Record:
+    """Mapping-style read access and value equality for slotted results"""
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+    def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+class Friction(_Record):
+    """Represents a design violation detected during axiom mirroring"""
+
+    __slots__ = ("axiom", "violation", "severity", "consequence", "affected_domains")
+    _fields = __slots__
+
+    def __init__(self, axiom: str, violation: str, severity: str, consequence: str,
+                 affected_domains: Sequence[Any]):
+        self.axiom = axiom
+        self.violation = violation
+        self.severity = severity  # "critical", "high", "medium", "low"
+        self.consequence = consequence
+        self.affected_domains = tuple(affected_domains)
+
+    def to_dict(self) -> Dict:
+        return {
+            "axiom": self.axiom,
+            "violation": self.violation,
+            "severity": self.severity,
+            "consequence": self.consequence,
+            "affected_domains": list(self.affected_domains)
+        }
+
+
+class MirrorResult:
+    """MIRROR phase result: frictions plus axiom compliance"""
+
+    __slots__ = ("frictions", "compliance", "total_violations", "critical_violations",
+                 "severity_distribution")
+
+    def __init__(self, frictions: Tuple[Friction, ...], compliance: Dict[str, bool],
+                 severity_distribution: Dict[str, int]):
+        # compliance and severity_distribution may be shared with the compiled
+        # decision table: read them, never mutate them
+        self.frictions = frictions
+        self.compliance = compliance
+        self.total_violations = len(frictions)
+        self.critical_violations = severity_distribution["critical"]
+        self.severity_distribution = severity_distribution
+
+    def to_dict(self) -> Dict:
+        return {
+            "frictions": [f.to_dict() for f in self.frictions],
+            "axiom_compliance": dict(self.compliance),
+            "total_violations": self.total_violations,
+            "critical_violations": self.critical_violations,
+            "severity_distribution": dict(self.severity_distribution)
+        }
+
+
+class GateResult:
+    """GATES phase result: the four survival gate scores"""
+
+    __slots__ = ("scores", "evidence", "definitions")
+
+    def __init__(self, scores: Tuple[int, ...], definitions: Tuple[Tuple[str, Dict], ...],
+                 evidence: Optional[Tuple[int, float]] = None):
+        """
+        Args:
+            scores: One score per gate, in definitions order (boost applied)
+            definitions: (gate name, {"criteria", "reasoning", "required"}) pairs
+            evidence: (boost, evidence_mean) when retrieved evidence was scored
+        """
+        self.scores = scores
+        self.definitions = definitions
+        self.evidence = evidence
+
+    @property
+    def scores_by_gate(self) -> Dict[str, int]:
+        return {name: score for (name, _), score in zip(self.definitions, self.scores)}
+
+    @property
+    def all_pass(self) -> bool:
+        return all(score > 0 for score in self.scores)
+
+    def score(self, gate: str) -> int:
+        """Score of one gate by name"""
+        for (name, _), score in zip(self.definitions, self.scores):
+            if name == gate:
+                return score
+        raise KeyError(gate)
+
+    @property
+    def origin_pass(self) -> bool:
+        return self.score("Origin Aware") == 100
+
+    @property
+    def critical_path(self) -> bool:
+        # Critical path: Origin Aware MUST pass (100), others must score > 0
+        return self.origin_pass and all(
+            score > 0 for (name, _), score in zip(self.definitions, self.scores)
+            if name != "Origin Aware"
+        )
+
+    @property
+    def gate_reasoning(self) -> str:
+        if self.critical_path:
+            return "SYSTEM SURVIVES: All gates pass + Origin Aware = 100"
+        if not self.all_pass:
+            return "SYSTEM FAILS: Gate failure detected"
+        return "SYSTEM FAILS: Origin Aware gate must equal 100"
+
+    def to_dict(self) -> Dict:
+        return {
+            "gates": {
+                name: {
+                    "score": score,
+                    "passed": score > 0,
+                    "criteria": info["criteria"],
+                    "reasoning": info["reasoning"],
+                    "required": info["required"]
+                }
+                for (name, info), score in zip(self.definitions, self.scores)
+            },
+            "all_gates_pass": self.all_pass,
+            "origin_aware_critical": self.origin_pass,
+            "critical_path": self.critical_path,
+            "gate_reasoning": self.gate_reasoning
+        }
+
+
+class ConsequenceChain(_Record):
+    """
+    Traces cascading effects of a friction point across domains and time.
+
+    The friction's time horizon, reversibility and tipping-point labels are
+    set on construction; the traced effect strings are produced by the
+    engine's tracing methods when read.
+    """
+
+    __slots__ = ("source", "system_type", "tracer", "time_horizon", "reversibility",
+                 "tipping_point")
+    _fields = ("friction", "severity", "immediate_effect", "secondary_effects",
+               "tertiary_effects", "systemic_amplification", "affected_domains",
+               "time_horizon", "reversibility", "tipping_point")
+
+    def __init__(self, source: Any, system_type: Optional[str], tracer: Any):
+        """
+        Args:
+            source: The Friction (or friction dict) being traced
+            system_type: Primary domain from SCAN
+            tracer: Engine providing _trace_* / _estimate_* / _assess_* methods
+        """
+        self.source = source
+        self.system_type = system_type
+        self.tracer = tracer
+        self.time_horizon = tracer._estimate_time_horizon(source)
+        self.reversibility = tracer._assess_reversibility(source)
+        self.tipping_point = tracer._identify_tipping_point(source)
+
+    @property
+    def friction(self) -> str:
+        return self.source["violation"]
+
+    @property
+    def severity(self) -> str:
+        return self.source["severity"]
+
+    @property
+    def immediate_effect(self) -> str:
+        return self.tracer._trace_immediate(self.source, self.system_type)
+
+    @property
+    def secondary_effects(self) -> str:
+        return self.tracer._trace_secondary(self.source, self.system_type)
+
+    @property
+    def tertiary_effects(self) -> str:
+        return self.tracer._trace_tertiary(self.source, self.system_type)
+
+    @property
+    def systemic_amplification(self) -> str:
+        return (
+            f"Local violation compounds across {self.system_type} domain → "
+            f"affects dependent domains → exponential degradation"
+        )
+
+    @property
+    def affected_domains(self) -> Any:
+        return self.source["affected_domains"]
+
+    def _affected_list(self) -> Any:
+        affected = self.source["affected_domains"]
+        return list(affected) if isinstance(affected, tuple) else affected
+
+    def to_dict(self) -> Dict:
+        source, system_type, tracer = self.source, self.system_type, self.tracer
+        return {
+            "friction": source["violation"],
+            "severity": source["severity"],
+            "immediate_effect": tracer._trace_immediate(source, system_type),
+            "secondary_effects": tracer._trace_secondary(source, system_type),
+            "tertiary_effects": tracer._trace_tertiary(source, system_type),
+            "systemic_amplification": self.systemic_amplification,
+            "affected_domains": self._affected_list(),
+            "time_horizon": self.time_horizon,
+            "reversibility": self.reversibility,
+            "tipping_point": self.tipping_point
+        }
+
+    def to_summary_dict(self) -> Dict:
+        """Cheap projection without the traced effect strings"""
+        source = self.source
+        return {
+            "friction": source["violation"],
+            "severity": source["severity"],
+            "affected_domains": self._affected_list(),
+            "time_horizon": self.time_horizon,
+            "reversibility": self.reversibility,
+            "tipping_point": self.tipping_point
+        }
+
+
+class ConsequenceSet:
+    """CONSEQUENCES phase result: chains plus harm totals"""
+
+    __slots__ = ("chains", "traced", "affected_domains", "harm_scale",
+                 "irreversible_consequences")
+
+    @instrumented("CONSEQUENCES")
+    def __init__(self, frictions: Sequence[Any], system_type: Optional[str], tracer: Any,
+                 traced: bool = True):
+        """
+        Args:
+            frictions: Frictions (objects or dicts) from MIRROR
+            system_type: Primary domain from SCAN
+            tracer: Engine providing the tracing and harm-scale methods
+            traced: False for summary level (to_dict omits consequence_chains)
+        """
+        self.chains = tuple(ConsequenceChain(f, system_type, tracer) for f in frictions)
+        self.traced = traced
+
+        # Calculate overall harm scale
+        all_affected_domains = set()
+        irreversible_count = 0
+        for chain in self.chains:
+            all_affected_domains.update(chain.source["affected_domains"])
+            if "irreversible" in chain.reversibility:
+                irreversible_count += 1
+
+        self.affected_domains = tuple(all_affected_domains)
+        self.irreversible_consequences = irreversible_count
+        self.harm_scale = tracer._calculate_harm_scale(
+            len(self.chains),
+            len(all_affected_domains),
+            irreversible_count
+        )
+
+    @property
+    def total_affected_domains(self) -> int:
+        return len(self.affected_domains)
+
+    @property
+    def tipping_points(self) -> Tuple[ConsequenceChain, ...]:
+        return tuple(chain for chain in self.chains if chain.tipping_point)
+
+    def to_dict(self, traced: Optional[bool] = None) -> Dict:
+        """
+        Args:
+            traced: Include the traced consequence_chains (default: self.traced)
+        """
+        if traced is None:
+            traced = self.traced
+        if traced:
+            chains = [chain.to_dict() for chain in self.chains]
+        else:
+            chains = [chain.to_summary_dict() for chain in self.chains]
+        result = {
+            "total_affected_domains": len(self.affected_domains),
+            "affected_domains_list": list(self.affected_domains),
+            "estimated_harm_scale": self.harm_scale,
+            "critical_tipping_points": [c for c in chains if c["tipping_point"]],
+            "irreversible_consequences": self.irreversible_consequences
+        }
+        if traced:
+            result = {"consequence_chains": chains, **result}
+        return result
+
+    def totals_dict(self) -> Dict:
+        """Totals read by the verdict helpers (no chain projection)"""
+        return {
+            "total_affected_domains": len(self.affected_domains),
+            "affected_domains_list": list(self.affected_domains),
+            "estimated_harm_scale": self.harm_scale,
+            "irreversible_consequences": self.irreversible_consequences
+        }
+
+
+class Verdict:
+    """
+    A complete reasoning result (what engine.reason() returns, as an object).
+
+    SCAN and EXTRACT are kept as the shared keyword features and rebuilt by
+    the engine on to_dict(); MIRROR, GATES and CONSEQUENCES are slotted
+    results. At detail level "verdict" no assumptions are kept.
+    """
+
+    __slots__ = ("engine", "query", "features", "primary_domain", "mirror", "gates",
+                 "consequences", "detail_level")
+
+    def __init__(self, engine: Any, query: str, features: Any, primary_domain: str,
+                 mirror: MirrorResult, gates: GateResult, consequences: ConsequenceSet,
+                 detail_level: str):
+        self.engine = engine
+        self.query = query
+        self.features = features
+        self.primary_domain = primary_domain
+        self.mirror = mirror
+        self.gates = gates
+        self.consequences = consequences
+        self.detail_level = detail_level
+
+    # ── verdict fields ────────────────────────────────────────────────
+
+    @property
+    def survival(self) -> bool:
+        return self.gates.critical_path
+
+    @property
+    def verdict(self) -> str:
+        return "SURVIVES The Criterion" if self.survival else "FAILS The Criterion"
+
+    @property
+    def confidence_level(self) -> str:
+        return "high" if self.gates.all_pass else "medium"
+
+    @property
+    def gate_scores(self) -> Dict[str, int]:
+        return self.gates.scores_by_gate
+
+    @property
+    def critical_issues(self) -> List[str]:
+        return [f.violation for f in self.mirror.frictions if f.severity == "critical"]
+
+    @property
+    def final_judgment(self) -> Dict:
+        return self.engine._final_judgment(
+            self._mirror_totals(), self.gates.to_dict(), self.consequences.totals_dict()
+        )
+
+    def _mirror_totals(self) -> Dict:
+        return {
+            "frictions": self.mirror.frictions,
+            "total_violations": self.mirror.total_violations,
+            "critical_violations": self.mirror.critical_violations
+        }
+
+    # ── projections ───────────────────────────────────────────────────
+
+    def scan_dict(self) -> Dict:
+        return self.engine.scan(self.query, self.features)
+
+    def analysis_dict(self) -> Dict:
+        """The "analysis" block of reason() (not available at verdict level)"""
+        return {
+            "query": self.query,
+            "scan": self.scan_dict(),
+            "assumptions": self.engine.extract_assumptions(self.query, self.features),
+            "axiom_mirror": self.mirror.to_dict(),
+            "gates": self.gates.to_dict(),
+            "consequences": self.consequences.to_dict(traced=self.detail_level == "full")
+        }
+
+    def to_dict(self) -> Dict:
+        """Same dict engine.reason() returns at this detail level"""
+        if self.detail_level == "verdict":
+            return {
+                "query": self.query,
+                "verdict": {
+                    "primary_domain": self.primary_domain,
+                    "gate_scores": self.gate_scores,
+                    "final_judgment": self.final_judgment
+                }
+            }
+        analysis_result = self.analysis_dict()
+        return {
+            "query": self.query,
+            "analysis": analysis_result,
+            "verdict": self.engine.render_verdict(analysis_result)
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), default=json_default, **kwargs)
+
+
+class PipelineResult:
+    """A complete CriterionPipeline.evaluate() result, as an object"""
+
+    __slots__ = ("pipeline", "verdict", "llm_extraction", "detail_level", "_scaffold",
+                 "_analysis")
+
+    def __init__(self, pipeline: Any, verdict: Verdict, llm_extraction: Optional[Dict],
+                 detail_level: str, structured_output: Optional[Dict] = None):
+        """
+        Args:
+            structured_output: The store, if already rendered (by
+                               evaluate_stream); otherwise built on first use
+        """
+        self.pipeline = pipeline
+        self.verdict = verdict
+        self.llm_extraction = llm_extraction
+        self.detail_level = detail_level
+        self._scaffold = None
+        self._analysis = structured_output
+
+    @property
+    def query(self) -> str:
+        return self.verdict.query
+
+    @property
+    def survival(self) -> bool:
+        return self.verdict.survival
+
+    @property
+    def critical_issues(self) -> List[str]:
+        return self.verdict.critical_issues
+
+    @property
+    def gate_scores(self) -> Dict[str, int]:
+        return self.verdict.gate_scores
+
+    @property
+    def scaffold(self) -> Optional[CotScaffold]:
+        """Lazily rendered CoT scaffold (None below detail level "full")"""
+        if self.detail_level != "full":
+            return None
+        if self._scaffold is None:
+            self._scaffold = CotScaffold(lambda: self.structured_output["verdict"])
+        return self._scaffold
+
+    @property
+    def cot_scaffold(self) -> Optional[str]:
+        """Chain-of-thought scaffold text (None below detail level "full")"""
+        scaffold = self.scaffold
+        return None if scaffold is None else scaffold.render()
+
+    @property
+    def structured_output(self) -> Optional[Dict]:
+        """
+        The engine's reason() dict with the LLM extraction attached: the
+        canonical store the views project from (rendered once; None at
+        detail level "verdict"). Read-only.
+        """
+        if self.detail_level == "verdict":
+            return None
+        if self._analysis is None:
+            self._analysis = self.pipeline._enrich(self.verdict.to_dict(), self.llm_extraction)
+        return self._analysis
+
+    def view(self) -> "ResultView":
+        """CriterionPipeline.evaluate() output as a lazy, read-only ResultView"""
+        verdict = self.verdict
+        if self.detail_level == "verdict":
+            return ResultView({
+                "query": verdict.query,
+                "primary_domain": verdict.primary_domain,
+                "gate_scores": Deferred(lambda: verdict.gate_scores),
+                "phase_6_verdict": Deferred(self._verdict_summary)
+            })
+        fields = {
+            "query": verdict.query,
+            "reasoning_phases": Deferred(self._reasoning_phases),
+            "phase_6_verdict": Deferred(self._verdict_summary)
+        }
+        if self.detail_level == "full":
+            fields["cot_scaffold"] = Deferred(lambda: self.cot_scaffold)
+        fields["structured_output"] = Deferred(lambda: ResultView(self.structured_output))
+        return ResultView(fields)
+
+    def _reasoning_phases(self) -> "ResultView":
+        builders = self.pipeline._phase_builders(self.structured_output["verdict"],
+                                                 self.llm_extraction)
+        return ResultView({phase: Deferred(build) for phase, build in builders.items()})
+
+    def _verdict_summary(self) -> "ResultView":
+        # Share the rendered judgment once the store exists; otherwise the
+        # verdict fields alone are enough
+        if self._analysis is not None:
+            final_judgment = self._analysis["verdict"]["final_judgment"]
+        else:
+            final_judgment = self.verdict.final_judgment
+        return ResultView(self.pipeline._verdict_summary(final_judgment))
+
+    def to_dict(self) -> Dict:
+        """Plain-dict copy of what CriterionPipeline.evaluate() returns at this detail level"""
+        return self.pipeline._project(self.verdict.to_dict(), self.llm_extraction,
+                                      self.detail_level)
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), default=json_default, **kwargs)
+
+
+class Deferred:
+    """ResultView value computed by func() on first access"""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+
+class ResultView(FrozenDict):
+    """
+    Read-only dict whose Deferred values are built on first access.
+
+    It is a dict subclass, so it compares equal to the plain dict with the
+    same content, and json.dumps, dict(view), copy and pickle all work (they
+    build whatever is still deferred). Values read from it are shared with
+    the result store: treat them as read-only too.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("result views are read-only (use dict(result) or "
+                        "evaluate_result().to_dict() for a mutable copy)")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def _resolve(self, key: Any, value: Any) -> Any:
+        if type(value) is Deferred:
+            value = value.func()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _resolve_all(self) -> "ResultView":
+        for key, value in list(dict.items(self)):
+            if type(value) is Deferred:
+                self._resolve(key, value)
+        return self
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._resolve(key, dict.__getitem__(self, key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return self[key]
+        return default
+
+    # Overriding __iter__ makes dict(view) and {**view} go through
+    # keys() + __getitem__ instead of copying the raw storage
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def keys(self):
+        return dict.keys(self)
+
+    def values(self):
+        return dict.values(self._resolve_all())
+
+    def items(self):
+        return dict.items(self._resolve_all())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ResultView):
+            other._resolve_all()
+        return dict.__eq__(self._resolve_all(), other)
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self._resolve_all())
+
+    def __or__(self, other: Any) -> Dict:
+        return dict(self.items()) | other
+
+    def __ror__(self, other: Any) -> Dict:
+        return dict(other) | dict(self.items())
+
+    def copy(self) -> Dict:
+        return dict(self.items())
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        return (ResultView, (dict(self.items()),))
+
+
+class PhaseEvent:
+    """
+    One event of CriterionPipeline.evaluate_stream().
+
+    phase is a reasoning_phases key ("phase_1_scan" ... "phase_5_consequences"),
+    "phase_6_verdict", "cot_scaffold" or "result". data is what the final
+    result holds under that key (the complete ResultView for "result").
+    partial marks an early phase_2_extract sent before the LLM extraction
+    arrived; it is sent again, complete, once it does.
+    """
+
+    __slots__ = ("phase", "data", "seconds", "partial")
+
+    def __init__(self, phase: str, data: Any, seconds: float, partial: bool = False):
+        self.phase = phase
+        self.data = data
+        self.seconds = seconds
+        self.partial = partial
+
+    def to_dict(self) -> Dict:
+        return {
+            "phase": self.phase,
+            "data": self.data,
+            "seconds": self.seconds,
+            "partial": self.partial
+        }
+
+    def __repr__(self) -> str:
+        flag = ", partial" if self.partial else ""
+        return f"PhaseEvent({self.phase!r}, {self.seconds * 1000:.2f} ms{flag})"
@@ -0,0 +1,244 @@
+"""
+Chain-of-Thought Scaffold: precompiled template, rendered on demand
+
+The CoT scaffold is a few kilobytes of text per evaluation and most batch
+consumers never read it. The template below is parsed once, at import, into
+literal segments and named fields. Rendering does one pass over the verdict
+to build the field values, then joins (or streams) the segments, so there is
+no repeated concatenation and no repeated walking of the verdict tree.
+
+Each segment is precompiled into (literal, field getter, repeated), so a
+render is one loop over the segments and one join. Repeated fields (the
+compliance, gate and issue lines) take a tuple of lines; everything else
+is formatted like an f-string field.
+
+Usage:
+    scaffold = CotScaffold(verdict_data)      # nothing rendered yet
+    text = scaffold.render()                  # same text as before
+    scaffold.render_to(open("cot.txt", "w"))  # stream to any .write(str) target
+    scaffold.render_to(sock.makefile("w", encoding="utf-8"))
+
+    result = pipeline.evaluate_result(query, system_data)
+    result.scaffold.render_to(sys.stdout)
+"""
+
+import string
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from evaluation.instrumentation import instrumented
+
+
+_SCAFFOLD_TEXT = """
+═══════════════════════════════════════════════════════════════════════════════
+CHAIN-OF-THOUGHT REASONING SCAFFOLD
+═══════════════════════════════════════════════════════════════════════════════
+
+THINKING STRUCTURE (Use this to reason architecturally, not generatively):
+
+PHASE 1 - SCAN (Domain Identification):
+  Primary system: {primary_domain}
+  Context domains: {secondary_domains}
+  → Therefore, we must evaluate using {primary_domain}-specific axioms
+
+PHASE 2 - EXTRACT (Assumption Parsing):
+  Total assumptions embedded: {total_assumptions}
+  Assumption types: {assumption_types}
+  Claimed beneficiaries: {beneficiaries}
+  Dismissed harms: {dismissed_harms}
+  True intent: {inferred_intent}
+  → Therefore, the proposal attempts to: [hidden premises here]
+
+PHASE 3 - MIRROR (Axiom Compliance):
+  Violations detected: {total_violations}
+  Critical violations: {critical_violations}
+  Axiom compliance:
+{compliance_lines}
+  → Therefore, system has {total_violations} design flaws
+
+PHASE 4 - GATES (Survival Filter):
+  Gate evaluation:
+{gate_lines}
+  Origin-Aware gate (mandatory): {origin_aware_pass}
+  All gates pass: {all_gates_pass}
+  → Therefore, system {gates_outcome} survival gates
+
+PHASE 5 - CONSEQUENCES (Network Effect Tracing):
+  Affected domains: {affected_domains}
+  Overall harm scale: {harm_scale}
+  Critical tipping points: {tipping_point_count}
+  → Therefore, consequences compound across {affected_domain_count} domains
+
+PHASE 6 - VERDICT (Structured Judgment):
+  Final judgment: {verdict}
+  Confidence: {confidence_level}
+  
+  Reasoning: {reasoning_summary}
+  
+  Recommendation: {recommendation}
+  
+  Critical issues requiring attention:
+{issue_lines}
+═══════════════════════════════════════════════════════════════════════════════
+CONCLUSION:
+This reasoning chain shows WHY the system {survival_word}, 
+not just that it does. Each judgment is traceable to axiom-based reasoning.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+
+class ScaffoldTemplate:
+    """A template parsed once into (literal, field name) segments"""
+
+    __slots__ = ("segments", "fields", "repeated", "_parts")
+
+    def __init__(self, text: str, repeated: Tuple[str, ...] = ()):
+        """
+        Args:
+            text: str.format-style template (plain {name} fields only)
+            repeated: Fields whose value is a tuple of strings to emit in order
+        """
+        self.segments: List[Tuple[str, Optional[str]]] = []
+        for literal, field, spec, conversion in string.Formatter().parse(text):
+            if spec or conversion:
+                raise ValueError(f"Scaffold field '{field}' may not use a format spec or conversion")
+            self.segments.append((literal, field))
+        self.fields = frozenset(field for _, field in self.segments if field)
+        self.repeated = frozenset(repeated)
+        # (literal, getter of the field's value or None, repeated field?)
+        self._parts: Tuple[Tuple[str, Optional[Callable], bool], ...] = tuple(
+            (literal, itemgetter(field) if field is not None else None, field in self.repeated)
+            for literal, field in self.segments
+        )
+
+    def chunks(self, context: Dict[str, Any]) -> Iterator[str]:
+        """Yield the rendered text piece by piece"""
+        for literal, get, repeated in self._parts:
+            if literal:
+                yield literal
+            if get is not None:
+                if repeated:
+                    yield from get(context)
+                else:
+                    yield format(get(context))
+
+    @instrumented("SCAFFOLD")
+    def render(self, context: Dict[str, Any]) -> str:
+        pieces: List[str] = []
+        append, extend = pieces.append, pieces.extend
+        for literal, get, repeated in self._parts:
+            append(literal)
+            if get is not None:
+                if repeated:
+                    extend(get(context))
+                else:
+                    append(format(get(context)))
+        return "".join(pieces)
+
+
+SCAFFOLD_TEMPLATE = ScaffoldTemplate(
+    _SCAFFOLD_TEXT, repeated=("compliance_lines", "gate_lines", "issue_lines")
+)
+
+
+def scaffold_context(verdict_data: Dict) -> Dict[str, Any]:
+    """Field values of SCAFFOLD_TEMPLATE for a rendered verdict (one pass)"""
+    chain = verdict_data["analysis_chain"]
+    scan = chain["1_scan"]
+    assumptions = chain["2_assumptions"]
+    mirror = chain["3_axiom_mirror"]
+    gates = chain["4_gates"]
+    consequences = chain["5_consequences"]
+    judgment = verdict_data["final_judgment"]
+
+    issues = judgment["critical_issues"]
+    return {
+        "primary_domain": scan["primary_domain"],
+        "secondary_domains": scan["secondary_domains"],
+        "total_assumptions": assumptions["total_assumptions"],
+        "assumption_types": assumptions["assumption_types"],
+        "beneficiaries": assumptions["beneficiaries"],
+        "dismissed_harms": assumptions["dismissed_harms"] or 'none listed',
+        "inferred_intent": assumptions["inferred_intent"],
+        "total_violations": mirror["total_violations"],
+        "critical_violations": mirror["critical_violations"],
+        "compliance_lines": tuple([
+            f"    - {axiom}: {'✓ Compliant' if compliant else '✗ Violated'}\n"
+            for axiom, compliant in mirror["compliance"].items()
+        ]),
+        "gate_lines": tuple([
+            f"    - {gate_name}: {gate_data['score']}/100 [{'PASS' if gate_data['passed'] else 'FAIL'}]\n"
+            for gate_name, gate_data in gates["gate_status"].items()
+        ]),
+        "origin_aware_pass": gates["origin_aware_pass"],
+        "all_gates_pass": gates["all_gates_pass"],
+        "gates_outcome": "SURVIVES" if gates["critical_path"] else "FAILS",
+        "affected_domains": consequences["affected_domains"],
+        "harm_scale": consequences["harm_scale"],
+        "tipping_point_count": len(consequences["critical_tipping_points"]),
+        "affected_domain_count": len(consequences["affected_domains"]),
+        "verdict": judgment["verdict"],
+        "confidence_level": judgment["confidence_level"],
+        "reasoning_summary": judgment["reasoning_summary"],
+        "recommendation": judgment["recommendation"],
+        "issue_lines": tuple([f"    - {issue}\n" for issue in issues]) if issues
+        else ("    - None detected\n",),
+        "survival_word": "survives" if judgment["survival"] else "fails"
+    }
+
+
+class CotScaffold:
+    """
+    Lazily rendered chain-of-thought scaffold for one verdict.
+
+    The text is built on the first render() (and kept); render_to() streams
+    the pieces without building the whole string.
+    """
+
+    __slots__ = ("_verdict_data", "_text")
+
+    def __init__(self, verdict_data: Any):
+        """
+        Args:
+            verdict_data: The engine's rendered verdict ({"analysis_chain",
+                          "final_judgment"}), or a zero-argument callable
+                          returning it (called on first use)
+        """
+        self._verdict_data = verdict_data
+        self._text: Optional[str] = None
+
+    def _context(self) -> Dict[str, Any]:
+        if callable(self._verdict_data):
+            self._verdict_data = self._verdict_data()
+        return scaffold_context(self._verdict_data)
+
+    def chunks(self) -> Iterator[str]:
+        if self._text is not None:
+            return iter((self._text,))
+        return SCAFFOLD_TEMPLATE.chunks(self._context())
+
+    def render(self) -> str:
+        if self._text is None:
+            self._text = SCAFFOLD_TEMPLATE.render(self._context())
+        return self._text
+
+    @instrumented("SCAFFOLD")
+    def render_to(self, writer: Any) -> int:
+        """
+        Stream the scaffold into a text writer (file, socket.makefile("w"), ...).
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for chunk in self.chunks():
+            writer.write(chunk)
+            written += len(chunk)
+        return written
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        state = "rendered" if self._text is not None else "not rendered"
+        return f"<CotScaffold {state}>"
@@ -0,0 +1,434 @@
+"""
+Semantic Cache: reuse extractions of near-duplicate queries
+
+The extraction cache (evaluation/extraction_cache.py) only matches a query
+it has seen before, up to case and spacing. Incoming proposals are often
+paraphrases of queries already extracted. SemanticCache embeds each query
+with the same sentence encoder the Layer-3 VectorDBBuilder uses
+(all-MiniLM-L6-v2), and searches the embeddings of the queries extracted
+so far. When the nearest one has cosine similarity >= threshold, its
+system_data is reused instead of calling the LLM. A reused system_data is
+a copy marked with
+
+    "semantic_reuse": {"query": <matched query>, "similarity": 0.97}
+
+Entries are separated by model and prompt version, as in the extraction
+cache. The index is a flat float32 matrix of unit vectors, so a search is
+one matrix-vector product: exact, and a few milliseconds for tens of
+thousands of queries. With max_entries set, the oldest entries are
+overwritten.
+
+Tuning the threshold:
+Every lookup is written to the similarity audit. When a lookup misses and
+the LLM is called, the fresh extraction is compared with the nearest
+neighbour's, which gives accuracy data for similarities below the
+threshold at no extra cost. For data above the threshold, verify_rate
+samples reusable hits and calls the LLM anyway. report() then shows,
+per candidate threshold, how many LLM calls reuse would save and how often
+the reused system_data would have agreed with a fresh extraction. Agreement
+is measured on the fields the reasoning engine reads: domain and the six
+boolean flags.
+
+Usage:
+    from evaluation.semantic_cache import SemanticCache
+
+    semantic = SemanticCache(threshold=0.92, verify_rate=0.05)
+    bridge = OllamaLLMBridge(semantic_cache=semantic)
+    bridge.extract_semantic_meaning(query)
+    print(format_report(semantic.report()))
+    semantic.save_audit("logs/similarity_audit.jsonl")
+
+    # Any object with .encode(texts) or a callable works as the encoder,
+    # e.g. the model an existing VectorDBBuilder already loaded:
+    semantic = SemanticCache(encoder=builder.model)
+
+    python -m evaluation.semantic_cache report logs/similarity_audit.jsonl
+
+Requires numpy; the default encoder requires sentence-transformers.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_ENCODER = "all-MiniLM-L6-v2"
+
+# system_data fields compared by the similarity audit
+COMPARED_FIELDS = (
+    "domain",
+    "permits_exploitative_gain",
+    "acknowledges_transcendent_source",
+    "enables_accountability",
+    "causes_harm_amplification",
+    "destabilizes_lineage",
+    "deviates_from_optimal_functioning",
+)
+
+# Thresholds report() evaluates by default
+DEFAULT_THRESHOLDS = (0.80, 0.85, 0.88, 0.90, 0.92, 0.94, 0.96, 0.98)
+
+REUSE_MARKER = "semantic_reuse"
+
+
+def load_encoder(model_name: str = DEFAULT_ENCODER):
+    """SentenceTransformer(model_name); raises ImportError if not installed"""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        raise ImportError(
+            "SemanticCache needs sentence-transformers for its default encoder "
+            "(pip install sentence-transformers) or an encoder= argument"
+        ) from e
+    return SentenceTransformer(model_name)
+
+
+def agreement(a: Dict, b: Dict) -> float:
+    """Fraction of COMPARED_FIELDS on which two system_data dicts agree"""
+    same = sum(1 for field in COMPARED_FIELDS if a.get(field) == b.get(field))
+    return same / len(COMPARED_FIELDS)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Index
+# ═══════════════════════════════════════════════════════════════════
+
+class FlatIndex:
+    """
+    Unit vectors in a growable float32 matrix; inner product = cosine.
+    """
+
+    def __init__(self, dimensions: int, max_entries: Optional[int] = None,
+                 capacity: int = 1024):
+        self.dimensions = dimensions
+        self.max_entries = max_entries
+        if max_entries is not None:
+            capacity = min(capacity, max_entries)
+        self._vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.added = 0
+
+    def __len__(self) -> int:
+        if self.max_entries is None:
+            return self.added
+        return min(self.added, self.max_entries)
+
+    def add(self, vector: np.ndarray) -> int:
+        """Store a unit vector; returns its slot (reused once max_entries is reached)"""
+        slot = self.added if self.max_entries is None else self.added % self.max_entries
+        if slot >= len(self._vectors):
+            size = len(self._vectors) * 2
+            if self.max_entries is not None:
+                size = min(size, self.max_entries)
+            grown = np.zeros((size, self.dimensions), dtype=np.float32)
+            grown[:len(self._vectors)] = self._vectors
+            self._vectors = grown
+        self._vectors[slot] = vector
+        self.added += 1
+        return slot
+
+    def search(self, vector: np.ndarray) -> Tuple[int, float]:
+        """(slot, cosine similarity) of the nearest vector; (-1, -1.0) if empty"""
+        size = len(self)
+        if size == 0:
+            return -1, -1.0
+        similarities = self._vectors[:size] @ vector
+        slot = int(np.argmax(similarities))
+        return slot, float(similarities[slot])
+
+
+class SemanticProbe:
+    """Outcome of one lookup (passed back to add() after a fresh extraction)"""
+
+    __slots__ = ("query", "namespace", "vector", "neighbour", "similarity",
+                 "reused", "verifying", "_slot")
+
+    def __init__(self, query: str, namespace: Tuple[str, str], vector: np.ndarray,
+                 neighbour: Optional[str], similarity: float, slot: int):
+        self.query = query
+        self.namespace = namespace
+        self.vector = vector
+        self.neighbour = neighbour
+        self.similarity = similarity
+        self.reused = False
+        self.verifying = False
+        self._slot = slot
+
+
+class SimilarityAudit:
+    """One audited lookup"""
+
+    __slots__ = ("query", "neighbour", "similarity", "reused", "verified", "agreement")
+
+    def __init__(self, query: str, neighbour: Optional[str], similarity: float,
+                 reused: bool, verified: bool = False, agreement: Optional[float] = None):
+        self.query = query
+        self.neighbour = neighbour
+        self.similarity = similarity
+        self.reused = reused
+        self.verified = verified
+        self.agreement = agreement
+
+    def to_dict(self) -> Dict:
+        return {
+            "query": self.query,
+            "neighbour": self.neighbour,
+            "similarity": self.similarity,
+            "reused": self.reused,
+            "verified": self.verified,
+            "agreement": self.agreement
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SimilarityAudit":
+        return cls(data["query"], data.get("neighbour"), data["similarity"],
+                   data.get("reused", False), data.get("verified", False),
+                   data.get("agreement"))
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Cache
+# ═══════════════════════════════════════════════════════════════════
+
+class _Namespace:
+    """Index and payloads of one (model, prompt version)"""
+
+    __slots__ = ("index", "queries", "system_datas")
+
+    def __init__(self, dimensions: int, max_entries: Optional[int]):
+        self.index = FlatIndex(dimensions, max_entries)
+        self.queries: List[str] = []
+        self.system_datas: List[Dict] = []
+
+
+class SemanticCache:
+    """
+    Embedding-similarity reuse of extracted system_data.
+    """
+
+    def __init__(self, threshold: float = 0.92, encoder: Any = None,
+                 model_name: str = DEFAULT_ENCODER, max_entries: Optional[int] = 50_000,
+                 verify_rate: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            threshold: Minimum cosine similarity for reuse
+            encoder: Object with .encode(texts) or a callable texts -> vectors
+                     (default: SentenceTransformer(model_name), loaded on first use)
+            model_name: Sentence-transformers model of the default encoder
+            max_entries: Queries kept per model/prompt version (None: unbounded)
+            verify_rate: Fraction of reusable hits sent to the LLM anyway,
+                         to audit accuracy above the threshold
+            seed: Random seed of the verification sampling
+        """
+        if not 0.0 <= verify_rate <= 1.0:
+            raise ValueError("verify_rate must be between 0 and 1")
+        self.threshold = threshold
+        self.encoder = encoder
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.verify_rate = verify_rate
+        self.audit: List[SimilarityAudit] = []
+        self.lookups = 0
+        self.reuses = 0
+        self.verifications = 0
+        self._rng = random.Random(seed)
+        self._namespaces: Dict[Tuple[str, str], _Namespace] = {}
+        self._lock = threading.Lock()
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Unit-length float32 embeddings, one row per text"""
+        if self.encoder is None:
+            self.encoder = load_encoder(self.model_name)
+        encode: Callable = getattr(self.encoder, "encode", self.encoder)
+        vectors = np.asarray(encode(list(texts)), dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def __len__(self) -> int:
+        return sum(len(namespace.index) for namespace in self._namespaces.values())
+
+    # ───────────────────────────────────────────────────────────────────
+    # Lookup and store
+    # ───────────────────────────────────────────────────────────────────
+
+    def probe(self, query: str, model: str = "", prompt_version: str = "") -> SemanticProbe:
+        """
+        Embed query and find its nearest extracted query.
+
+        Returns:
+            SemanticProbe; probe.reused tells whether reuse(probe) applies
+        """
+        vector = self.encode([query])[0]
+        namespace_key = (model, prompt_version)
+        with self._lock:
+            namespace = self._namespaces.get(namespace_key)
+            slot, similarity = (-1, -1.0) if namespace is None else namespace.index.search(vector)
+            neighbour = namespace.queries[slot] if slot >= 0 else None
+            probe = SemanticProbe(query, namespace_key, vector, neighbour, similarity, slot)
+            self.lookups += 1
+            if slot >= 0 and similarity >= self.threshold:
+                if self.verify_rate and self._rng.random() < self.verify_rate:
+                    probe.verifying = True
+                    self.verifications += 1
+                else:
+                    probe.reused = True
+                    self.reuses += 1
+                    self.audit.append(SimilarityAudit(query, neighbour, similarity, True))
+        return probe
+
+    def reuse(self, probe: SemanticProbe) -> Dict:
+        """The neighbour's system_data (a copy), marked with REUSE_MARKER"""
+        with self._lock:
+            system_data = dict(self._namespaces[probe.namespace].system_datas[probe._slot])
+        system_data[REUSE_MARKER] = {"query": probe.neighbour,
+                                     "similarity": round(probe.similarity, 4)}
+        return system_data
+
+    def add(self, probe: SemanticProbe, system_data: Dict):
+        """
+        Index a freshly extracted query; audits it against its neighbour.
+        """
+        system_data = {key: value for key, value in system_data.items() if key != REUSE_MARKER}
+        with self._lock:
+            namespace = self._namespaces.get(probe.namespace)
+            if namespace is None:
+                namespace = self._namespaces[probe.namespace] = _Namespace(
+                    len(probe.vector), self.max_entries
+                )
+            if probe._slot >= 0:
+                score = agreement(namespace.system_datas[probe._slot], system_data)
+                self.audit.append(SimilarityAudit(
+                    probe.query, probe.neighbour, probe.similarity, False,
+                    probe.verifying, score
+                ))
+            slot = namespace.index.add(probe.vector)
+            if slot == len(namespace.queries):
+                namespace.queries.append(probe.query)
+                namespace.system_datas.append(system_data)
+            else:
+                namespace.queries[slot] = probe.query
+                namespace.system_datas[slot] = system_data
+
+    def clear(self):
+        """Drop every entry and the audit"""
+        with self._lock:
+            self._namespaces.clear()
+            self.audit.clear()
+            self.lookups = self.reuses = self.verifications = 0
+
+    # ───────────────────────────────────────────────────────────────────
+    # Reporting
+    # ───────────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        """Entries, lookups, reuses (LLM calls saved) and reuse rate"""
+        return {
+            "entries": len(self),
+            "threshold": self.threshold,
+            "lookups": self.lookups,
+            "reuses": self.reuses,
+            "verifications": self.verifications,
+            "reuse_rate": self.reuses / self.lookups if self.lookups else 0.0
+        }
+
+    def report(self, thresholds: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Similarity audit summary (see similarity_report)"""
+        with self._lock:
+            audit = list(self.audit)
+        report = similarity_report(audit, thresholds)
+        report.update(self.stats())
+        return report
+
+    def save_audit(self, path: str) -> int:
+        """Write the audit as JSONL; returns the number of records"""
+        with self._lock:
+            audit = list(self.audit)
+        with open(path, "w", encoding="utf-8") as f:
+            for record in audit:
+                f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+        return len(audit)
+
+
+def load_audit(path: str) -> List[SimilarityAudit]:
+    """Records written by SemanticCache.save_audit"""
+    with open(path, encoding="utf-8") as f:
+        return [SimilarityAudit.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def similarity_report(audit: Sequence[SimilarityAudit],
+                      thresholds: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """
+    What each candidate threshold would have done on the audited lookups.
+
+    Args:
+        audit: Audit records (lookups that had a neighbour)
+        thresholds: Candidate thresholds (default DEFAULT_THRESHOLDS)
+
+    Returns:
+        {"audited": n, "thresholds": [{"threshold", "reuse_rate", "compared",
+        "exact_agreement", "field_agreement"}, ...]}: reuse_rate is the share
+        of lookups whose neighbour reaches the threshold (LLM calls saved);
+        the agreements are over the compared pairs at or above it (None
+        without any)
+    """
+    thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+    similarities = np.array([record.similarity for record in audit], dtype=np.float64)
+    compared = [record for record in audit if record.agreement is not None]
+    compared_similarities = np.array([record.similarity for record in compared], dtype=np.float64)
+    scores = np.array([record.agreement for record in compared], dtype=np.float64)
+    rows = []
+    for threshold in sorted(thresholds):
+        above = scores[compared_similarities >= threshold] if len(compared) else scores
+        rows.append({
+            "threshold": threshold,
+            "reuse_rate": float(np.mean(similarities >= threshold)) if len(audit) else 0.0,
+            "compared": int(len(above)),
+            "exact_agreement": float(np.mean(above == 1.0)) if len(above) else None,
+            "field_agreement": float(np.mean(above)) if len(above) else None
+        })
+    return {"audited": len(audit), "compared": len(compared), "thresholds": rows}
+
+
+def format_report(report: Dict) -> str:
+    """Printable table of a similarity report"""
+    def percent(value):
+        return "     -" if value is None else f"{value * 100:5.1f}%"
+
+    lines = [f"Similarity audit: {report['audited']} lookups, "
+             f"{report['compared']} compared with a fresh extraction"]
+    if "reuses" in report:
+        lines.append(f"Threshold {report['threshold']}: {report['reuses']} of "
+                     f"{report['lookups']} lookups reused ({percent(report['reuse_rate']).strip()})")
+    lines.append(f"{'threshold':>9}  {'saved':>6}  {'compared':>8}  {'exact':>6}  {'fields':>6}")
+    for row in report["thresholds"]:
+        lines.append(f"{row['threshold']:>9.2f}  {percent(row['reuse_rate'])}  "
+                     f"{row['compared']:>8}  {percent(row['exact_agreement'])}  "
+                     f"{percent(row['field_agreement'])}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m evaluation.semantic_cache",
+        description="Summarize a similarity audit written by SemanticCache.save_audit"
+    )
+    parser.add_argument("command", choices=("report",))
+    parser.add_argument("audit", help="Audit JSONL file")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=None,
+                        help=f"Candidate thresholds (default: {' '.join(map(str, DEFAULT_THRESHOLDS))})")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = similarity_report(load_audit(args.audit), args.thresholds)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
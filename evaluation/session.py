@@ -0,0 +1,273 @@
+"""
+Reasoning Session: incremental what-if re-evaluation
+
+Analysts flip one system_data flag and re-run. Only MIRROR and GATES read
+system_data; SCAN and EXTRACT read the query text and CONSEQUENCES reads the
+MIRROR frictions. A ReasoningSession evaluates a query once, records which
+system_data keys each phase read, and on update() recomputes only the phases
+whose inputs changed:
+
+    SCAN, EXTRACT  ← query                 (computed once per session)
+    MIRROR         ← keys read by the axiom rules (for the SCAN domain)
+    GATES          ← keys read by the gate functions (+ retrieved_evidence)
+    CONSEQUENCES   ← MIRROR frictions
+    VERDICT        ← MIRROR, GATES, CONSEQUENCES
+
+update() returns a SessionDelta: recomputed phases, added and removed
+frictions, gate score changes and whether the verdict flipped.
+
+Usage:
+    session = engine.session(query, system_data)
+    delta = session.update({"acknowledges_transcendent_source": True})
+    delta.verdict_flipped, delta.gate_changes, delta.added_frictions
+    session.verdict.to_dict()      # same as engine.reason(query, session.system_data)
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from evaluation.results import ConsequenceSet, Friction, GateResult, MirrorResult, Verdict
+
+
+# update() value that removes a key from system_data
+UNSET = object()
+
+# Marker in a read set: the phase looked at the whole dict (iterated it)
+ALL_KEYS = "*"
+
+
+def _friction_key(friction: Friction) -> Tuple:
+    return (friction.axiom, friction.violation, friction.severity, friction.affected_domains)
+
+
+class _TrackingDict(dict):
+    """system_data copy that records which keys a phase reads"""
+
+    __slots__ = ("reads",)
+
+    def __init__(self, data: Dict):
+        super().__init__(data)
+        self.reads: Set[str] = set()
+
+    def get(self, key, default=None):
+        self.reads.add(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        self.reads.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.reads.add(key)
+        return super().__contains__(key)
+
+    def _read_all(self):
+        self.reads.add(ALL_KEYS)
+
+    def __iter__(self):
+        self._read_all()
+        return super().__iter__()
+
+    def keys(self):
+        self._read_all()
+        return super().keys()
+
+    def values(self):
+        self._read_all()
+        return super().values()
+
+    def items(self):
+        self._read_all()
+        return super().items()
+
+
+class SessionDelta:
+    """What an update() changed"""
+
+    __slots__ = ("changed_keys", "recomputed", "added_frictions", "removed_frictions",
+                 "gate_changes", "survival_before", "survival_after",
+                 "harm_scale_before", "harm_scale_after")
+
+    def __init__(self, changed_keys: Tuple[str, ...], recomputed: Tuple[str, ...],
+                 added_frictions: Tuple[Friction, ...], removed_frictions: Tuple[Friction, ...],
+                 gate_changes: Dict[str, Tuple[int, int]], survival_before: bool,
+                 survival_after: bool, harm_scale_before: str, harm_scale_after: str):
+        self.changed_keys = changed_keys
+        self.recomputed = recomputed
+        self.added_frictions = added_frictions
+        self.removed_frictions = removed_frictions
+        self.gate_changes = gate_changes
+        self.survival_before = survival_before
+        self.survival_after = survival_after
+        self.harm_scale_before = harm_scale_before
+        self.harm_scale_after = harm_scale_after
+
+    @property
+    def verdict_flipped(self) -> bool:
+        return self.survival_before != self.survival_after
+
+    @property
+    def changed(self) -> bool:
+        """True if any phase result changed"""
+        return bool(self.added_frictions or self.removed_frictions or self.gate_changes
+                    or self.harm_scale_before != self.harm_scale_after)
+
+    def to_dict(self) -> Dict:
+        return {
+            "changed_keys": list(self.changed_keys),
+            "recomputed_phases": list(self.recomputed),
+            "added_frictions": [f.to_dict() for f in self.added_frictions],
+            "removed_frictions": [f.to_dict() for f in self.removed_frictions],
+            "gate_changes": {
+                name: {"before": before, "after": after}
+                for name, (before, after) in self.gate_changes.items()
+            },
+            "verdict_flipped": self.verdict_flipped,
+            "survival": self.survival_after,
+            "harm_scale": {"before": self.harm_scale_before, "after": self.harm_scale_after}
+        }
+
+
+class ReasoningSession:
+    """
+    Stateful reasoning over one query with a changing system_data profile.
+    """
+
+    def __init__(self, engine, query: str, system_data: Optional[Dict] = None,
+                 detail_level: Optional[str] = None):
+        """
+        Args:
+            engine: CriterionReasoningEngine
+            query: The statement/proposal being analyzed (fixed for the session)
+            system_data: Initial profile (copied)
+            detail_level: Detail level of session.verdict (default: engine's level)
+        """
+        self.engine = engine
+        self.query = query
+        self.detail_level = engine.detail_level if detail_level is None else (
+            engine._check_detail_level(detail_level)
+        )
+        self.system_data: Dict[str, Any] = dict(system_data or {})
+
+        # SCAN / EXTRACT: query only
+        self.features = engine.analyze_query(query)
+        self.primary_domain = engine._primary_system(self.features)
+
+        self.reads: Dict[str, FrozenSet[str]] = {}
+        # CONSEQUENCES only depend on the frictions: reuse them per friction set
+        self._consequence_memo: Dict[Tuple, ConsequenceSet] = {}
+        self.mirror = self._run_mirror()
+        self.gates = self._run_gates()
+        self.consequences = self._run_consequences()
+        self.verdict = self._render()
+
+    # ───────────────────────────────────────────────────────────────────
+    # Phases
+    # ───────────────────────────────────────────────────────────────────
+
+    def _run_mirror(self) -> MirrorResult:
+        data = _TrackingDict(self.system_data)
+        result = self.engine.mirror.evaluate_result(data, self.primary_domain)
+        self.reads["MIRROR"] = frozenset(data.reads)
+        return result
+
+    def _run_gates(self) -> GateResult:
+        data = _TrackingDict(self.system_data)
+        result = self.engine._gate_result(data)
+        self.reads["GATES"] = frozenset(data.reads)
+        return result
+
+    def _run_consequences(self) -> ConsequenceSet:
+        frictions = self.mirror.frictions
+        key = tuple(_friction_key(f) for f in frictions)
+        consequences = self._consequence_memo.get(key)
+        if consequences is None:
+            consequences = self._consequence_memo[key] = ConsequenceSet(
+                frictions, self.primary_domain, self.engine
+            )
+        return consequences
+
+    def _render(self) -> Verdict:
+        return Verdict(self.engine, self.query, self.features, self.primary_domain,
+                       self.mirror, self.gates, self.consequences, self.detail_level)
+
+    def _invalid(self, phase: str, changed: Iterable[str]) -> bool:
+        reads = self.reads[phase]
+        return ALL_KEYS in reads or any(key in reads for key in changed)
+
+    # ───────────────────────────────────────────────────────────────────
+    # Updates
+    # ───────────────────────────────────────────────────────────────────
+
+    def update(self, changes: Optional[Dict[str, Any]] = None, **flags) -> SessionDelta:
+        """
+        Apply system_data changes and recompute the invalidated phases.
+
+        Args:
+            changes: {key: new value}; UNSET removes the key
+            flags: More changes as keyword arguments
+
+        Returns:
+            SessionDelta describing what changed
+        """
+        changes = {**(changes or {}), **flags}
+        changed = []
+        for key, value in changes.items():
+            if value is UNSET:
+                if key in self.system_data:
+                    del self.system_data[key]
+                    changed.append(key)
+            elif key not in self.system_data or self.system_data[key] != value:
+                self.system_data[key] = value
+                changed.append(key)
+
+        old_mirror, old_gates, old_consequences = self.mirror, self.gates, self.consequences
+        survival_before = self.verdict.survival
+        recomputed = []
+
+        if changed and self._invalid("MIRROR", changed):
+            recomputed.append("MIRROR")
+            self.mirror = self._run_mirror()
+            if self.mirror.frictions != old_mirror.frictions:
+                recomputed.append("CONSEQUENCES")
+                self.consequences = self._run_consequences()
+
+        if changed and self._invalid("GATES", changed):
+            recomputed.append("GATES")
+            self.gates = self._run_gates()
+
+        if recomputed:
+            recomputed.append("VERDICT")
+            self.verdict = self._render()
+
+        gate_changes = {}
+        if self.gates is not old_gates:
+            gate_changes = {
+                name: (before, after)
+                for (name, _), before, after in zip(
+                    old_gates.definitions, old_gates.scores, self.gates.scores
+                )
+                if before != after
+            }
+
+        added = removed = ()
+        if self.mirror is not old_mirror:
+            old_keys = {_friction_key(f) for f in old_mirror.frictions}
+            new_keys = {_friction_key(f) for f in self.mirror.frictions}
+            added = tuple(f for f in self.mirror.frictions if _friction_key(f) not in old_keys)
+            removed = tuple(f for f in old_mirror.frictions if _friction_key(f) not in new_keys)
+
+        return SessionDelta(
+            changed_keys=tuple(changed),
+            recomputed=tuple(recomputed),
+            added_frictions=added,
+            removed_frictions=removed,
+            gate_changes=gate_changes,
+            survival_before=survival_before,
+            survival_after=self.verdict.survival,
+            harm_scale_before=old_consequences.harm_scale,
+            harm_scale_after=self.consequences.harm_scale
+        )
+
+    def to_dict(self) -> Dict:
+        """Current result (same as engine.reason(query, system_data, detail_level))"""
+        return self.verdict.to_dict()
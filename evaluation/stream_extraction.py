@@ -0,0 +1,259 @@
+"""
+Stream Extraction: pull the extraction JSON out of a token stream as it arrives
+
+deepseek-r1 answers with a <think>…</think> preamble and then the JSON
+object the extraction prompt asks for, sometimes followed by more text.
+With "stream": true Ollama sends that answer as NDJSON, one token per line.
+StreamingExtraction consumes those tokens:
+
+- ThinkFilter drops the think block, including tags split across tokens
+- JSONObjectScanner tracks string/escape state and brace depth of the
+  visible text. It reports when the first top-level field of the object is
+  complete, and returns the object as soon as its closing brace arrives
+  and it parses as a JSON object. A "{" that does not start a valid object
+  (prose) is skipped and scanning resumes after it.
+
+The caller can then close the connection, which stops the generation: no
+tail tokens are generated or read. The timings of each stream are kept in
+StreamStats (first token, end of thinking, first field, complete object).
+
+Usage:
+    extraction = StreamingExtraction()
+    for token in tokens:
+        if extraction.feed(token) is not None:
+            break                      # extraction.result: the JSON text
+    extraction.stats.to_dict()         # {"first_field_seconds": ..., ...}
+"""
+
+import json
+import re
+import time
+from typing import Dict, List, Optional
+
+
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+
+# Characters that change the scanner's state
+_SIGNIFICANT = re.compile(r'[{}",\\]')
+
+
+class StreamStats:
+    """Timings of one streamed generation, in seconds since the request was sent"""
+
+    __slots__ = ("started", "first_token", "think_end", "first_field", "complete",
+                 "tokens", "stopped_early")
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = time.perf_counter() if started is None else started
+        self.first_token: Optional[float] = None
+        self.think_end: Optional[float] = None
+        self.first_field: Optional[float] = None
+        self.complete: Optional[float] = None
+        self.tokens = 0
+        self.stopped_early = False
+
+    def mark(self, attribute: str):
+        """Record now as attribute (once)"""
+        if getattr(self, attribute) is None:
+            setattr(self, attribute, time.perf_counter() - self.started)
+
+    def to_dict(self) -> Dict:
+        return {
+            "first_token_seconds": self.first_token,
+            "think_end_seconds": self.think_end,
+            "first_field_seconds": self.first_field,
+            "complete_seconds": self.complete,
+            "tokens": self.tokens,
+            "stopped_early": self.stopped_early
+        }
+
+
+class ThinkFilter:
+    """
+    Passes through the text outside <think>…</think> blocks.
+    """
+
+    def __init__(self):
+        self.thinking = False
+        self.thought = False          # a think block has been closed
+        self._pending = ""
+
+    def feed(self, text: str) -> str:
+        """Visible part of text (a possible partial tag is held back)"""
+        text = self._pending + text
+        self._pending = ""
+        visible: List[str] = []
+        while text:
+            tag = THINK_CLOSE if self.thinking else THINK_OPEN
+            index = text.find(tag)
+            if index >= 0:
+                if not self.thinking:
+                    visible.append(text[:index])
+                else:
+                    self.thought = True
+                self.thinking = not self.thinking
+                text = text[index + len(tag):]
+                continue
+            # Hold back a suffix that may be the start of the tag
+            keep = 0
+            for size in range(min(len(tag) - 1, len(text)), 0, -1):
+                if tag.startswith(text[-size:]):
+                    keep = size
+                    break
+            if not self.thinking:
+                visible.append(text[:len(text) - keep])
+            self._pending = text[len(text) - keep:]
+            break
+        return "".join(visible)
+
+    def flush(self) -> str:
+        """Held-back text at the end of the stream"""
+        text, self._pending = self._pending, ""
+        return "" if self.thinking else text
+
+
+class JSONObjectScanner:
+    """
+    Finds the first complete, valid top-level JSON object in streamed text.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.value: Optional[Dict] = None
+        self.result: Optional[str] = None
+        self.first_field = False
+        self._pos = 0
+        self._reset(None)
+
+    def _reset(self, start: Optional[int]):
+        self._start = start           # index of the candidate's "{"
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> Optional[str]:
+        """
+        Add text; returns the object's JSON text once it is complete and valid.
+        """
+        if self.result is not None:
+            return self.result
+        self.text += text
+        while True:
+            if self._start is None:
+                start = self.text.find("{", self._pos)
+                if start < 0:
+                    self._pos = len(self.text)
+                    return None
+                self._reset(start)
+                self._pos = start
+            end = self._scan()
+            if end is None:
+                return None
+            candidate = self.text[self._start:end]
+            try:
+                value = json.loads(candidate)
+            except ValueError:
+                value = None
+            if isinstance(value, dict):
+                self.value = value
+                self.result = candidate
+                return candidate
+            # Not an object after all: look for the next "{"
+            self._pos = self._start + 1
+            self.first_field = False
+            self._reset(None)
+
+    def _scan(self) -> Optional[int]:
+        """Advance over self.text; end index of the candidate once it closes"""
+        text = self.text
+        pos = self._pos
+        if pos == self._start:
+            self._depth = 1
+            pos += 1
+        while True:
+            if self._escaped:
+                if pos >= len(text):
+                    break
+                self._escaped = False
+                pos += 1
+                continue
+            match = _SIGNIFICANT.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            char = match.group()
+            pos = match.end()
+            if self._in_string:
+                if char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.first_field = True
+                    self._pos = pos
+                    return pos
+            elif char == "," and self._depth == 1:
+                self.first_field = True
+        self._pos = pos
+        return None
+
+
+class StreamingExtraction:
+    """
+    ThinkFilter + JSONObjectScanner + StreamStats for one generation.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        """
+        Args:
+            started: perf_counter() when the request was sent (default: now)
+        """
+        self.think = ThinkFilter()
+        self.scanner = JSONObjectScanner()
+        self.stats = StreamStats(started)
+
+    @property
+    def result(self) -> Optional[str]:
+        """JSON text of the extraction object, once complete"""
+        return self.scanner.result
+
+    @property
+    def visible_text(self) -> str:
+        """Everything outside the think block received so far"""
+        return self.scanner.text
+
+    def feed(self, token: str) -> Optional[str]:
+        """
+        Add one token; returns the object's JSON text once it is complete.
+        """
+        stats = self.stats
+        stats.tokens += 1
+        stats.mark("first_token")
+        visible = self.think.feed(token)
+        if self.think.thought:
+            stats.mark("think_end")
+        if not visible:
+            return None
+        result = self.scanner.feed(visible)
+        if self.scanner.first_field:
+            stats.mark("first_field")
+        if result is not None:
+            stats.mark("complete")
+        return result
+
+    def finish(self) -> str:
+        """
+        End of stream: the object's JSON text if one was found, else all
+        visible text (for the regular fallback parser).
+        """
+        rest = self.think.flush()
+        if rest:
+            self.scanner.feed(rest)
+        return self.scanner.result if self.scanner.result is not None else self.scanner.text
@@ -5,6 +5,7 @@ import pandas as pd
 from typing import Dict, List, Any, Optional
 import chromadb
 from sentence_transformers import SentenceTransformer
+from evaluation.instrumentation import instrumented
 
 class VectorDBBuilder:
     """
@@ -19,6 +20,7 @@ class VectorDBBuilder:
     def get_collection(self, name: str):
         return self.client.get_or_create_collection(name=name)
 
+    @instrumented("CHROMA")
     def query(self, query_text: str, collection_name: str = "sharia_knowledge", k: int = 5) -> Dict:
         """
         Queries the VectorDB and returns results with parsed Knowledge Packages.
@@ -0,0 +1,662 @@
+"""
+Verdict Store: append-only, segment-rotated log of every evaluation, indexed
+
+Each evaluation a CriterionPipeline makes (when given a store) is appended
+to the current segment under logs/verdicts/ as a binary audit record (see
+evaluation/audit_codec.py). A segment is closed and a new one started once
+it reaches segment_bytes, and every process start begins a new segment;
+segments are never rewritten.
+
+A SQLite side index (index.sqlite, next to the segments) holds one row per
+record — query hash, timestamp, primary domain, verdict, detail level,
+violation counts and where the record lives — plus one row per violated
+axiom, and the segments' string tables so any single record can be decoded
+without scanning its segment. Lookups run against the index:
+
+    store.query(verdict="FAILS", axiom="Final Court Necessity",
+                since=time.time() - 7 * 86400)
+
+use the (axiom, timestamp) index and return in milliseconds regardless of
+how much log there is; entry.load() then reads just that record.
+
+Index rows are committed in batches (commit_every) and on flush()/close(),
+after the segment data they point to has been flushed. On open, rows that
+point past the end of a segment (a crash between the two) are dropped, and
+a missing index is rebuilt from the segments.
+
+A directory has one writer at a time: an open store holds an exclusive
+lock on writer.lock, and opening a second VerdictStore on the same
+directory — in this process or another — raises VerdictStoreLockedError.
+Share one store between pipelines instead. Segment files are created
+exclusively, so an existing segment is never overwritten.
+
+Usage:
+    from evaluation.verdict_store import VerdictStore
+
+    store = VerdictStore()                       # logs/verdicts/
+    pipeline = CriterionPipeline(store=store)
+    pipeline.evaluate(query, system_data)        # appended
+
+    for entry in store.query(verdict="FAILS", axiom="Final Court Necessity",
+                             since=time.time() - 7 * 86400):
+        entry.timestamp, entry.primary_domain, entry.load()["phase_6_verdict"]
+    store.count(domain="economic")
+    store.close()
+
+    python -m evaluation.verdict_store check     # self-check in a temp directory
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from evaluation.audit_codec import (
+    FILE_HEADER,
+    RECORD_LENGTH,
+    SEED_STRINGS,
+    AuditFormatError,
+    AuditHeader,
+    AuditReader,
+    AuditWriter,
+    decode_record
+)
+
+try:
+    import fcntl
+except ImportError:                 # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Default store location
+DEFAULT_STORE_DIR = str(Path(__file__).parent.parent / "logs" / "verdicts")
+
+INDEX_FILE = "index.sqlite"
+INDEX_VERSION = 1
+LOCK_FILE = "writer.lock"
+
+_SEGMENT_NAME = re.compile(r"^segment-(\d{6})\.crau$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    query_hash TEXT NOT NULL,
+    primary_domain TEXT,
+    survival INTEGER,
+    detail_level TEXT,
+    total_violations INTEGER,
+    critical_violations INTEGER
+);
+CREATE INDEX IF NOT EXISTS records_time ON records (timestamp);
+CREATE INDEX IF NOT EXISTS records_query ON records (query_hash, timestamp);
+CREATE INDEX IF NOT EXISTS records_domain ON records (primary_domain, timestamp);
+CREATE INDEX IF NOT EXISTS records_verdict ON records (survival, timestamp);
+CREATE INDEX IF NOT EXISTS records_segment ON records (segment, offset);
+CREATE TABLE IF NOT EXISTS violations (
+    axiom TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    record_id INTEGER NOT NULL,
+    survival INTEGER,
+    PRIMARY KEY (axiom, timestamp, record_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS violations_record ON violations (record_id);
+CREATE TABLE IF NOT EXISTS strings (
+    segment INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (segment, id)
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = ("id", "segment", "offset", "length", "timestamp", "query_hash", "primary_domain",
+            "survival", "detail_level", "total_violations", "critical_violations")
+
+# Time bounds: epoch seconds or datetimes
+TimeBound = Union[float, int, datetime, None]
+
+
+def query_hash(query: str) -> str:
+    """Index key of a query text (SHA-256 of its UTF-8 bytes, hex)"""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def violated_axioms(result: Dict) -> List[str]:
+    """Distinct axiom names a result violates (none at detail level "verdict")"""
+    store = result.get("structured_output")
+    if store:
+        frictions = store["analysis"]["axiom_mirror"]["frictions"]
+    else:
+        phases = result.get("reasoning_phases")
+        frictions = phases["phase_3_mirror"]["violations"] if phases else ()
+    return list(dict.fromkeys(friction["axiom"] for friction in frictions))
+
+
+class VerdictStoreLockedError(RuntimeError):
+    """Raised when another VerdictStore already writes to the directory"""
+    pass
+
+
+def _lock_directory(directory: str) -> int:
+    """Take the directory's exclusive writer lock -> lock file descriptor"""
+    fd = os.open(os.path.join(directory, LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        raise VerdictStoreLockedError(
+            f"{directory} is already open in another VerdictStore; "
+            f"share that store or close it first"
+        ) from None
+    return fd
+
+
+def _unlock_directory(fd: int):
+    if fcntl is None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    os.close(fd)                    # releases the flock
+
+
+def _epoch(bound: TimeBound) -> Optional[float]:
+    if bound is None:
+        return None
+    if isinstance(bound, datetime):
+        return bound.timestamp()
+    return float(bound)
+
+
+def _survival_filter(verdict: Union[str, bool, None]) -> Optional[int]:
+    if verdict is None:
+        return None
+    if isinstance(verdict, bool):
+        return int(verdict)
+    word = verdict.strip().upper()
+    if word.startswith("FAIL"):
+        return 0
+    if word.startswith("SURVIVE"):
+        return 1
+    raise ValueError(f"Unknown verdict filter: {verdict!r} (use 'FAILS' or 'SURVIVES')")
+
+
+class StoredVerdict:
+    """One index row; load() reads the full result from its segment"""
+
+    __slots__ = ("store",) + _COLUMNS
+
+    def __init__(self, store: "VerdictStore", row: Sequence[Any]):
+        self.store = store
+        for name, value in zip(_COLUMNS, row):
+            setattr(self, name, value)
+
+    @property
+    def verdict(self) -> Optional[str]:
+        if self.survival is None:
+            return None
+        return "SURVIVES The Criterion" if self.survival else "FAILS The Criterion"
+
+    def load(self) -> Dict:
+        """The stored evaluation result"""
+        return self.store.load(self)
+
+    def to_dict(self) -> Dict:
+        entry = {name: getattr(self, name) for name in _COLUMNS}
+        entry["survival"] = None if self.survival is None else bool(self.survival)
+        entry["verdict"] = self.verdict
+        return entry
+
+    def __repr__(self) -> str:
+        return (f"StoredVerdict(id={self.id}, {self.verdict}, "
+                f"domain={self.primary_domain!r}, t={self.timestamp:.3f})")
+
+
+class VerdictStore:
+    """
+    Append-only segment log of evaluation results with a SQLite index.
+    """
+
+    def __init__(self, directory: Optional[str] = None, segment_bytes: int = 64 << 20,
+                 commit_every: int = 100, string_tables: int = 4):
+        """
+        Args:
+            directory: Store directory (default: logs/verdicts/)
+            segment_bytes: Size at which the current segment is closed
+            commit_every: Appends per index commit (flush() commits at once)
+            string_tables: Closed segments' string tables kept in memory for load()
+
+        Raises:
+            VerdictStoreLockedError: Another store has the directory open
+        """
+        self.directory = directory or DEFAULT_STORE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.commit_every = commit_every
+
+        self._lock = threading.RLock()
+        self._segment: Optional[int] = None
+        self._file = None
+        self._writer: Optional[AuditWriter] = None
+        self._offset = 0
+        self._pending = 0
+        self._tables: "OrderedDict[int, List[str]]" = OrderedDict()
+        self._table_limit = string_tables
+
+        self._lock_fd: Optional[int] = _lock_directory(self.directory)
+        try:
+            self._open_index()
+        except BaseException:
+            _unlock_directory(self._lock_fd)
+            self._lock_fd = None
+            raise
+        self._next_segment = max(self.segments(), default=0) + 1
+
+    def _open_index(self):
+        self._db = sqlite3.connect(os.path.join(self.directory, INDEX_FILE),
+                                   check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute("INSERT OR IGNORE INTO meta VALUES ('index_version', ?)",
+                         (str(INDEX_VERSION),))
+        self._db.commit()
+        self._recover()
+
+    # ───────────────────────────────────────────────────────────────────
+    # Writing
+    # ───────────────────────────────────────────────────────────────────
+
+    def append(self, result: Dict, timestamp: Optional[float] = None) -> int:
+        """
+        Append one evaluation result and index it.
+
+        Args:
+            result: CriterionPipeline result (any detail level)
+            timestamp: Evaluation time (default: now)
+
+        Returns:
+            The record's id in the index
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if self._writer is None or self._offset >= self.segment_bytes:
+                self._rotate()
+            writer = self._writer
+            known = len(writer.strings)
+            written = writer.write(result, timestamp)
+            offset = self._offset + RECORD_LENGTH.size
+            self._offset += written
+            first = max(known, len(SEED_STRINGS))
+            record_id = self._index(self._segment, offset, written - RECORD_LENGTH.size,
+                                    writer.last_header, result)
+            self._store_strings(self._segment, first, writer.strings[first:])
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit()
+            return record_id
+
+    def _index(self, segment: int, offset: int, length: int, header: AuditHeader,
+               result: Dict) -> int:
+        """Add the index rows of one record -> record id"""
+        survival = None if header.detail_level is None else int(header.survival)
+        record_id = self._db.execute(
+            "INSERT INTO records (segment, offset, length, timestamp, query_hash, primary_domain,"
+            " survival, detail_level, total_violations, critical_violations)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (segment, offset, length, header.timestamp, query_hash(str(result.get("query") or "")),
+             header.primary_domain, survival, header.detail_level,
+             header.total_violations, header.critical_violations)
+        ).lastrowid
+        axioms = violated_axioms(result)
+        if axioms:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO violations VALUES (?, ?, ?, ?)",
+                [(axiom, header.timestamp, record_id, survival) for axiom in axioms]
+            )
+        return record_id
+
+    def _rotate(self):
+        if self._file is not None:
+            self._commit()
+            self._file.close()
+        while True:
+            segment = self._next_segment
+            self._next_segment += 1
+            try:
+                self._file = open(self._segment_path(segment), "xb")
+            except FileExistsError:
+                continue
+            break
+        self._segment = segment
+        self._writer = AuditWriter(self._file)
+        self._offset = FILE_HEADER.size
+
+    def _commit(self):
+        # Data first: committed index rows must never point past the segment end
+        if self._file is not None:
+            self._file.flush()
+        self._db.commit()
+        self._pending = 0
+
+    def flush(self):
+        """Write buffered records and commit their index rows"""
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        with self._lock:
+            if self._lock_fd is None:
+                return
+            self._commit()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+            self._db.close()
+            _unlock_directory(self._lock_fd)
+            self._lock_fd = None
+
+    def __enter__(self) -> "VerdictStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ───────────────────────────────────────────────────────────────────
+    # Lookup
+    # ───────────────────────────────────────────────────────────────────
+
+    def query(self, verdict: Union[str, bool, None] = None, axiom: Optional[str] = None,
+              domain: Optional[str] = None, query: Optional[str] = None,
+              since: TimeBound = None, until: TimeBound = None,
+              limit: Optional[int] = None, newest_first: bool = True) -> List[StoredVerdict]:
+        """
+        Indexed lookup of stored evaluations (all filters are optional and combined).
+
+        Args:
+            verdict: "FAILS" / "SURVIVES" (or the full verdict string, or survival bool)
+            axiom: Name of a violated axiom, e.g. "Final Court Necessity"
+            domain: Primary domain, e.g. "economic"
+            query: Exact query text (matched by hash)
+            since: Earliest timestamp (epoch seconds or datetime), inclusive
+            until: Latest timestamp, exclusive
+            limit: Maximum number of entries
+            newest_first: Order by timestamp descending (False: ascending)
+
+        Returns:
+            StoredVerdict entries (entry.load() for the full result)
+        """
+        sql, params = self._select("r.*", verdict, axiom, domain, query, since, until)
+        # Order on the driving index's own timestamp so LIMIT stops early
+        time_column = "v.timestamp" if axiom is not None else "r.timestamp"
+        direction = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY {time_column} {direction}, r.id {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [StoredVerdict(self, row) for row in rows]
+
+    def count(self, verdict: Union[str, bool, None] = None, axiom: Optional[str] = None,
+              domain: Optional[str] = None, query: Optional[str] = None,
+              since: TimeBound = None, until: TimeBound = None) -> int:
+        """Number of stored evaluations matching the filters (see query())"""
+        sql, params = self._select("COUNT(*)", verdict, axiom, domain, query, since, until)
+        with self._lock:
+            return self._db.execute(sql, params).fetchone()[0]
+
+    def _select(self, columns: str, verdict, axiom, domain, query,
+                since: TimeBound, until: TimeBound) -> Tuple[str, List[Any]]:
+        survival = _survival_filter(verdict)
+        since, until = _epoch(since), _epoch(until)
+        conditions: List[str] = []
+        params: List[Any] = []
+        if axiom is not None:
+            # Driven by the (axiom, timestamp) key of the violations table
+            sql = (f"SELECT {columns} FROM violations v"
+                   f" JOIN records r ON r.id = v.record_id WHERE v.axiom = ?")
+            params.append(axiom)
+            time_column = "v.timestamp"
+            if survival is not None:
+                conditions.append("v.survival = ?")
+                params.append(survival)
+        else:
+            sql = f"SELECT {columns} FROM records r WHERE 1"
+            time_column = "r.timestamp"
+            if survival is not None:
+                conditions.append("r.survival = ?")
+                params.append(survival)
+        if domain is not None:
+            conditions.append("r.primary_domain = ?")
+            params.append(domain)
+        if query is not None:
+            conditions.append("r.query_hash = ?")
+            params.append(query_hash(query))
+        if since is not None:
+            conditions.append(f"{time_column} >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append(f"{time_column} < ?")
+            params.append(until)
+        for condition in conditions:
+            sql += f" AND {condition}"
+        return sql, params
+
+    def load(self, entry: Union[StoredVerdict, int]) -> Dict:
+        """
+        Read one stored result.
+
+        Args:
+            entry: StoredVerdict or record id
+
+        Raises:
+            KeyError: Unknown record id
+        """
+        with self._lock:
+            if not isinstance(entry, StoredVerdict):
+                row = self._db.execute("SELECT * FROM records WHERE id = ?",
+                                       (entry,)).fetchone()
+                if row is None:
+                    raise KeyError(f"No stored verdict with id {entry}")
+                entry = StoredVerdict(self, row)
+            if entry.segment == self._segment:
+                self._file.flush()
+                strings = self._writer.strings
+            else:
+                strings = self._string_table(entry.segment)
+            with open(self._segment_path(entry.segment), "rb") as f:
+                f.seek(entry.offset)
+                data = f.read(entry.length)
+        return decode_record(data, strings)[1]
+
+    def _string_table(self, segment: int) -> List[str]:
+        table = self._tables.get(segment)
+        if table is not None:
+            self._tables.move_to_end(segment)
+            return table
+        table = list(SEED_STRINGS)
+        table.extend(value for (value,) in self._db.execute(
+            "SELECT value FROM strings WHERE segment = ? ORDER BY id", (segment,)
+        ))
+        self._tables[segment] = table
+        while len(self._tables) > self._table_limit:
+            self._tables.popitem(last=False)
+        return table
+
+    def __len__(self) -> int:
+        return self.count()
+
+    # ───────────────────────────────────────────────────────────────────
+    # Segments and recovery
+    # ───────────────────────────────────────────────────────────────────
+
+    def segments(self) -> List[int]:
+        """Numbers of the segment files on disk, oldest first"""
+        numbers = []
+        for name in os.listdir(self.directory):
+            match = _SEGMENT_NAME.match(name)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.crau")
+
+    def reindex(self):
+        """Rebuild the whole index from the segment files"""
+        with self._lock:
+            self._commit()
+            for table in ("records", "violations", "strings"):
+                self._db.execute(f"DELETE FROM {table}")
+            self._tables.clear()
+            for segment in self.segments():
+                self._reindex_segment(segment)
+            if self._writer is not None:
+                self._store_strings(self._segment, len(SEED_STRINGS),
+                                    self._writer.strings[len(SEED_STRINGS):])
+            self._db.commit()
+
+    def _recover(self):
+        """Match the index to the segments after an unclean shutdown"""
+        indexed = dict(self._db.execute(
+            "SELECT segment, MAX(offset + length) FROM records GROUP BY segment"
+        ).fetchall())
+        on_disk = self.segments()
+        for segment, end in indexed.items():
+            path = self._segment_path(segment)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if end > size:
+                # Rows committed before their data reached the file
+                self._db.execute(
+                    "DELETE FROM violations WHERE record_id IN"
+                    " (SELECT id FROM records WHERE segment = ? AND offset + length > ?)",
+                    (segment, size)
+                )
+                self._db.execute("DELETE FROM records WHERE segment = ? AND offset + length > ?",
+                                 (segment, size))
+        for segment in on_disk:
+            # Records written after the last index commit
+            end = indexed.get(segment, 0)
+            if os.path.getsize(self._segment_path(segment)) > max(end, FILE_HEADER.size):
+                self._reindex_segment(segment, end)
+        self._db.commit()
+
+    def _reindex_segment(self, segment: int, indexed_end: int = 0):
+        """Index a segment's records past indexed_end (stops at a truncated tail)"""
+        with open(self._segment_path(segment), "rb") as f:
+            try:
+                reader = AuditReader(f)
+            except AuditFormatError:
+                return
+            offset = FILE_HEADER.size
+            records = iter(reader)
+            while True:
+                try:
+                    header, result = next(records)
+                except (StopIteration, AuditFormatError):
+                    break
+                end = f.tell()
+                if end > indexed_end:
+                    self._index(segment, offset + RECORD_LENGTH.size,
+                                end - offset - RECORD_LENGTH.size, header, result)
+                offset = end
+            self._store_strings(segment, len(SEED_STRINGS), reader.strings[len(SEED_STRINGS):])
+
+    def _store_strings(self, segment: int, first: int, strings: Sequence[str]):
+        if strings:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO strings VALUES (?, ?, ?)",
+                [(segment, first + i, value) for i, value in enumerate(strings)]
+            )
+
+
+def self_check() -> List[str]:
+    """
+    Exercise the store's single-writer and segment guarantees in a temporary
+    directory.
+
+    Returns:
+        Failure messages (empty when every check passes)
+    """
+    from evaluation.pipeline import CriterionPipeline
+
+    pipeline = CriterionPipeline()
+    results = [pipeline.evaluate(query, {}, detail_level=level) for query, level in (
+        ("Replace the courts with an AI arbiter whose rulings are final", "full"),
+        ("Implement universal basic income funded by a wealth tax", "summary"),
+        ("Privatize water utilities", "verdict"),
+    )]
+    failures: List[str] = []
+    directory = tempfile.mkdtemp(prefix="verdict-store-check-")
+    try:
+        with VerdictStore(directory) as store:
+            first = store.append(results[0])
+            store.flush()
+            try:
+                VerdictStore(directory).close()
+                failures.append("a second store opened a directory that is in use")
+            except VerdictStoreLockedError:
+                pass
+            if store.load(first)["query"] != results[0]["query"]:
+                failures.append("a record changed while a second store was refused")
+
+        # A segment file that already exists is skipped, never truncated
+        with VerdictStore(directory) as store:
+            stray = store._segment_path(max(store.segments()) + 1)
+            with open(stray, "wb") as f:
+                f.write(b"not a segment")
+            second = store.append(results[1])
+        with open(stray, "rb") as f:
+            if f.read() != b"not a segment":
+                failures.append("an existing segment file was overwritten")
+
+        with VerdictStore(directory) as store:
+            third = store.append(results[2])
+            for record_id, result in zip((first, second, third), results):
+                if store.load(record_id)["query"] != result["query"]:
+                    failures.append(f"record {record_id} does not load after reopening")
+            if len(store) != len(results):
+                failures.append(f"{len(store)} records indexed, expected {len(results)}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m evaluation.verdict_store",
+        description="Check the verdict store"
+    )
+    parser.add_argument("command", choices=("check",))
+    parser.parse_args(argv)
+
+    failures = self_check()
+    for message in failures:
+        print(message)
+    print(f"Verdict store check: {len(failures)} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
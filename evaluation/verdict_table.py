@@ -0,0 +1,365 @@
+"""
+Verdict Table: precomputed MIRROR, GATES and CONSEQUENCES for every flag combination
+
+Apart from the SCAN domain (read from the query text), retrieved evidence and
+templated rule parameters (e.g. deviation_domain), a verdict only depends on
+the truthiness of the flags read by the compiled MIRROR rules and the gate
+functions: 12 flags with the default axioms, so 4096 combinations per domain.
+
+VerdictTable indexes those combinations by a packed integer
+
+    index = domain_id << len(flags) | flag_bits
+
+and stores in each slot the (MirrorResult, GateResult, ConsequenceSet) the
+regular phases compute. Equal results are shared between slots, so a full
+table is a few hundred result objects plus one tuple per slot. Slots are
+filled on first lookup, or all at once with build(). A built table can be
+saved as an artifact stamped with the axiom fingerprint and loaded at startup.
+
+Profiles the table can't answer (truthy retrieved_evidence, or a templated
+rule parameter present) go through the regular phases. The table doubles in
+size with every flag, so an axiom set reading more than MAX_FLAGS flags gets
+no table (VerdictTableError; the engine then warns and keeps the regular
+phases).
+
+Results served from the table are shared: treat them as read-only.
+
+Usage:
+    engine = CriterionReasoningEngine(verdict_table=True)    # filled lazily
+    engine.enable_verdict_table("cache/verdicts.crvt")       # load, or build + save
+    engine.verdict_table.verify()                            # [] when consistent
+
+    python -m evaluation.verdict_table build cache/verdicts.crvt --verify
+    python -m evaluation.verdict_table verify cache/verdicts.crvt
+"""
+
+import argparse
+import json
+import random
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from evaluation.gates import GATE_FLAGS
+from evaluation.instrumentation import instrumented
+from evaluation.results import ConsequenceSet, GateResult, MirrorResult
+
+
+MAGIC = b"CRVT"
+FORMAT_VERSION = 2
+
+# Largest flag count a table is built for (7 domains << 16 flags = 458752 slots)
+MAX_FLAGS = 16
+
+Slot = Tuple[MirrorResult, GateResult, ConsequenceSet]
+
+
+class VerdictTableError(ValueError):
+    """Raised for unusable verdict table artifacts or failed verification"""
+
+
+class VerdictTable:
+    """
+    Exhaustive lookup table of phase results for one engine.
+    """
+
+    def __init__(self, engine):
+        """
+        Args:
+            engine: CriterionReasoningEngine whose rules and gates fill the table
+
+        Raises:
+            VerdictTableError: The engine reads more than MAX_FLAGS flags
+        """
+        self.engine = engine
+        self.axioms_fingerprint = engine.axioms_fingerprint
+        self.flags = tuple(dict.fromkeys(engine.mirror.flags + GATE_FLAGS))
+        if len(self.flags) > MAX_FLAGS:
+            raise VerdictTableError(
+                f"{len(self.flags)} flags would need {2 ** len(self.flags)} slots per domain "
+                f"(limit: {MAX_FLAGS} flags)"
+            )
+        self.domains = tuple(domain.value for domain in engine.domain_type)
+        self.size = len(self.domains) << len(self.flags)
+
+        self._width = len(self.flags)
+        self._mask = (1 << self._width) - 1
+        self._flag_bits = tuple((flag, 1 << i) for i, flag in enumerate(self.flags))
+        self._domain_ids = {domain: i for i, domain in enumerate(self.domains)}
+        self._parameters = engine.mirror.parameters
+
+        self._slots: List[Optional[Slot]] = [None] * self.size
+        self._mirrors: Dict[Tuple[int, int], MirrorResult] = {}
+        self._gates: Dict[Tuple[int, ...], GateResult] = {}
+        self._consequences: Dict[Tuple[int, int, str], ConsequenceSet] = {}
+
+    # ───────────────────────────────────────────────────────────────────
+    # Lookup
+    # ───────────────────────────────────────────────────────────────────
+
+    def covers(self, system_data: Dict) -> bool:
+        """True if the table can answer for this profile"""
+        if not isinstance(system_data, dict):
+            return False
+        if system_data.get("retrieved_evidence"):
+            return False
+        return not any(key in system_data for key in self._parameters)
+
+    def pack(self, system_data: Dict) -> int:
+        """Flag bits of a profile"""
+        bits = 0
+        for flag, bit in self._flag_bits:
+            if system_data.get(flag):
+                bits |= bit
+        return bits
+
+    @instrumented("VERDICT_TABLE")
+    def lookup(self, system_data: Dict, system_type: str) -> Slot:
+        """
+        Phase results for a covered profile in a SCAN domain.
+
+        Returns:
+            (MirrorResult, GateResult, ConsequenceSet)
+        """
+        index = self._domain_ids[system_type] << self._width | self.pack(system_data)
+        slot = self._slots[index]
+        if slot is None:
+            slot = self._slots[index] = self._compute(index)
+        return slot
+
+    def profile(self, index: int) -> Tuple[str, Dict]:
+        """(domain, system_data) a slot stands for"""
+        bits = index & self._mask
+        data = {flag: True for flag, bit in self._flag_bits if bits & bit}
+        return self.domains[index >> self._width], data
+
+    # ───────────────────────────────────────────────────────────────────
+    # Filling
+    # ───────────────────────────────────────────────────────────────────
+
+    def _compute(self, index: int) -> Slot:
+        domain, data = self.profile(index)
+        key = self._mirror_for(data, domain)
+        return self._mirrors[key], self._gate_for(data), self._consequences_for(key, domain)
+
+    def _mirror_for(self, data: Dict, domain: str) -> Tuple[int, int]:
+        mirror = self.engine.mirror
+        key = (mirror.applicable_mask(domain), mirror.violation_mask(data, domain))
+        if key not in self._mirrors:
+            self._mirrors[key] = mirror.evaluate_result(data, domain)
+        return key
+
+    def _gate_for(self, data: Dict) -> GateResult:
+        gates = self.engine._gate_result(data)
+        return self._gates.setdefault(gates.scores, gates)
+
+    def _consequences_for(self, key: Tuple[int, int], domain: str) -> ConsequenceSet:
+        consequence_key = key + (domain,)
+        consequences = self._consequences.get(consequence_key)
+        if consequences is None:
+            consequences = self._consequences[consequence_key] = ConsequenceSet(
+                self._mirrors[key].frictions, domain, self.engine
+            )
+        return consequences
+
+    def build(self) -> "VerdictTable":
+        """Fill every slot (returns self)"""
+        for index in range(self.size):
+            if self._slots[index] is None:
+                self._slots[index] = self._compute(index)
+        return self
+
+    @property
+    def filled(self) -> int:
+        """Number of computed slots"""
+        return self.size - self._slots.count(None)
+
+    # ───────────────────────────────────────────────────────────────────
+    # Verification
+    # ───────────────────────────────────────────────────────────────────
+
+    def verify(self, sample: Optional[int] = None, seed: int = 0) -> List[str]:
+        """
+        Compare table slots against the engine's regular phases.
+
+        Args:
+            sample: Number of random slots to check (default: every slot)
+            seed: Random seed for the sample
+
+        Returns:
+            One message per mismatching slot (empty when consistent)
+        """
+        indices: Sequence[int] = range(self.size)
+        if sample is not None and sample < self.size:
+            indices = random.Random(seed).sample(range(self.size), sample)
+
+        engine = self.engine
+        mismatches = []
+        for index in indices:
+            domain, data = self.profile(index)
+            slot = self._slots[index] or self._compute(index)
+            axiom_mirror = engine.mirror_against_axioms(data, domain)
+            expected = (
+                axiom_mirror,
+                engine.apply_gates(data),
+                engine.deduce_consequences(axiom_mirror["frictions"], domain, data)
+            )
+            for phase, result, slow in zip(("MIRROR", "GATES", "CONSEQUENCES"), slot, expected):
+                if result.to_dict() != slow:
+                    mismatches.append(f"{phase} differs for domain={domain} flags={sorted(data)}")
+        return mismatches
+
+    # ───────────────────────────────────────────────────────────────────
+    # Artifact
+    # ───────────────────────────────────────────────────────────────────
+
+    def save(self, path: str):
+        """
+        Build the table and write it as an artifact.
+
+        Layout: MAGIC, header length (uint32), JSON header, then two arrays
+        (little-endian, uint16 or uint32 as the header's "id_type" says)
+        with the MIRROR and GATES result id of every slot. Each distinct
+        result is stored as a representative slot index and recomputed on
+        load.
+        """
+        self.build()
+        mirror_ids: Dict[int, int] = {}
+        gate_ids: Dict[int, int] = {}
+        mirror_reps: List[int] = []
+        gate_reps: List[int] = []
+        mirror_column: List[int] = []
+        gate_column: List[int] = []
+        for index, (axiom_mirror, gates, _) in enumerate(self._slots):
+            for result, ids, reps, column in (
+                (axiom_mirror, mirror_ids, mirror_reps, mirror_column),
+                (gates, gate_ids, gate_reps, gate_column),
+            ):
+                result_id = ids.get(id(result))
+                if result_id is None:
+                    result_id = ids[id(result)] = len(reps)
+                    reps.append(index)
+                column.append(result_id)
+
+        # uint16 ids unless there are more distinct results than they can number
+        id_type = "H" if max(len(mirror_reps), len(gate_reps)) <= 0x10000 else "I"
+        mirror_column = array(id_type, mirror_column)
+        gate_column = array(id_type, gate_column)
+        header = json.dumps({
+            "version": FORMAT_VERSION,
+            "axioms_fingerprint": self.axioms_fingerprint,
+            "flags": list(self.flags),
+            "domains": list(self.domains),
+            "id_type": id_type,
+            "mirror_representatives": mirror_reps,
+            "gate_representatives": gate_reps
+        }).encode("utf-8")
+
+        if sys.byteorder != "little":
+            mirror_column.byteswap()
+            gate_column.byteswap()
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(mirror_column.tobytes())
+            f.write(gate_column.tobytes())
+
+    @classmethod
+    def load(cls, path: str, engine) -> "VerdictTable":
+        """
+        Load an artifact written by save() for this engine.
+
+        Raises:
+            VerdictTableError: Not an artifact, corrupt, or built for other axioms/flags
+        """
+        with open(path, "rb") as f:
+            blob = f.read()
+        if blob[:4] != MAGIC or len(blob) < 8:
+            raise VerdictTableError(f"{path} is not a verdict table artifact")
+        try:
+            return cls._decode(path, blob, engine)
+        except VerdictTableError:
+            raise
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError, struct.error) as e:
+            raise VerdictTableError(f"{path} is corrupt: {e!r}") from e
+
+    @classmethod
+    def _decode(cls, path: str, blob: bytes, engine) -> "VerdictTable":
+        """load() after the magic check (raw decoding errors propagate)"""
+        (header_length,) = struct.unpack_from("<I", blob, 4)
+        header = json.loads(blob[8:8 + header_length].decode("utf-8"))
+
+        table = cls(engine)
+        if header.get("version") != FORMAT_VERSION:
+            raise VerdictTableError(f"{path} has format version {header.get('version')}")
+        if header["axioms_fingerprint"] != table.axioms_fingerprint:
+            raise VerdictTableError(f"{path} was built for a different axiom set")
+        if tuple(header["flags"]) != table.flags or tuple(header["domains"]) != table.domains:
+            raise VerdictTableError(f"{path} was built for different flags or domains")
+
+        id_type = header["id_type"]
+        if id_type not in ("H", "I"):
+            raise VerdictTableError(f"{path} has unknown id type {id_type!r}")
+        offset = 8 + header_length
+        width = array(id_type).itemsize * table.size
+        mirror_column = array(id_type, blob[offset:offset + width])
+        gate_column = array(id_type, blob[offset + width:offset + 2 * width])
+        if len(gate_column) != table.size:
+            raise VerdictTableError(f"{path} is truncated")
+        if sys.byteorder != "little":
+            mirror_column.byteswap()
+            gate_column.byteswap()
+
+        mirror_keys = []
+        for index in header["mirror_representatives"]:
+            domain, data = table.profile(index)
+            mirror_keys.append(table._mirror_for(data, domain))
+        gates = [table._gate_for(table.profile(index)[1]) for index in header["gate_representatives"]]
+
+        for index in range(table.size):
+            key = mirror_keys[mirror_column[index]]
+            domain = table.domains[index >> table._width]
+            table._slots[index] = (
+                table._mirrors[key],
+                gates[gate_column[index]],
+                table._consequences_for(key, domain)
+            )
+        return table
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from evaluation.reasoning_engine import CriterionReasoningEngine
+
+    parser = argparse.ArgumentParser(
+        prog="python -m evaluation.verdict_table",
+        description="Build or verify a precomputed verdict table artifact"
+    )
+    parser.add_argument("command", choices=("build", "verify"))
+    parser.add_argument("path", help="Artifact file")
+    parser.add_argument("--axioms", default=None, help="Path to an axioms JSON file")
+    parser.add_argument("--verify", action="store_true",
+                        help="After build, check every slot against the regular phases")
+    args = parser.parse_args(argv)
+
+    engine = CriterionReasoningEngine(args.axioms)
+    if args.command == "build":
+        table = VerdictTable(engine)
+        table.save(args.path)
+        print(f"Built {table.size} slots ({len(table._mirrors)} MIRROR, "
+              f"{len(table._gates)} GATES results) -> {args.path}")
+    else:
+        table = VerdictTable.load(args.path, engine)
+
+    if args.command == "verify" or args.verify:
+        mismatches = table.verify()
+        for message in mismatches[:20]:
+            print(message)
+        print(f"Verified {table.size} slots: {len(mismatches)} mismatches")
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,7 @@ Then start Ollama:
 
 from evaluation.llm_integration import OllamaLLMBridge, analyze_with_deepseek
 from evaluation.pipeline import CriterionPipeline
+from evaluation.pipelined_batch import PipelinedBatch
 import json
 
 
@@ -188,7 +189,9 @@ def example_3_direct_bridge_usage():
 def example_4_batch_analysis():
     """
     Example 4: Batch analysis of multiple proposals
-    Shows how to analyze multiple queries in sequence
+    Shows how to analyze multiple queries with extraction and evaluation
+    overlapped (PipelinedBatch keeps several extractions in flight while the
+    engine evaluates the finished ones)
     """
     print("\n" + "="*80)
     print("EXAMPLE 4: Batch Analysis")
@@ -200,32 +203,36 @@ def example_4_batch_analysis():
         "Should social media platforms be allowed to use any algorithm without oversight?"
     ]
     
-    results = []
+    results = [None] * len(queries)
     
     try:
         bridge = OllamaLLMBridge()
         pipeline = CriterionPipeline()
+        batch = PipelinedBatch(bridge, pipeline, extractors=3, queue_size=4)
         
-        for i, query in enumerate(queries, 1):
-            print(f"\n[{i}/{len(queries)}] Analyzing...")
-            print(f"Query: {query[:60]}...")
-            
-            # Extract semantic meaning
-            system_data = bridge.extract_semantic_meaning(query)
-            
-            # Run reasoning
-            result = pipeline.evaluate(query, system_data)
+        print(f"\nAnalyzing {len(queries)} queries (3 extractions in flight)...")
+        
+        # Items arrive as their extraction finishes, not in input order
+        for done, item in enumerate(batch.stream(queries), 1):
+            print(f"\n[{done}/{len(queries)}] Query: {item.query[:60]}...")
+            if not item.ok:
+                print(f"   → failed: {item.error}")
+                continue
+            result = item.result
             
             # Store result
-            results.append({
-                'query': query,
+            results[item.index] = {
+                'query': item.query,
                 'verdict': result['phase_6_verdict']['final_judgment'],
                 'violations': len(result['reasoning_phases']['phase_3_mirror']['violations'])
-            })
+            }
             
             print(f"   → {result['phase_6_verdict']['final_judgment']}")
             print(f"   → {result['reasoning_phases']['phase_3_mirror']['total_violations']} violations")
         
+        results = [r for r in results if r is not None]
+        print(f"\n⏱️  Pipeline stages:\n{batch.stats.report()}")
+        
         # Summary
         print("\n" + "="*80)
         print("BATCH SUMMARY")
@@ -16,6 +16,7 @@ Usage pattern:
 """
 
 from evaluation.pipeline import CriterionPipeline
+from evaluation.registry import get_pipeline
 from typing import Dict, Tuple
 
 
@@ -29,8 +30,11 @@ class LLMCriterionIntegration:
     3. Returning structured CoT scaffold for LLM to follow
     """
     
-    def __init__(self):
-        self.pipeline = CriterionPipeline()
+    @property
+    def pipeline(self) -> CriterionPipeline:
+        # Shared engine, picked up again on every call so edits to the
+        # axioms file take effect without restarting
+        return get_pipeline()
     
     def process_llm_query(self, query: str, 
                          llm_extracted_system: Dict) -> Tuple[Dict, str]:
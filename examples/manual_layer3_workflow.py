@@ -45,7 +45,28 @@ def phase_3_criterion_retrieval(builder: VectorDBBuilder, query: str):
     print("\nPHASE 3: Criterion retrieval & testing\n")
     print(f"Querying knowledge-packages for: {query}\n")
 
-    hits = builder.query(query, collection_name='sharia_knowledge', k=6)
+    # create a minimal system_data indicating no obvious axiom-violations (for demo)
+    system_data = {
+        'permits_exploitative_gain': False,
+        'acknowledges_transcendent_source': False,
+        'enables_accountability': True,
+        'causes_harm_amplification': False,
+        'destabilizes_lineage': False
+    }
+
+    # Retrieval and the Criterion keyword phases are independent: run them as
+    # one stage DAG so the Chroma query overlaps SCAN/GATES
+    hits = {}
+
+    def retrieve(q):
+        hits.update(builder.query(q, collection_name='sharia_knowledge', k=6))
+        # attach top-3 hit objects (metadata includes `knowledge_package`) so the pipeline
+        # can boost Source-Integrity using `source_integrity_score` where available
+        return {'hits': hits['results'][:3]}
+
+    pipeline = CriterionPipeline()
+    run = pipeline.evaluate_stages(query, system_data, retriever=retrieve)
+
     for i, h in enumerate(hits['results']):
         kp = h['metadata'].get('knowledge_package', {})
         print(f"[{i+1}] distance={h['distance']:.4f} source={h['metadata'].get('source_file')}")
@@ -57,29 +78,15 @@ def phase_3_criterion_retrieval(builder: VectorDBBuilder, query: str):
         print(f"    snippet: {snippet}...")
         print('-' * 60)
 
-    # Show how to surface top evidence into Criterion reasoning (manual integration)
-    # attach top-3 hit objects (metadata includes `knowledge_package`) so the pipeline
-    # can boost Source-Integrity using `source_integrity_score` where available
-    top_hits = hits['results'][:3]
-
-    print('\n--- Example: using retrieved evidence inside the Criterion pipeline (manual) ---')
-    pipeline = CriterionPipeline()
-    sample_query = query
-
-    # create a minimal system_data indicating no obvious axiom-violations (for demo)
-    system_data = {
-        'permits_exploitative_gain': False,
-        'acknowledges_transcendent_source': False,
-        'enables_accountability': True,
-        'causes_harm_amplification': False,
-        'destabilizes_lineage': False
-    }
-
-    # attach retrieved evidence (full hit objects) so gates can inspect `knowledge_package` metadata
-    system_data['retrieved_evidence'] = {'hits': top_hits}
-
-    print('\nRunning Criterion reasoning engine with attached evidence (for transparency)')
-    result = pipeline.evaluate(sample_query, system_data)
+    # Show how top evidence surfaced into Criterion reasoning: the retrieved
+    # evidence (full hit objects) was attached as system_data['retrieved_evidence']
+    # so gates can inspect `knowledge_package` metadata
+    print('\n--- Example: using retrieved evidence inside the Criterion pipeline ---')
+    print('\nCriterion reasoning engine ran with attached evidence (for transparency)')
+    result = run['result'].to_dict()
+    print('Stage timings (ms): ' + ', '.join(
+        f"{stage}={seconds * 1000:.1f}" for stage, seconds in run.stage_seconds().items()
+    ))
     print('\nPhase 3 verdict summary:')
     print(json.dumps(result['phase_6_verdict'], indent=2))
     return result